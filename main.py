@@ -1,20 +1,23 @@
-import subprocess
 import os
+import sys
 
 if __name__ == "__main__":
     # Chemin vers le script app.py de Streamlit
     streamlit_app_path = os.path.join(os.path.dirname(__file__), "ui", "app.py")
 
-    # Commande pour lancer Streamlit
-    command = ["streamlit", "run", streamlit_app_path]
+    try:
+        # Lancement de Streamlit dans le processus courant (évite un sous-processus supplémentaire)
+        from streamlit.web import cli as stcli
+    except ImportError:
+        print("Erreur : Streamlit n'a pas été trouvé. Assurez-vous que Streamlit est installé (pip install -r requirements.txt).")
+        sys.exit(1)
 
     try:
         print(f"Lancement de l'application Streamlit depuis : {streamlit_app_path}")
-        # Exécution de la commande
-        subprocess.run(command, check=True)
-    except FileNotFoundError:
-        print("Erreur : La commande 'streamlit' n'a pas été trouvée. Assurez-vous que Streamlit est installé et dans votre PATH.")
-    except subprocess.CalledProcessError as e:
-        print(f"Erreur lors du lancement de l'application Streamlit : {e}")
+        # Équivalent de la commande : streamlit run ui/app.py
+        sys.argv = ["streamlit", "run", streamlit_app_path]
+        sys.exit(stcli.main())
+    except SystemExit:
+        raise
     except Exception as e:
         print(f"Une erreur inattendue s'est produite : {e}")
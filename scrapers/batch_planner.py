@@ -0,0 +1,168 @@
+import argparse
+import copy
+import glob
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.pcpartpicker import (
+    PCPartPickerScraper,
+    assemble_configuration,
+    create_config_from_game_requirements,
+    normalize_search_term,
+)
+from scrapers.static_catalog import catalog_key, catalog_query, lookup
+from utils.debug_color import debug_print
+
+class BatchPlan:
+    """Plan de génération de plusieurs configurations partageant leurs recherches de composants"""
+
+    def __init__(self, include_alternatives=False):
+        self.include_alternatives = include_alternatives
+        self.entries = []  # Une entrée par configuration à produire
+        self.lookups = {}  # Terme canonique -> terme de recherche original (premier rencontré)
+
+    def add_game(self, json_path, use_recommended=True):
+        """
+        Ajoute les spécifications d'un jeu au plan
+
+        Args:
+            json_path (str): Chemin du fichier JSON des spécifications du jeu
+            use_recommended (bool): Si True, utilise les spécifications recommandées
+        """
+        primary_components, alternative_components, game_name, game_uuid = create_config_from_game_requirements(
+            json_path, use_recommended)
+
+        self.entries.append({
+            "json_path": json_path,
+            "use_recommended": use_recommended,
+            "game_name": game_name,
+            "game_uuid": game_uuid,
+            "primary_components": primary_components,
+            "alternative_components": alternative_components,
+        })
+
+        search_terms = []
+        for category, term in primary_components.items():
+            # OS, RAM et stockage : rien à chercher si le catalogue statique les connaît déjà
+            key = catalog_key(category, term)
+            if key is None:
+                search_terms.append(term)
+            elif lookup(category, term) is None:
+                search_terms.append(catalog_query(key))
+        if self.include_alternatives:
+            search_terms += [term for terms in alternative_components.values() for term in terms]
+        for term in search_terms:
+            self.lookups.setdefault(normalize_search_term(term), term)
+
+    def total_lookups(self):
+        """Nombre de recherches qu'effectuerait une génération jeu par jeu"""
+        total = 0
+        for entry in self.entries:
+            total += len(entry["primary_components"])
+            if self.include_alternatives:
+                total += sum(len(terms) for terms in entry["alternative_components"].values())
+        return total
+
+def plan_batch(json_paths, use_recommended=True, include_alternatives=False, both_profiles=False):
+    """
+    Lit les spécifications de tous les jeux et calcule l'ensemble des recherches distinctes
+
+    Args:
+        json_paths (list): Fichiers JSON des jeux (data/instantgaming)
+        use_recommended (bool): Si True, utilise les spécifications recommandées
+        include_alternatives (bool): Si True, inclut les composants alternatifs
+        both_profiles (bool): Si True, planifie les configurations minimale puis recommandée de
+            chaque jeu (use_recommended est alors ignoré)
+
+    Returns:
+        BatchPlan: Le plan de génération
+    """
+    profiles = [False, True] if both_profiles else [use_recommended]
+    plan = BatchPlan(include_alternatives=include_alternatives)
+    for json_path in json_paths:
+        for profile in profiles:
+            plan.add_game(json_path, profile)
+
+    debug_print(
+        f"{len(plan.entries)} configurations, {len(plan.lookups)} recherches distinctes "
+        f"(au lieu de {plan.total_lookups()})",
+        level="info"
+    )
+    return plan
+
+def resolve_lookups(scraper, lookups):
+    """
+    Résout chaque recherche distincte une seule fois
+
+    Args:
+        scraper (PCPartPickerScraper): Scraper utilisé pour les recherches
+        lookups (dict): Terme canonique -> terme de recherche
+
+    Returns:
+        dict: Terme canonique -> composant (dict) ou None si aucun résultat
+    """
+    resolved = {}
+    for i, (key, search_term) in enumerate(lookups.items(), 1):
+        debug_print(f"[{i}/{len(lookups)}] Recherche partagée: {search_term}", level="fetch")
+        resolved[key] = scraper.resolve_component(search_term)
+    return resolved
+
+def run_batch(plan, scraper=None, headless=True, known=None):
+    """
+    Exécute un plan : résout les recherches distinctes puis assemble chaque configuration
+
+    Args:
+        plan (BatchPlan): Plan construit par plan_batch
+        scraper (PCPartPickerScraper): Scraper existant à réutiliser (un nouveau est créé sinon)
+        headless (bool): Lance Chrome sans interface si un scraper est créé
+        known (dict): Terme canonique -> composant déjà résolu (ex: configuration précédente),
+            non recherché à nouveau
+
+    Returns:
+        list: Les PCConfiguration, dans l'ordre des jeux du plan
+    """
+    resolved = dict(known or {})
+    pending = {key: term for key, term in plan.lookups.items() if key not in resolved}
+
+    own_scraper = scraper is None
+    if own_scraper:
+        scraper = PCPartPickerScraper(headless=headless)
+
+    try:
+        resolved.update(resolve_lookups(scraper, pending))
+    finally:
+        if own_scraper:
+            scraper.close()
+
+    # Chaque configuration reçoit sa propre copie du composant partagé
+    def resolve(search_term):
+        component = resolved.get(normalize_search_term(search_term))
+        return copy.deepcopy(component) if component else None
+
+    return [
+        assemble_configuration(
+            entry["game_name"], entry["game_uuid"], entry["use_recommended"],
+            entry["primary_components"], entry["alternative_components"],
+            resolve, include_alternatives=plan.include_alternatives
+        )
+        for entry in plan.entries
+    ]
+
+if __name__ == "__main__":
+    from scrapers.pipeline import DATA_DIR, configuration_path
+
+    parser = argparse.ArgumentParser(description="Génère les configurations de plusieurs jeux en mutualisant les recherches")
+    parser.add_argument("json_paths", nargs="*", help="Fichiers de spécifications (par défaut: tout data/instantgaming)")
+    parser.add_argument("--type", choices=["min", "rec", "both"], default="rec")
+    parser.add_argument("--alternatives", action="store_true")
+    parser.add_argument("--show-browser", action="store_true")
+    args = parser.parse_args()
+
+    json_paths = args.json_paths or sorted(glob.glob(os.path.join(DATA_DIR, "instantgaming", "*.json")))
+    # "both" : configurations minimale et recommandée de chaque jeu, recherches communes mutualisées
+    plan = plan_batch(json_paths, args.type == "rec", args.alternatives, both_profiles=args.type == "both")
+    configs = run_batch(plan, headless=not args.show_browser)
+
+    for entry, config in zip(plan.entries, configs):
+        config.save_to_json(configuration_path(entry["game_name"], entry["use_recommended"], args.alternatives, config.game_uuid))
@@ -0,0 +1,508 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+import atexit
+import contextlib
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import weakref
+
+import psutil
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.atomic_io import atomic_write_json, file_lock
+from scrapers.network_capture import enable_performance_logging
+
+# Nombre de navigations après lequel le navigateur est redémarré
+MAX_NAVIGATIONS = int(os.environ.get("GAMECONFIG_BROWSER_MAX_NAVIGATIONS", 50))
+
+# Mémoire maximale (Mo) de l'arbre de processus Chrome avant redémarrage
+MAX_RSS_MB = int(os.environ.get("GAMECONFIG_BROWSER_MAX_RSS_MB", 1500))
+
+# Intervalle (secondes) entre deux passages du nettoyeur de processus orphelins
+REAPER_INTERVAL = 60
+
+# Intervalle (secondes) entre deux relevés de consommation de l'arbre de processus Chrome (0 : relevé à la fermeture seulement)
+USAGE_SAMPLE_INTERVAL = float(os.environ.get("GAMECONFIG_BROWSER_SAMPLE_INTERVAL", 1.0))
+
+# Dossier des profils Chrome persistants (cookies de consentement conservés entre les lancements).
+# Une valeur vide désactive les profils : chaque navigateur démarre alors avec un profil vierge.
+PROFILE_ROOT = os.environ.get(
+    "GAMECONFIG_CHROME_PROFILE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "chrome_profiles")
+)
+
+# Fichier, dans le profil, listant les sites dont le bandeau de cookies a déjà été traité
+CONSENT_FILE = "gameconfig_consent.json"
+
+# Machine courante : un PID n'a de sens que sur la machine qui l'a attribué
+HOSTNAME = socket.gethostname()
+
+# Registre des chromedrivers lancés par ManagedBrowser, avec le processus Python qui les possède :
+# seuls ceux dont le propriétaire est mort sont considérés comme orphelins. Un fichier par machine,
+# data/ pouvant être partagé entre les machines des workers.
+REGISTRY_PATH = os.environ.get(
+    "GAMECONFIG_BROWSER_REGISTRY",
+    os.path.join(
+        PROFILE_ROOT or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "chrome_profiles"),
+        f"drivers-{HOSTNAME}.json"
+    )
+)
+
+_live_browsers = weakref.WeakSet()
+_reaper_thread = None
+_reaper_lock = threading.Lock()
+
+class ManagedBrowser:
+    """Possède un WebDriver Chrome : création, recyclage et fermeture garantie"""
+
+    def __init__(self, headless=False, arguments=(), max_navigations=MAX_NAVIGATIONS, max_rss_mb=MAX_RSS_MB,
+                 profile=None, network_capture=False):
+        """
+        Args:
+            headless (bool): Lance Chrome sans interface
+            arguments (iterable): Arguments supplémentaires passés à Chrome
+            max_navigations (int): Navigations avant recyclage du navigateur
+            max_rss_mb (int): Mémoire de l'arbre de processus Chrome avant recyclage
+            profile (str): Nom du profil persistant (dans PROFILE_ROOT), None pour un profil vierge
+            network_capture (bool): Active le journal des événements réseau (voir scrapers/network_capture.py)
+        """
+        self.headless = headless
+        self.arguments = list(arguments)
+        self.max_navigations = max_navigations
+        self.max_rss_mb = max_rss_mb
+        self.network_capture = network_capture
+        self.navigations = 0
+        self.total_navigations = 0
+        self.profile_dir = os.path.join(PROFILE_ROOT, profile) if profile and PROFILE_ROOT else None
+        self.consents = set()
+        self._driver = None
+        self._profile_lock = None
+        # Consommation cumulée sur toute la session, redémarrages compris
+        self._usage_lock = threading.Lock()
+        self._cpu_by_pid = {}
+        self._peak_rss = 0
+        self._peak_processes = 0
+        self._running_seconds = 0.0
+        self._started_at = None
+        self._sampler_stop = None
+        self._registered_pids = frozenset()
+        _live_browsers.add(self)
+        start_reaper()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.quit()
+        return False
+
+    def _build_options(self):
+        chrome_options = Options()
+        if self.headless:
+            chrome_options.add_argument("--headless")
+        for argument in self.arguments:
+            chrome_options.add_argument(argument)
+        if self._profile_lock is not None:
+            chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+        if self.network_capture:
+            enable_performance_logging(chrome_options)
+        return chrome_options
+
+    def _acquire_profile(self):
+        """
+        Réserve le profil persistant pour ce navigateur
+
+        Chrome refuse deux instances sur le même profil : si une autre session l'utilise
+        déjà, ce navigateur démarre avec un profil vierge.
+        """
+        if self.profile_dir is None:
+            return False
+        lock = contextlib.ExitStack()
+        try:
+            lock.enter_context(file_lock(self.profile_dir, blocking=False))
+        except BlockingIOError:
+            debug_print(f"Profil {self.profile_dir} déjà utilisé, démarrage avec un profil vierge", level="info")
+            return False
+        self._profile_lock = lock
+        return True
+
+    def _release_profile(self):
+        if self._profile_lock is not None:
+            self._profile_lock.close()
+            self._profile_lock = None
+
+    def _consent_path(self):
+        return os.path.join(self.profile_dir, CONSENT_FILE)
+
+    def start(self):
+        """Démarre le navigateur s'il ne l'est pas déjà"""
+        if self._driver is None:
+            # Sans profil persistant, les cookies de consentement disparaissent avec le navigateur
+            self.consents = set()
+            if self._acquire_profile():
+                try:
+                    with open(self._consent_path(), "r", encoding="utf-8") as f:
+                        self.consents = set(json.load(f))
+                except (OSError, ValueError):
+                    pass
+            try:
+                self._driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=self._build_options())
+            except Exception:
+                self._release_profile()
+                raise
+            self.navigations = 0
+            self._started_at = time.monotonic()
+            self._register(self.process_tree())
+            self._start_sampler()
+        return self._driver
+
+    def has_consent(self, site):
+        """
+        Indique si le bandeau de cookies d'un site a déjà été traité avec ce profil
+
+        Args:
+            site (str): Identifiant du site (ex: "pcpartpicker")
+        """
+        return site in self.consents
+
+    def remember_consent(self, site):
+        """
+        Retient que le bandeau de cookies d'un site a été traité (conservé dans le profil persistant)
+
+        Args:
+            site (str): Identifiant du site (ex: "pcpartpicker")
+        """
+        if site in self.consents:
+            return
+        self.consents.add(site)
+        if self._profile_lock is not None:
+            try:
+                atomic_write_json(self._consent_path(), sorted(self.consents))
+            except OSError as e:
+                debug_print(f"Impossible d'enregistrer le consentement de {site}: {e}", level="warning")
+
+    @property
+    def driver(self):
+        return self.start()
+
+    @property
+    def is_running(self):
+        return self._driver is not None
+
+    def driver_pid(self):
+        """PID du processus chromedriver, ou None si le navigateur est arrêté"""
+        try:
+            return self._driver.service.process.pid
+        except AttributeError:
+            return None
+
+    def process_tree(self):
+        """Processus chromedriver et Chrome (navigateur, rendu, GPU...) de ce navigateur"""
+        pid = self.driver_pid()
+        if pid is None:
+            return []
+        try:
+            root = psutil.Process(pid)
+            return [root] + root.children(recursive=True)
+        except psutil.Error:
+            return []
+
+    def rss_mb(self):
+        """Mémoire résidente totale de l'arbre de processus, en Mo"""
+        total = 0
+        for process in self.process_tree():
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+    def _register(self, processes):
+        """
+        Inscrit l'arbre de processus de ce navigateur au registre, au nom du processus courant
+
+        Les descendants sont conservés : si chromedriver meurt, ses processus Chrome sont
+        rattachés à un autre parent et ne se retrouvent plus depuis lui.
+        """
+        pid = self.driver_pid()
+        pids = frozenset(process.pid for process in processes)
+        if pid is None or pids == self._registered_pids:
+            return
+        identities = []
+        for process in processes:
+            try:
+                identities.append({"pid": process.pid, "create_time": process.create_time()})
+            except psutil.Error:
+                continue
+        try:
+            with file_lock(REGISTRY_PATH):
+                registry = _load_registry()
+                registry[f"{HOSTNAME}:{pid}"] = {
+                    "owner": _process_identity(psutil.Process()),
+                    "processes": identities,
+                }
+                atomic_write_json(REGISTRY_PATH, registry)
+            self._registered_pids = pids
+        except (OSError, psutil.Error) as e:
+            debug_print(f"Impossible d'inscrire le navigateur au registre: {e}", level="warning")
+
+    def _unregister(self, pid):
+        self._registered_pids = frozenset()
+        if pid is None:
+            return
+        try:
+            with file_lock(REGISTRY_PATH):
+                registry = _load_registry()
+                if registry.pop(f"{HOSTNAME}:{pid}", None) is not None:
+                    atomic_write_json(REGISTRY_PATH, registry)
+        except OSError as e:
+            debug_print(f"Impossible de retirer le navigateur du registre: {e}", level="warning")
+
+    def sample_usage(self):
+        """Relève la mémoire, le temps CPU et le nombre de processus de l'arbre Chrome"""
+        rss, count, cpu = 0, 0, {}
+        processes = self.process_tree()
+        # Les processus de rendu vont et viennent : le registre suit l'arbre courant
+        self._register(processes)
+        for process in processes:
+            try:
+                with process.oneshot():
+                    rss += process.memory_info().rss
+                    times = process.cpu_times()
+                    cpu[process.pid] = times.user + times.system
+                count += 1
+            except psutil.Error:
+                continue
+        with self._usage_lock:
+            self._peak_rss = max(self._peak_rss, rss)
+            self._peak_processes = max(self._peak_processes, count)
+            # Le temps CPU d'un processus ne fait que croître : on garde la dernière valeur lue
+            for pid, seconds in cpu.items():
+                self._cpu_by_pid[pid] = max(self._cpu_by_pid.get(pid, 0.0), seconds)
+
+    def _start_sampler(self):
+        if USAGE_SAMPLE_INTERVAL <= 0:
+            return
+        stop = threading.Event()
+
+        def sample_loop():
+            while not stop.wait(USAGE_SAMPLE_INTERVAL):
+                try:
+                    self.sample_usage()
+                except Exception as e:
+                    debug_print(f"Relevé de consommation Chrome impossible: {e}", level="debug")
+
+        self._sampler_stop = stop
+        threading.Thread(target=sample_loop, name="chrome-usage", daemon=True).start()
+
+    def resource_usage(self):
+        """
+        Consommation de l'arbre de processus Chrome (chromedriver, navigateur, rendu, GPU...) sur la session
+
+        Le temps CPU d'un processus de rendu terminé entre deux relevés n'est compté que jusqu'au
+        dernier relevé : la valeur est un minorant, d'autant plus juste que l'intervalle est court.
+
+        Returns:
+            dict: Mémoire maximale (Mo), temps CPU (secondes), nombre maximal de processus simultanés,
+                processus vus, navigations et durée d'ouverture du navigateur
+        """
+        with self._usage_lock:
+            running = self._running_seconds
+            if self._started_at is not None:
+                running += time.monotonic() - self._started_at
+            return {
+                "peak_rss_mb": round(self._peak_rss / (1024 * 1024), 1),
+                "cpu_seconds": round(sum(self._cpu_by_pid.values()), 2),
+                "peak_processes": self._peak_processes,
+                "processes_seen": len(self._cpu_by_pid),
+                "navigations": self.total_navigations,
+                "running_seconds": round(running, 2),
+            }
+
+    def needs_recycling(self):
+        if not self.is_running:
+            return False
+        if self.navigations >= self.max_navigations:
+            debug_print(f"Recyclage du navigateur après {self.navigations} navigations", level="info")
+            return True
+        rss = self.rss_mb()
+        if rss >= self.max_rss_mb:
+            debug_print(f"Recyclage du navigateur: {rss:.0f} Mo utilisés (limite {self.max_rss_mb} Mo)", level="info")
+            return True
+        return False
+
+    def restart(self):
+        """Ferme puis relance le navigateur"""
+        self.quit()
+        return self.start()
+
+    def get(self, url):
+        """
+        Charge une URL, en recyclant le navigateur au préalable si nécessaire
+
+        Args:
+            url (str): Adresse à charger
+        """
+        if self.needs_recycling():
+            self.restart()
+        self.driver.get(url)
+        self.navigations += 1
+        self.total_navigations += 1
+
+    def start_navigation(self, url):
+        """
+        Lance le chargement d'une URL sans attendre la fin du chargement de la page
+
+        Args:
+            url (str): Adresse à charger
+        """
+        if self.needs_recycling():
+            self.restart()
+        self.driver.execute_script("window.location.assign(arguments[0]);", url)
+        self.navigations += 1
+        self.total_navigations += 1
+
+    def quit(self):
+        """Ferme le navigateur et tue les processus Chrome qui lui survivraient"""
+        if self._driver is None:
+            return
+        # Dernier relevé avant la fermeture : le temps CPU des processus disparaît avec eux
+        if self._sampler_stop is not None:
+            self._sampler_stop.set()
+            self._sampler_stop = None
+        self.sample_usage()
+        with self._usage_lock:
+            self._running_seconds += time.monotonic() - self._started_at
+            self._started_at = None
+        processes = self.process_tree()
+        pid = self.driver_pid()
+        try:
+            self._driver.quit()
+        except Exception as e:
+            debug_print(f"Erreur lors de la fermeture du navigateur: {e}", level="warning")
+        finally:
+            self._driver = None
+            _kill_processes(processes)
+            self._unregister(pid)
+            self._release_profile()
+        usage = self.resource_usage()
+        debug_print(
+            f"Ressources Chrome ({os.path.basename(self.profile_dir) if self.profile_dir else 'profil vierge'}): "
+            f"{usage['peak_rss_mb']} Mo max, {usage['cpu_seconds']} s CPU, {usage['peak_processes']} processus max, "
+            f"{usage['navigations']} navigations",
+            level="info"
+        )
+
+def _kill_processes(processes):
+    alive = []
+    for process in processes:
+        try:
+            if process.is_running():
+                process.kill()
+                alive.append(process)
+        except psutil.Error:
+            continue
+    psutil.wait_procs(alive, timeout=5)
+
+@atexit.register
+def quit_all():
+    """Ferme tous les navigateurs encore ouverts par ce processus"""
+    for browser in list(_live_browsers):
+        browser.quit()
+
+def _process_identity(process):
+    # Le couple (PID, date de création) distingue un processus d'un autre ayant réutilisé son PID
+    return {"pid": process.pid, "create_time": process.create_time(), "host": HOSTNAME}
+
+def _find_process(identity):
+    try:
+        process = psutil.Process(identity["pid"])
+        if process.create_time() == identity["create_time"]:
+            return process
+    except psutil.Error:
+        pass
+    return None
+
+def _load_registry():
+    try:
+        with open(REGISTRY_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _orphan_entries(registry):
+    # Entrées du registre dont le processus propriétaire est mort ; celles d'une autre machine
+    # (registre partagé malgré tout) ne peuvent pas être vérifiées d'ici et sont ignorées
+    return [
+        key for key, entry in registry.items()
+        if entry["owner"].get("host") == HOSTNAME and _find_process(entry["owner"]) is None
+    ]
+
+def find_orphans():
+    """
+    Recherche les processus chromedriver et Chrome abandonnés par une session plantée
+
+    Seuls les navigateurs inscrits au registre par ManagedBrowser sont concernés : ils sont
+    orphelins quand le processus Python qui les a lancés est mort. Le PID du parent n'est
+    pas un critère fiable (application lancée en PID 1 dans un conteneur, subreaper...).
+
+    Returns:
+        list: Processus psutil orphelins (chromedriver et descendants inscrits encore vivants)
+    """
+    registry = _load_registry()
+    orphans = []
+    for key in _orphan_entries(registry):
+        orphans.extend(process for process in map(_find_process, registry[key]["processes"]) if process)
+    return orphans
+
+def reap_orphans():
+    """
+    Tue les processus Chrome/chromedriver orphelins et leurs enfants, puis les retire du registre
+
+    Returns:
+        int: Nombre de processus tués
+    """
+    with file_lock(REGISTRY_PATH):
+        registry = _load_registry()
+        dead_owners = _orphan_entries(registry)
+        if not dead_owners:
+            return 0
+        processes = []
+        for key in dead_owners:
+            for process in filter(None, map(_find_process, registry.pop(key)["processes"])):
+                try:
+                    processes.extend([process] + process.children(recursive=True))
+                except psutil.Error:
+                    continue
+        if processes:
+            debug_print(f"Nettoyage de {len(processes)} processus Chrome orphelins", level="warning")
+            _kill_processes(processes)
+        atomic_write_json(REGISTRY_PATH, registry)
+    return len(processes)
+
+def _reaper_loop(interval):
+    while True:
+        try:
+            reap_orphans()
+        except Exception as e:
+            debug_print(f"Erreur du nettoyeur de processus Chrome: {e}", level="warning")
+        time.sleep(interval)
+
+def start_reaper(interval=REAPER_INTERVAL):
+    """Démarre (une seule fois par processus) le thread de nettoyage des processus orphelins"""
+    global _reaper_thread
+    with _reaper_lock:
+        if _reaper_thread is None or not _reaper_thread.is_alive():
+            _reaper_thread = threading.Thread(target=_reaper_loop, args=(interval,), name="chrome-reaper", daemon=True)
+            _reaper_thread.start()
+
+if __name__ == "__main__":
+    count = reap_orphans()
+    debug_print(f"{count} processus orphelins tués", level="success")
@@ -0,0 +1,200 @@
+import argparse
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from selenium.webdriver.common.by import By
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.instant_gaming import BASE_URL, InstantGaming, RESULT_LINKS_SELECTOR, search_url
+from utils.crawl_frontier import CrawlFrontier, LISTING, PRODUCT
+from utils.debug_color import debug_print
+
+# Délai minimum (secondes) entre deux chargements de page
+CRAWL_DELAY = float(os.environ.get("GAMECONFIG_CRAWL_DELAY", 5))
+
+# Délais avant revisite d'une page produit et d'une page de résultats
+PRODUCT_REFRESH_SECONDS = float(os.environ.get("GAMECONFIG_CRAWL_PRODUCT_REFRESH_DAYS", 7)) * 86400
+LISTING_REFRESH_SECONDS = float(os.environ.get("GAMECONFIG_CRAWL_LISTING_REFRESH_HOURS", 24)) * 3600
+
+# Délai de base avant une nouvelle tentative après un échec
+RETRY_SECONDS = 600
+
+# Pages produit Instant Gaming (ex: https://www.instant-gaming.com/fr/2398-acheter-elden-ring-pc-steam/)
+PRODUCT_URL_PATTERN = re.compile(rf"^{re.escape(BASE_URL)}\d+-[^/?#]+/?$")
+
+def _listing_page(url):
+    match = re.search(r"[?&]page=(\d+)", url)
+    return int(match.group(1)) if match else 1
+
+def sitemap_product_urls(sitemap_url, timeout=30):
+    """
+    Liste les pages produit annoncées par un sitemap (les index de sitemaps sont suivis)
+
+    Args:
+        sitemap_url (str): Adresse du sitemap XML
+        timeout (float): Délai maximum par requête
+
+    Returns:
+        list: Adresses des pages produit
+    """
+    import requests
+
+    urls, pending, seen = [], [sitemap_url], set()
+    while pending:
+        url = pending.pop()
+        if url in seen:
+            continue
+        seen.add(url)
+        try:
+            response = requests.get(url, timeout=timeout)
+            response.raise_for_status()
+            root = ET.fromstring(response.content)
+        except Exception as e:
+            debug_print(f"Sitemap {url} illisible: {e}", level="warning")
+            continue
+        for loc in root.iter():
+            if not loc.tag.endswith("loc") or not loc.text:
+                continue
+            location = loc.text.strip()
+            if location.endswith(".xml") or location.endswith(".xml.gz"):
+                pending.append(location)
+            elif PRODUCT_URL_PATTERN.match(location):
+                urls.append(location)
+    return urls
+
+class CatalogCrawler:
+    """Remplit et rafraîchit la base locale des configurations requises à partir du catalogue PC d'Instant Gaming"""
+
+    def __init__(self, frontier=None, headless=True, delay=CRAWL_DELAY,
+                 product_refresh=PRODUCT_REFRESH_SECONDS, listing_refresh=LISTING_REFRESH_SECONDS):
+        """
+        Args:
+            frontier (CrawlFrontier): Frontière persistante (celle par défaut sinon)
+            headless (bool): Lance Chrome sans interface
+            delay (float): Délai minimum entre deux chargements de page
+            product_refresh (float): Secondes avant revisite d'une page produit
+            listing_refresh (float): Secondes avant revisite d'une page de résultats
+        """
+        self.frontier = frontier or CrawlFrontier()
+        self.delay = delay
+        self.product_refresh = product_refresh
+        self.listing_refresh = listing_refresh
+        self.scraper = InstantGaming(headless=headless)
+        self._last_load = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.scraper.quit()
+        return False
+
+    def seed(self, sitemap_url=None):
+        """
+        Ajoute les points d'entrée de la découverte : première page du catalogue PC et sitemap éventuel
+
+        Returns:
+            int: Nombre de nouvelles pages dans la frontière
+        """
+        added = self.frontier.add([search_url()], LISTING)
+        if sitemap_url:
+            added += self.frontier.add(sitemap_product_urls(sitemap_url), PRODUCT)
+        return added
+
+    def _throttle(self):
+        # Limitation du débit : au plus une page toutes les `delay` secondes
+        wait = self.delay - (time.monotonic() - self._last_load)
+        if wait > 0:
+            time.sleep(wait)
+        self._last_load = time.monotonic()
+
+    def _load(self, url):
+        self._throttle()
+        self.scraper._ensure_browser().get(url)
+
+    def _crawl_listing(self, url):
+        links = None
+        if self.scraper.network_capture:
+            self._throttle()
+            links = self.scraper.capture_result_links(url)
+        if links is None:
+            self._load(url)
+            links = [element.get_attribute("href") for element in self.scraper.driver.find_elements(By.CSS_SELECTOR, RESULT_LINKS_SELECTOR)]
+            links = [link for link in links if link]
+        added = self.frontier.add(links, PRODUCT)
+        # Une page non vide annonce la suivante : la pagination est découverte au fil de l'eau
+        if links:
+            added += self.frontier.add([search_url(page=_listing_page(url) + 1)], LISTING)
+        self.frontier.mark_fetched(url, self.listing_refresh)
+        debug_print(f"{url}: {len(links)} jeux, {added} nouvelles pages", level="info")
+
+    def _crawl_product(self, url):
+        self._load(url)
+        # Le scraper est réutilisé d'une page à l'autre : un échec de sauvegarde ne doit pas
+        # laisser le fichier du produit précédent
+        self.scraper.saved_json_path = None
+        data = self.scraper.extract_system_requirements()
+        if not data or not self.scraper.saved_json_path:
+            raise RuntimeError("Spécifications introuvables")
+        self.frontier.mark_fetched(url, self.product_refresh, game=data["game"], json_path=self.scraper.saved_json_path)
+        debug_print(f"{data['game']} enregistré ({self.scraper.saved_json_path})", level="success")
+
+    def crawl(self, max_pages=None):
+        """
+        Visite les pages échues de la frontière
+
+        Peut être interrompu à tout moment : la frontière est à jour après chaque page et le
+        prochain passage reprend là où celui-ci s'est arrêté.
+
+        Args:
+            max_pages (int): Nombre maximum de pages visitées (toutes les pages échues par défaut)
+
+        Returns:
+            int: Nombre de pages visitées avec succès
+        """
+        visited = 0
+        while max_pages is None or visited < max_pages:
+            pages = self.frontier.due(limit=1)
+            if not pages:
+                break
+            page = pages[0]
+            try:
+                if page["kind"] == LISTING:
+                    self._crawl_listing(page["url"])
+                else:
+                    self._crawl_product(page["url"])
+                visited += 1
+            except Exception as e:
+                self.frontier.mark_failed(page["url"], e, RETRY_SECONDS)
+                debug_print(f"Échec de {page['url']}: {e}", level="warning")
+        return visited
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawler incrémental du catalogue PC d'Instant Gaming")
+    parser.add_argument("--db", default=None, help="Chemin de la frontière SQLite")
+    parser.add_argument("--sitemap", default=None, help="Sitemap XML utilisé en plus des pages de résultats")
+    parser.add_argument("--max-pages", type=int, default=None, help="Nombre maximum de pages par passage")
+    parser.add_argument("--delay", type=float, default=CRAWL_DELAY, help="Délai minimum entre deux pages (secondes)")
+    parser.add_argument("--forever", action="store_true", help="Continue en attendant les prochaines échéances")
+    parser.add_argument("--stats", action="store_true", help="Affiche l'état de la frontière et quitte")
+    parser.add_argument("--no-headless", action="store_true", help="Affiche le navigateur")
+    args = parser.parse_args()
+
+    frontier = CrawlFrontier(args.db) if args.db else CrawlFrontier()
+    if args.stats:
+        print(frontier.stats())
+        sys.exit(0)
+
+    with CatalogCrawler(frontier, headless=not args.no_headless, delay=args.delay) as crawler:
+        crawler.seed(args.sitemap)
+        while True:
+            visited = crawler.crawl(max_pages=args.max_pages)
+            debug_print(f"Passage terminé: {visited} pages visitées, {frontier.stats()}", level="success")
+            if not args.forever:
+                break
+            # Navigateur fermé entre deux passages : rien ne tourne pendant l'attente
+            crawler.scraper.quit()
+            time.sleep(max(args.delay, 60))
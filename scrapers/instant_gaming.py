@@ -1,16 +1,44 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from pathlib import Path
 import time
 import json
 import os
-import uuid
+import sys
+from urllib.parse import urlencode, urljoin
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.image_cache import prefetch
+from utils.search_index import index_document
+from utils.storage import mirror_game
+from utils.game_records import save_game_record
+from utils.page_cache import cached_extraction, region_hash, store_extraction
+from scrapers.browser import ManagedBrowser
+from scrapers.network_capture import NETWORK_CAPTURE, capture_response
+
+# Adresse du site (surchargeable via GAMECONFIG_IG_BASE_URL, ex: sites de substitution des tests de charge)
+BASE_URL = os.environ.get("GAMECONFIG_IG_BASE_URL", "https://www.instant-gaming.com/fr/")
+
+# Page de résultats de recherche ; la plateforme 1 correspond au filtre "PC"
+SEARCH_URL = BASE_URL + "rechercher/"
+PC_PLATFORM_ID = "1"
+
+# Zone d'une page produit dont dépend l'extraction (titre, image, prix et spécifications)
+REQUIREMENTS_REGION = "title, .presentation picture.banner img, .total, .specs-container.listing-slider"
+
+# Lien du premier résultat dans la liste des jeux
+FIRST_RESULT_SELECTOR = ".search.listing-items .item:first-child a.cover"
+
+# Lien des résultats dans la liste des jeux
+RESULT_LINKS_SELECTOR = ".search.listing-items .item a.cover"
+
+# Construit l'URL des résultats de recherche filtrés sur PC (sans nom : tout le catalogue PC)
+def search_url(game_name="", page=None):
+    params = {"platform[]": PC_PLATFORM_ID, "query": game_name}
+    if page and page > 1:
+        params["page"] = page
+    return f"{SEARCH_URL}?{urlencode(params)}"
 
 # Récupère le nom du jeu vidéo (utilise une valeur par défaut pour le moment)
 def get_game_name():
@@ -23,23 +51,41 @@ def get_game_name():
 
 class InstantGaming:
     # Initialise la classe avec les options de configuration
-    def __init__(self, headless=False, game_name=None):
-        self.driver = None
+    def __init__(self, headless=False, game_name=None, network_capture=None):
+        self.browser = None
         self.headless = headless
         self.game_name = game_name
+        # Capture réseau : listes de résultats lues dans le HTML reçu (activée par GAMECONFIG_NETWORK_CAPTURE=1, désactivée par défaut)
+        self.network_capture = NETWORK_CAPTURE if network_capture is None else network_capture
+        self.saved_json_path = None  # Chemin du dernier fichier de configurations enregistré
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.quit()
+        return False
+    
+    # Driver du navigateur géré (None tant que le site n'a pas été ouvert)
+    @property
+    def driver(self):
+        return self.browser.driver if self.browser and self.browser.is_running else None
+        
+    # Crée le navigateur géré s'il n'existe pas encore
+    def _ensure_browser(self):
+        if self.browser is None:
+            # Profil persistant : le consentement aux cookies est conservé d'une recherche à l'autre
+            self.browser = ManagedBrowser(headless=self.headless, arguments=["--window-size=1920,1080"], profile="instantgaming",
+                                          network_capture=self.network_capture)
+        return self.browser
         
     # Configure le driver et accède au site web d'Instant Gaming
     def access_site(self):
         try:
-            chrome_options = Options()
-            if self.headless:
-                chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--window-size=1920,1080")
-            
-            self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+            self._ensure_browser()
             
             print("Accès au site web Instant Gaming...")
-            self.driver.get("https://www.instant-gaming.com/fr/")
+            self.browser.get(BASE_URL)
             
             time.sleep(3)
             
@@ -53,6 +99,10 @@ class InstantGaming:
 
     # Accepte le bandeau de cookies sur le site
     def accept_cookies(self):
+        # Bandeau déjà accepté avec ce profil : on évite d'attendre 10 secondes pour rien
+        if self.browser.has_consent("instantgaming"):
+            print("Cookies déjà acceptés avec ce profil.")
+            return True
         try:
             print("Recherche de la bannière de cookies...")
             wait = WebDriverWait(self.driver, 10)
@@ -62,6 +112,7 @@ class InstantGaming:
             print("Bouton 'Tout accepter' trouvé, clic en cours...")
             accept_button.click()
             print("Cookies acceptés avec succès.")
+            self.browser.remember_consent("instantgaming")
             return True
         except Exception as e:
             print(f"Erreur lors de l'acceptation des cookies: {e}")
@@ -118,6 +169,54 @@ class InstantGaming:
             print(f"Erreur lors de la recherche ou du filtrage: {e}")
             return False
         
+    # Chemin rapide : ouvre directement les résultats filtrés sur PC puis la page du premier jeu,
+    # sans passer par la page d'accueil, la barre de recherche ni le menu des plateformes
+    def open_first_result_direct(self):
+        try:
+            self._ensure_browser()
+            url = search_url(self.game_name)
+            print(f"Accès direct aux résultats de recherche: {url}")
+            
+            links = self.capture_result_links(url) if self.network_capture else None
+            if links is not None:
+                if not links:
+                    print("Aucun résultat dans la réponse capturée")
+                    return False
+                product_url = links[0]
+            else:
+                self.browser.get(url)
+                
+                wait = WebDriverWait(self.driver, 10)
+                first_result = wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, FIRST_RESULT_SELECTOR))
+                )
+                product_url = first_result.get_attribute("href")
+            if not product_url:
+                print("Lien du premier résultat introuvable")
+                return False
+            print(f"Premier jeu trouvé: {product_url}")
+            
+            # Seule la page produit est chargée ensuite : les spécifications sont présentes dès le chargement
+            self.browser.get(product_url)
+            print(f"Page chargée: {self.driver.title}")
+            return True
+        except Exception as e:
+            print(f"Erreur lors de l'accès direct aux résultats: {e}")
+            return False
+        
+    # Liens des jeux d'une page de résultats, lus dans la réponse HTML capturée sans attendre le rendu
+    # (None si la capture échoue : l'appelant repasse alors par le DOM)
+    def capture_result_links(self, url):
+        self._ensure_browser()
+        response = capture_response(self.browser, url)
+        if response is None or not response.ok:
+            return None
+        try:
+            return [urljoin(response.url, link["href"]) for link in response.soup().select(RESULT_LINKS_SELECTOR) if link.get("href")]
+        except Exception as e:
+            print(f"Erreur lors de l'analyse des résultats capturés: {e}")
+            return None
+        
     # Clique sur le premier résultat de la recherche
     def click_first_result(self):
         try:
@@ -125,7 +224,7 @@ class InstantGaming:
             
             wait = WebDriverWait(self.driver, 10)
             first_result = wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".search.listing-items .item:first-child a.cover"))
+                EC.element_to_be_clickable((By.CSS_SELECTOR, FIRST_RESULT_SELECTOR))
             )
             
             try:
@@ -152,6 +251,22 @@ class InstantGaming:
         try:
             print("Extraction des configurations système...")
             
+            # Page inchangée depuis la dernière visite : pas de parcours du DOM ni de nettoyage des spécifications
+            page_url = self.driver.current_url
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ".specs-container.listing-slider"))
+                )
+            except Exception:
+                pass
+            digest = region_hash(self.driver, REQUIREMENTS_REGION)
+            cached = cached_extraction("instantgaming.requirements", page_url, digest)
+            if cached is not None:
+                print("Page inchangée depuis la dernière visite, extraction précédente réutilisée.")
+                prefetch([cached.get("image_url")])
+                self.save_requirements_to_json(cached)
+                return cached
+            
             # Récupérer l'URL de l'image du jeu
             try:
                 wait = WebDriverWait(self.driver, 5)
@@ -160,6 +275,7 @@ class InstantGaming:
                 )
                 image_url = image_element.get_attribute("src")
                 print(f"URL de l'image récupérée: {image_url}")
+                prefetch([image_url])
             except Exception as e:
                 print(f"Impossible de récupérer l'image du jeu: {e}")
                 image_url = ""
@@ -309,6 +425,7 @@ class InstantGaming:
             }
             
             print("Configurations système extraites avec succès!")
+            store_extraction("instantgaming.requirements", page_url, digest, system_requirements)
             
             self.save_requirements_to_json(system_requirements)
             
@@ -320,35 +437,16 @@ class InstantGaming:
         
     def save_requirements_to_json(self, data):
         try:
-            # Récupérer le nom du jeu et le nettoyer pour l'utiliser dans un nom de fichier
-            game_name = data["game"].replace(":", "").replace(" ", "_").replace("/", "_").lower()
-            
-            # Générer un UUID unique
-            unique_id = str(uuid.uuid4())
-            
-            # Ajouter l'UUID comme première clé du dictionnaire de données
-            # Créer un nouveau dictionnaire avec l'UUID en premier (ordre préservé depuis Python 3.7+)
-            updated_data = {
-                "uuid": unique_id,
-                **data  # Décompresse le dictionnaire existant après la première clé
-            }
-            
-            # Construire le nom du fichier avec le format: nom_du_jeu_uuid.json
-            filename_base = f"{game_name}_{unique_id}"
-            
-            project_root = Path(__file__).parent.parent
-            data_folder = os.path.join(project_root, "data", "instantgaming")
-            
-            if not os.path.exists(data_folder):
-                os.makedirs(data_folder)
-                print(f"Dossier '{data_folder}' créé")
-            
-            filename = os.path.join(data_folder, f"{filename_base}.json")
-            
-            with open(filename, "w", encoding="utf-8") as json_file:
-                json.dump(updated_data, json_file, indent=4, ensure_ascii=False)
-            
-            print(f"Configurations système enregistrées dans le fichier '{filename}'")
+            # Un contenu déjà connu réutilise sa fiche (même uuid) : seule l'observation est enregistrée
+            filename, updated_data, created = save_game_record(data)
+            
+            self.saved_json_path = filename
+            if created:
+                index_document(filename, updated_data)
+                mirror_game(updated_data)
+                print(f"Configurations système enregistrées dans le fichier '{filename}'")
+            else:
+                print(f"Configurations système inchangées, fichier existant réutilisé: '{filename}'")
             return True
         
         except Exception as e:
@@ -357,8 +455,8 @@ class InstantGaming:
     
     # Ferme le navigateur Chrome
     def quit(self):
-        if self.driver:
-            self.driver.quit()
+        if self.browser and self.browser.is_running:
+            self.browser.quit()
             print("Navigateur fermé.")
 
 if __name__ == "__main__":
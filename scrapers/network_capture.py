@@ -0,0 +1,121 @@
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+
+# Extraction par capture réseau (GAMECONFIG_NETWORK_CAPTURE=1) : les réponses HTML/JSON sont lues
+# dans le journal de performance de Chrome au lieu de parcourir le DOM une fois la page rendue
+NETWORK_CAPTURE = os.environ.get("GAMECONFIG_NETWORK_CAPTURE", "0") == "1"
+
+# Délai maximum (secondes) d'attente de la réponse capturée
+CAPTURE_TIMEOUT = float(os.environ.get("GAMECONFIG_CAPTURE_TIMEOUT", 15))
+
+# Intervalle (secondes) entre deux lectures du journal de performance
+POLL_INTERVAL = 0.05
+
+def enable_performance_logging(options):
+    """
+    Active le journal de performance (événements réseau DevTools) d'un navigateur
+
+    Args:
+        options (Options): Options Chrome du navigateur à lancer
+    """
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    # Seuls les événements réseau sont utiles : pas d'événements de page ni de trace de rendu
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+    # chromedriver fait attendre chaque commande jusqu'à la fin du chargement en cours : avec "eager",
+    # l'attente s'arrête au DOMContentLoaded, sans les images ni les scripts tiers
+    options.page_load_strategy = "eager"
+
+class CapturedResponse:
+    """Réponse HTTP capturée par DevTools pendant un chargement de page"""
+
+    def __init__(self, url, status, mime_type, body):
+        self.url = url
+        self.status = status
+        self.mime_type = mime_type
+        self.body = body
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 400
+
+    def json(self):
+        return json.loads(self.body)
+
+    def soup(self):
+        """Document HTML analysé (BeautifulSoup, sélecteurs CSS via select/select_one)"""
+        from bs4 import BeautifulSoup
+
+        return BeautifulSoup(self.body, "html.parser")
+
+def _events(driver):
+    # Vide le tampon du journal de performance de chromedriver
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        yield message["method"], message.get("params", {})
+
+def capture_response(browser, url, match=None, timeout=CAPTURE_TIMEOUT):
+    """
+    Navigue vers une page et renvoie une réponse réseau dès qu'elle est entièrement reçue
+
+    La navigation n'attend ni le rendu ni les ressources de la page : la réponse est lue
+    (Network.getResponseBody) au moment où elle arrive.
+
+    Args:
+        browser (ManagedBrowser): Navigateur lancé avec network_capture=True
+        url (str): Page à charger
+        match (callable): Reçoit les paramètres de Network.responseReceived (type, response...)
+            et indique si la réponse est celle attendue ; par défaut, le document de la page
+        timeout (float): Délai maximum d'attente
+
+    Returns:
+        CapturedResponse: Réponse capturée, ou None si elle n'est pas arrivée à temps
+    """
+    driver = browser.driver
+    try:
+        # Les événements des pages précédentes ne concernent pas cette navigation
+        for _ in _events(driver):
+            pass
+    except Exception as e:
+        debug_print(f"Journal de performance indisponible: {e}", level="warning")
+        return None
+
+    browser.start_navigation(url)
+    document_ids = set()
+    responses = {}
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        for method, params in _events(driver):
+            request_id = params.get("requestId")
+            if method == "Network.requestWillBeSent":
+                # Les redirections conservent l'identifiant de la requête initiale
+                if params.get("type") == "Document" and params["request"]["url"] == url:
+                    document_ids.add(request_id)
+            elif method == "Network.responseReceived":
+                if match(params) if match else request_id in document_ids:
+                    responses[request_id] = params["response"]
+            elif method == "Network.loadingFinished" and request_id in responses:
+                response = responses[request_id]
+                try:
+                    result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                except Exception as e:
+                    debug_print(f"Corps de la réponse {response['url']} illisible: {e}", level="warning")
+                    return None
+                body = result["body"]
+                if result.get("base64Encoded"):
+                    body = base64.b64decode(body).decode("utf-8", errors="replace")
+                debug_print(f"Réponse capturée: {response['url']} ({response['status']})", level="debug")
+                return CapturedResponse(response["url"], response["status"], response.get("mimeType", ""), body)
+            elif method == "Network.loadingFailed" and request_id in (responses.keys() | document_ids):
+                debug_print(f"Chargement de {url} en échec: {params.get('errorText')}", level="warning")
+                return None
+        time.sleep(POLL_INTERVAL)
+
+    debug_print(f"Aucune réponse capturée pour {url} après {timeout} s", level="warning")
+    return None
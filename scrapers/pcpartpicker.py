@@ -1,56 +1,82 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import time
 import sys
 import os
 import json
+import copy
+import re
+from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlencode, urljoin
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.debug_color import debug_print
+from utils.image_cache import prefetch
+from utils.prices import parse_price
+from utils.price_history import record_prices
+from utils.search_index import index_document
+from utils.storage import mirror_configuration
+from utils.atomic_io import atomic_write_json
+from utils.page_cache import cached_extraction, region_hash, store_extraction
+from utils.budget_optimizer import apply_selection, optimize
+from scrapers.browser import ManagedBrowser
+from scrapers.network_capture import NETWORK_CAPTURE, capture_response
+from scrapers.static_catalog import catalog_resolve
 
 GLOBAL_WAIT = 1
 
+# Adresse du site (surchargeable via GAMECONFIG_PCPP_BASE_URL, ex: sites de substitution des tests de charge)
+BASE_URL = os.environ.get("GAMECONFIG_PCPP_BASE_URL", "https://fr.pcpartpicker.com")
+
+# Zone d'une page produit dont dépend l'extraction (prix des marchands et image)
+DETAILS_REGION = "#prices, #pp_main_product_image, .product__image-2024, .product__image"
+
 class PCConfiguration:
     """Classe pour gérer une configuration PC avec ses composants et prix"""
     
-    def __init__(self, name="Ma configuration", game_uuid=None):
+    def __init__(self, name="Ma configuration", game_uuid=None, game_name=None, is_recommended=None):
         self.name = name
         self.game_uuid = game_uuid  # UUID du jeu pour la traçabilité
+        self.game_name = game_name
+        self.is_recommended = is_recommended
         self.components = {}  # Dictionnaire avec catégorie comme clé et composant comme valeur
         self.total_price = 0.0
         self.alternative_components = {}  # Pour stocker les composants alternatifs
+        self.search_terms = {}  # Terme de recherche à l'origine de chaque composant principal
+        self.alternative_search_terms = {}  # Termes de recherche des composants alternatifs
 
     
-    def add_component(self, category, component_info):
+    def add_component(self, category, component_info, search_term=None):
         """
         Ajoute un composant à la configuration
         
         Args:
             category (str): Catégorie du composant (CPU, GPU, etc.)
             component_info (dict): Informations sur le composant
+            search_term (str): Terme de recherche ayant produit ce composant
         """
         self.components[category] = component_info
+        if search_term is not None:
+            self.search_terms[category] = search_term
         self._update_total_price()
         debug_print(f"Composant ajouté: {category} - {component_info['name']}", level="success")
     
-    def add_alternative_component(self, category, component_info):
+    def add_alternative_component(self, category, component_info, search_term=None):
         """
         Ajoute un composant alternatif à la configuration
         
         Args:
             category (str): Catégorie du composant (CPU, GPU, etc.)
             component_info (dict): Informations sur le composant alternatif
+            search_term (str): Terme de recherche ayant produit ce composant
         """
         if category not in self.alternative_components:
             self.alternative_components[category] = []
         
         self.alternative_components[category].append(component_info)
+        self.alternative_search_terms.setdefault(category, []).append(search_term)
         debug_print(f"Composant alternatif ajouté: {category} - {component_info['name']}", level="success")
     
     def remove_component(self, category):
@@ -63,6 +89,7 @@ class PCConfiguration:
         if category in self.components:
             removed = self.components[category]['name']
             del self.components[category]
+            self.search_terms.pop(category, None)
             self._update_total_price()
             debug_print(f"Composant retiré: {category} - {removed}", level="info")
     
@@ -71,11 +98,11 @@ class PCConfiguration:
         self.total_price = 0.0
         for category, component in self.components.items():
             if component['price'] != "N/A":
-                # Extraire le prix numérique (enlever le symbole €)
-                price_str = component['price'].replace('€', '').replace(',', '.')
-                try:
-                    self.total_price += float(price_str)
-                except ValueError:
+                # Extraire le prix numérique (enlever le symbole € et les séparateurs de milliers)
+                price = parse_price(component['price'])
+                if price is not None:
+                    self.total_price += price
+                else:
                     debug_print(f"Prix invalide pour {component['name']}: {component['price']}", level="warning")
     
     def get_total_price(self):
@@ -94,15 +121,25 @@ class PCConfiguration:
         Args:
             filepath (str): Chemin du fichier de sauvegarde
         """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump({
-                'name': self.name,
-                'game_uuid': self.game_uuid,  # Inclure l'UUID
-                'components': self.components,
-                'alternative_components': self.alternative_components,
-                'total_price': self.get_total_price()
-            }, f, ensure_ascii=False, indent=2)
-        debug_print(f"Configuration sauvegardée dans {filepath}", level="success")   
+        data = {
+            'name': self.name,
+            'game_uuid': self.game_uuid,  # Inclure l'UUID
+            'game_name': self.game_name,
+            'is_recommended': self.is_recommended,
+            'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'components': self.components,
+            'alternative_components': self.alternative_components,
+            'search_terms': self.search_terms,
+            'alternative_search_terms': self.alternative_search_terms,
+            'total_price': self.get_total_price()
+        }
+        # Écriture atomique : un lecteur concurrent (historique) ne voit jamais de fichier partiel
+        atomic_write_json(filepath, data, indent=2)
+        debug_print(f"Configuration sauvegardée dans {filepath}", level="success")
+        
+        # Mettre à jour l'index de recherche et le stockage configuré avec la nouvelle configuration
+        index_document(filepath, data)
+        mirror_configuration(filepath, data)
          
     @classmethod
     def load_from_json(cls, filepath):
@@ -117,12 +154,47 @@ class PCConfiguration:
         """
         with open(filepath, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            config = cls(name=data['name'])
+            config = cls(
+                name=data['name'],
+                game_uuid=data.get('game_uuid'),
+                game_name=data.get('game_name'),
+                is_recommended=data.get('is_recommended')
+            )
+            search_terms = data.get('search_terms', {})
             for category, component in data['components'].items():
-                config.add_component(category, component)
+                config.add_component(category, component, search_terms.get(category))
+            alternative_search_terms = data.get('alternative_search_terms', {})
+            for category, alternatives in data.get('alternative_components', {}).items():
+                terms = alternative_search_terms.get(category, [])
+                for i, component in enumerate(alternatives):
+                    config.add_alternative_component(category, component, terms[i] if i < len(terms) else None)
             debug_print(f"Configuration chargée depuis {filepath}", level="success")
             return config
     
+    def resolved_lookups(self):
+        """
+        Composants déjà résolus, indexés par terme de recherche canonique
+        
+        Les composants virtuels "non trouvé" et ceux sans prix sont exclus : un échec de
+        recherche passager est retenté au lieu d'être recopié dans les configurations suivantes.
+        
+        Returns:
+            dict: Terme canonique -> composant trouvé
+        """
+        def resolved(component):
+            return bool(component.get('link')) and component.get('price') != "N/A"
+        
+        lookups = {}
+        for category, component in self.components.items():
+            search_term = self.search_terms.get(category)
+            if search_term is not None and resolved(component):
+                lookups[normalize_search_term(search_term)] = component
+        for category, alternatives in self.alternative_components.items():
+            for component, search_term in zip(alternatives, self.alternative_search_terms.get(category, [])):
+                if search_term is not None and resolved(component):
+                    lookups.setdefault(normalize_search_term(search_term), component)
+        return lookups
+    
     def get_summary(self):
         """
         Obtient un résumé texte de la configuration
@@ -140,23 +212,59 @@ class PCConfiguration:
         summary.append(f"Prix total: {self.get_total_price()}")
         
         return "\n".join(summary)
-
-class PCPartPickerScraper:
-    def __init__(self, headless=False):
-        # Configuration du navigateur Chrome
-        chrome_options = Options()
-        
-        # Appliquer le mode headless en fonction du paramètre
-        if headless:
-            chrome_options.add_argument("--headless")
+    
+    def optimized(self, max_budget=None, max_merchants=None, allowed_merchants=None):
+        """
+        Variante la moins chère de la configuration, parmi ses alternatives et les offres déjà relevées
         
-        # Ajouter l'option pour maximiser la fenêtre
-        chrome_options.add_argument("--start-maximized")
+        Args:
+            max_budget (float): Prix total maximum
+            max_merchants (int): Nombre maximum de marchands distincts (1 : un seul marchand)
+            allowed_merchants (iterable): Marchands autorisés (tous par défaut)
+            
+        Returns:
+            PCConfiguration: Nouvelle configuration, ou None si aucune combinaison ne respecte les contraintes
+        """
+        result = optimize(self.components, self.alternative_components, max_budget, max_merchants, allowed_merchants)
+        if result is None:
+            return None
         
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-        self.base_url = "https://fr.pcpartpicker.com"
+        config = copy.deepcopy(self)
+        config.components, config.alternative_components = apply_selection(
+            self.components, self.alternative_components, result)
+        # Les termes de recherche suivent les composants échangés
+        for category, chosen in result["selection"].items():
+            index = chosen["alternative_index"]
+            terms = config.alternative_search_terms.get(category, [])
+            if index is not None and index < len(terms):
+                config.search_terms[category], terms[index] = terms[index], config.search_terms.get(category)
+        config._update_total_price()
+        return config
+
+class PCPartPickerScraper:
+    def __init__(self, headless=False, network_capture=None):
+        # Navigateur Chrome géré (recyclé après N navigations ou au-delà d'un seuil mémoire),
+        # avec l'option pour maximiser la fenêtre et un profil persistant qui conserve le consentement aux cookies
+        # Capture réseau : résultats et prix lus dans le HTML reçu (activée par GAMECONFIG_NETWORK_CAPTURE=1, désactivée par défaut)
+        self.network_capture = NETWORK_CAPTURE if network_capture is None else network_capture
+        self.browser = ManagedBrowser(headless=headless, arguments=["--start-maximized"], profile="pcpartpicker",
+                                      network_capture=self.network_capture)
+        self.browser.start()
+        self.base_url = BASE_URL
         debug_print("Navigateur initialisé", level="success")
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    @property
+    def driver(self):
+        """Driver courant (change après un recyclage du navigateur)"""
+        return self.browser.driver
+    
     def create_configuration(self, name, components_to_search):
         """
         Crée une configuration PC à partir d'une liste de composants à rechercher
@@ -173,24 +281,9 @@ class PCPartPickerScraper:
         
         for category, search_term in components_to_search.items():
             debug_print(f"Recherche de {category}: {search_term}", level="info")
-            results = self.search_component(search_term)
+            component = self.resolve_component(search_term)
             
-            if results:
-                # Prendre le premier résultat
-                component = results[0]
-                
-                # Obtenir plus de détails (prix et marchands)
-                component_details = self.get_component_details(component['link'])
-                
-                # Utiliser les détails du meilleur prix
-                if component_details['best_deal']:
-                    component['price'] = component_details['best_deal']['price']
-                    component['merchant'] = component_details['best_deal']['merchant']
-                    component['buy_link'] = component_details['best_deal']['link']
-                
-                if component_details['image_url']:
-                    component['image_url'] = component_details['image_url']    
-
+            if component:
                 # Ajouter à la configuration
                 config.add_component(category, component)
             else:
@@ -244,93 +337,90 @@ class PCPartPickerScraper:
         primary_components, alternative_components, game_name, game_uuid = create_config_from_game_requirements(
             json_path, use_recommended)
         
-        specs_type = "recommandée" if use_recommended else "minimale"
-        config_name = f"Config {specs_type} pour {game_name}"
+        return assemble_configuration(
+            game_name, game_uuid, use_recommended,
+            primary_components, alternative_components,
+            self.resolve_component, include_alternatives=include_alternatives
+        )
+    
+    def rebuild_configuration(self, previous_config, json_path, use_recommended=True, include_alternatives=False):
+        """
+        Construit une configuration en réutilisant les composants d'une configuration déjà créée
         
-        # Créer la configuration avec UUID et composants principaux
-        config = PCConfiguration(name=config_name, game_uuid=game_uuid)
+        Seules les recherches dont le terme diffère de celles de la configuration précédente
+        (ex: CPU et GPU entre minimale et recommandée) sont relancées ; les autres composants
+        (OS, RAM, stockage identiques) sont repris tels quels.
         
-        # Ajouter les composants principaux
-        for category, search_term in primary_components.items():
-            debug_print(f"Recherche de composant principal {category}: {search_term}", level="info")
-            results = self.search_component(search_term)
+        Args:
+            previous_config (PCConfiguration): Configuration déjà construite pour le même jeu
+            json_path (str): Chemin vers le fichier JSON des spécifications du jeu
+            use_recommended (bool): Si True, utilise les spécifications recommandées
+            include_alternatives (bool): Si True, inclut les composants alternatifs
             
-            if results and len(results) > 0:
-                # Prendre le premier résultat
-                component = results[0]
-                
-                # Obtenir plus de détails (prix et marchands)
-                component_details = self.get_component_details(component['link'])
-                
-                # Utiliser les détails du meilleur prix
-                if component_details['best_deal']:
-                    component['price'] = component_details['best_deal']['price']
-                    component['merchant'] = component_details['best_deal']['merchant']
-                    component['buy_link'] = component_details['best_deal']['link']
-                
-                if component_details['image_url']:
-                    component['image_url'] = component_details['image_url']    
-    
-                # Ajouter à la configuration
-                config.add_component(category, component)
-            else:
-                # Créer un composant "virtuel" pour garantir que tous les composants sont inclus même sans résultats
-                debug_print(f"Aucun résultat pour {category}: {search_term}, création d'un composant virtuel", level="warning")
-                virtual_component = {
-                    'name': f"{search_term} (non trouvé)",
-                    'price': "N/A",
-                    'link': "",
-                    'merchant': "N/A",
-                    'buy_link': "",
-                    'image_url': ""
-                }
-                config.add_component(category, virtual_component)
-        
-        # Ajouter les composants alternatifs uniquement si demandé
-        if include_alternatives:
-            debug_print("Ajout des composants alternatifs à la configuration", level="info")
-            for category, search_terms in alternative_components.items():
-                for search_term in search_terms:
-                    debug_print(f"Recherche de composant alternatif {category}: {search_term}", level="info")
-                    results = self.search_component(search_term)
-                    
-                    if results and len(results) > 0:
-                        # Prendre le premier résultat
-                        component = results[0]
-                        
-                        # Obtenir plus de détails
-                        component_details = self.get_component_details(component['link'])
-                        
-                        # Utiliser les détails du meilleur prix
-                        if component_details['best_deal']:
-                            component['price'] = component_details['best_deal']['price']
-                            component['merchant'] = component_details['best_deal']['merchant']
-                            component['buy_link'] = component_details['best_deal']['link']
-                        
-                        if component_details['image_url']:
-                            component['image_url'] = component_details['image_url']
-                        
-                        # Ajouter comme composant alternatif
-                        config.add_alternative_component(category, component)
-                    else:
-                        # Créer un composant alternatif "virtuel"
-                        debug_print(f"Aucun résultat pour l'alternative {category}: {search_term}, création d'un composant virtuel", level="warning")
-                        virtual_component = {
-                            'name': f"{search_term} (non trouvé)",
-                            'price': "N/A",
-                            'link': "",
-                            'merchant': "N/A",
-                            'buy_link': "",
-                            'image_url': ""
-                        }
-                        config.add_alternative_component(category, virtual_component)
+        Returns:
+            PCConfiguration: La configuration PC créée
+        """
+        primary_components, alternative_components, game_name, game_uuid = create_config_from_game_requirements(
+            json_path, use_recommended)
         
-        debug_print(f"Configuration {specs_type} créée: {config.name}", level="success")
-        debug_print(f"UUID du jeu: {config.game_uuid}", level="success")
-        debug_print(f"Prix total des composants principaux: {config.get_total_price()}", level="success")
+        known = previous_config.resolved_lookups()
+        stats = {"reused": 0, "searched": 0}
         
+        def resolve(search_term):
+            key = normalize_search_term(search_term)
+            if key in known:
+                stats["reused"] += 1
+                debug_print(f"Composant repris de la configuration précédente: {search_term}", level="debug")
+                return copy.deepcopy(known[key])
+            stats["searched"] += 1
+            component = self.resolve_component(search_term)
+            if component:
+                known[key] = component
+            return component
+        
+        config = assemble_configuration(
+            game_name, game_uuid, use_recommended,
+            primary_components, alternative_components,
+            resolve, include_alternatives=include_alternatives
+        )
+        debug_print(f"Recalcul incrémental: {stats['searched']} recherches, {stats['reused']} composants repris", level="info")
         return config
     
+    def resolve_component(self, search_term):
+        """
+        Recherche un composant et complète ses informations avec sa page produit
+        
+        Args:
+            search_term (str): Terme de recherche (ex: "GTX 1060")
+            
+        Returns:
+            dict: Le premier résultat avec prix, marchand, lien d'achat et image, ou None si aucun résultat
+        """
+        results = self.search_component(search_term)
+        
+        if not results:
+            return None
+        
+        # Prendre le premier résultat
+        component = results[0]
+        
+        # Obtenir plus de détails (prix et marchands)
+        component_details = self.get_component_details(component['link'])
+        
+        # Utiliser les détails du meilleur prix
+        if component_details['best_deal']:
+            component['price'] = component_details['best_deal']['price']
+            component['merchant'] = component_details['best_deal']['merchant']
+            component['buy_link'] = component_details['best_deal']['link']
+        
+        if component_details['image_url']:
+            component['image_url'] = component_details['image_url']
+        
+        # Toutes les offres relevées, pour l'optimisation du budget sans nouvelle visite
+        component['merchant_options'] = component_details['merchant_options']
+        
+        return component
+    
     #-------------------------------------------
     
     def search_component(self, query):
@@ -343,9 +433,15 @@ class PCPartPickerScraper:
         Returns:
             list: Liste de dictionnaires contenant les résultats de recherche
         """
+        if self.network_capture:
+            results = self._search_component_captured(query)
+            if results is not None:
+                return results
+            debug_print("Capture réseau impossible, recherche par l'interface", level="warning")
+        
         # Accéder à la page d'accueil
         debug_print(f"Accès à la page {self.base_url}", level="fetch")
-        self.driver.get(self.base_url)
+        self.browser.get(self.base_url)
         
         try:
             # Gérer les éventuels popups de cookies ou autres notifications
@@ -388,8 +484,46 @@ class PCPartPickerScraper:
             debug_print(f"Erreur lors de la recherche de composants: {e}", level="error")
             return []
 
+    def _search_component_captured(self, query):
+        """
+        Recherche un composant en lisant directement le HTML de la page de résultats capturé
+        
+        Returns:
+            list: Résultats de recherche, ou None si la capture a échoué
+        """
+        url = urljoin(self.base_url, "/search/?" + urlencode({"q": query}))
+        debug_print(f"Recherche de: '{query}' (capture réseau: {url})", level="fetch")
+        response = capture_response(self.browser, url)
+        if response is None or not response.ok:
+            return None
+        try:
+            results = self._parse_search_results(response)
+        except Exception as e:
+            debug_print(f"Erreur lors de l'analyse des résultats capturés: {e}", level="warning")
+            return None
+        debug_print(f"Total de {len(results)} résultats extraits", level="success")
+        return results
+    
+    def _parse_search_results(self, response):
+        """Extrait les résultats de recherche d'une réponse HTML capturée (même structure que le DOM)"""
+        results = []
+        for element in response.soup().select(".search-results__pageContent ul.list-unstyled li"):
+            name_element = element.select_one(".search_results--link a")
+            if name_element is None:
+                continue
+            price_element = element.select_one(".search_results--price a")
+            results.append({
+                "name": name_element.get_text(" ", strip=True),
+                "link": urljoin(response.url, name_element.get("href", "")),
+                "price": self._normalize_price(price_element.get_text(strip=True)) if price_element else "N/A"
+            })
+        return results
+    
     def _handle_popups(self):
         """Gère les popups éventuels comme les avertissements de cookies"""
+        # Bandeau déjà traité avec ce profil : inutile d'attendre GLOBAL_WAIT pour rien
+        if self.browser.has_consent("pcpartpicker"):
+            return
         try:
             debug_print("Tentative de gestion du popup de cookies", level="info")
             # Cibler spécifiquement le bouton "Allow" dans la popup de cookies
@@ -399,10 +533,13 @@ class PCPartPickerScraper:
             debug_print("Bouton 'Allow' de cookies trouvé", level="debug")
             cookie_button.click()
             debug_print("Popup de cookies accepté avec succès", level="success")
+            self.browser.remember_consent("pcpartpicker")
         except Exception as e:
             # Pas de popup ou l'élément est différent, on continue
             debug_print(f"Aucun popup de cookies détecté ou problème: {e}", level="debug")
-            pass  
+            # Pas de bandeau affiché : le cookie de consentement est déjà présent
+            if self.driver.get_cookie("cookieconsent_status"):
+                self.browser.remember_consent("pcpartpicker")
     
     def _extract_search_results(self):
         """Extrait les détails des résultats de recherche"""
@@ -469,11 +606,26 @@ class PCPartPickerScraper:
                 "image_url": ""
             }
         
-        self.driver.get(component_url)
+        if self.network_capture:
+            details = self._component_details_captured(component_url)
+            if details is not None:
+                record_prices(component_url, details["merchant_options"])
+                return details
+            debug_print("Capture réseau sans résultat, extraction depuis la page rendue", level="warning")
+        
+        self.browser.get(component_url)
         
         # Augmenter le temps d'attente pour le chargement des images
         time.sleep(2)
         
+        # Page inchangée depuis la dernière visite : l'extraction précédente est réutilisée telle quelle
+        digest = region_hash(self.driver, DETAILS_REGION)
+        cached = cached_extraction("pcpartpicker.details", component_url, digest)
+        if cached is not None:
+            debug_print("Page produit inchangée, extraction précédente réutilisée", level="debug")
+            record_prices(component_url, cached["merchant_options"])
+            return cached
+        
         details = {
             "price": "N/A",  # Valeur par défaut "N/A" au lieu de None
             "best_deal": None,
@@ -570,6 +722,9 @@ class PCPartPickerScraper:
                     except Exception as e:
                         debug_print(f"Erreur lors de l'extraction d'un marchand: {e}", level="warning")
                 
+                # Conserver toutes les offres observées dans l'historique des prix
+                record_prices(component_url, details["merchant_options"])
+                
             except Exception as e:
                 debug_print(f"Erreur lors de l'extraction des prix: {e}", level="error")
                 # Fallback: essayer d'extraire seulement le prix principal
@@ -584,9 +739,72 @@ class PCPartPickerScraper:
         except Exception as e:
             debug_print(f"Erreur lors de l'extraction des détails du composant: {e}", level="error")
         
+        # Une extraction vide (page mal chargée) n'est pas conservée
+        if details["merchant_options"] or details["image_url"]:
+            store_extraction("pcpartpicker.details", component_url, digest, details)
+        
         return details
 
 
+    def _component_details_captured(self, component_url):
+        """
+        Extrait prix, marchands et image du HTML de la page produit capturé, sans attendre le rendu
+        
+        Returns:
+            dict: Détails du composant, ou None si la capture a échoué ou ne contient ni prix ni image
+        """
+        response = capture_response(self.browser, component_url)
+        if response is None or not response.ok:
+            return None
+        try:
+            details = self._parse_component_details(response)
+        except Exception as e:
+            debug_print(f"Erreur lors de l'analyse de la page produit capturée: {e}", level="warning")
+            return None
+        if not details["merchant_options"] and not details["image_url"]:
+            return None
+        return details
+    
+    def _parse_component_details(self, response):
+        """Extrait les détails d'une page produit capturée (mêmes sélecteurs que l'extraction depuis le DOM)"""
+        soup = response.soup()
+        details = {
+            "price": "N/A",
+            "best_deal": None,
+            "merchant_options": [],
+            "availability": "N/A",
+            "image_url": ""
+        }
+        
+        # Image principale, puis miniatures, puis n'importe quelle image de produit
+        image_selectors = ["#pp_main_product_image", ".product__image-2024 img", ".product__image img",
+                           ".product__image-2024-thumbnails img", ".product__image-2024-mobile-list img"]
+        images = [soup.select_one(selector) for selector in image_selectors]
+        images += [img for img in soup.select("img[src]") if "product" in img["src"].lower() or "static" in img["src"].lower()]
+        for img in images:
+            if img is not None and img.get("src"):
+                details["image_url"] = urljoin(response.url, img["src"])
+                break
+        
+        for row in soup.select("#prices table tbody tr:not(.tr--noBorder)"):
+            logo = row.select_one(".td__logo img")
+            price_element = row.select_one(".td__finalPrice a")
+            if logo is None or price_element is None:
+                continue
+            merchant_info = {
+                "merchant": logo.get("alt", ""),
+                "price": self._normalize_price(price_element.get_text(strip=True)),
+                "link": urljoin(response.url, price_element.get("href", "")),
+            }
+            details["merchant_options"].append(merchant_info)
+        
+        # Le premier marchand est considéré comme la meilleure offre
+        if details["merchant_options"]:
+            details["best_deal"] = details["merchant_options"][0]
+            details["price"] = details["best_deal"]["price"]
+            debug_print(f"Meilleure offre trouvée: {details['price']} chez {details['best_deal']['merchant']}", level="success")
+        return details
+
     def _normalize_price(self, price_text):
         """
         Normalise le format du prix de '€114.90+' vers '114,90€'
@@ -616,11 +834,103 @@ class PCPartPickerScraper:
 
     def close(self):
         """Ferme le navigateur"""
-        if self.driver:
+        if self.browser.is_running:
             debug_print("Fermeture du navigateur...", level="info")
-            self.driver.quit()
+            self.browser.quit()
             debug_print("Navigateur fermé", level="success")
              
+def normalize_search_term(search_term):
+    """
+    Forme canonique d'un terme de recherche, pour reconnaître deux recherches identiques
+    
+    Args:
+        search_term (str): Terme de recherche (ex: " GTX  1060")
+        
+    Returns:
+        str: Terme en minuscules aux espaces normalisés (ex: "gtx 1060")
+    """
+    return " ".join(str(search_term).lower().split())
+
+def virtual_component(search_term):
+    """
+    Crée un composant "virtuel" pour garantir que tous les composants sont inclus même sans résultats
+    
+    Args:
+        search_term (str): Terme de recherche sans résultat
+        
+    Returns:
+        dict: Composant sans prix ni lien
+    """
+    return {
+        'name': f"{search_term} (non trouvé)",
+        'price': "N/A",
+        'link': "",
+        'merchant': "N/A",
+        'buy_link': "",
+        'image_url': ""
+    }
+
+def assemble_configuration(game_name, game_uuid, use_recommended, primary_components, alternative_components,
+                           resolve, include_alternatives=False):
+    """
+    Assemble une configuration PC à partir des termes de recherche d'un jeu
+    
+    Args:
+        game_name (str): Nom du jeu
+        game_uuid (str): UUID du jeu pour la traçabilité
+        use_recommended (bool): Si True, il s'agit de la configuration recommandée
+        primary_components (dict): Catégorie -> terme de recherche principal
+        alternative_components (dict): Catégorie -> liste de termes alternatifs
+        resolve (callable): Fonction terme de recherche -> composant (dict) ou None
+        include_alternatives (bool): Si True, inclut les composants alternatifs
+        
+    Les catégories à faible diversité (OS, RAM, stockage) sont d'abord cherchées dans
+    le catalogue statique ; resolve n'est appelé qu'en cas d'absence.
+        
+    Returns:
+        PCConfiguration: La configuration PC créée
+    """
+    specs_type = "recommandée" if use_recommended else "minimale"
+    config_name = f"Config {specs_type} pour {game_name}"
+    
+    # Créer la configuration avec UUID et composants principaux
+    config = PCConfiguration(name=config_name, game_uuid=game_uuid, game_name=game_name, is_recommended=use_recommended)
+    
+    # Ajouter les composants principaux
+    for category, search_term in primary_components.items():
+        debug_print(f"Recherche de composant principal {category}: {search_term}", level="info")
+        component = catalog_resolve(category, search_term, resolve)
+        
+        if component:
+            config.add_component(category, component, search_term)
+        else:
+            debug_print(f"Aucun résultat pour {category}: {search_term}, création d'un composant virtuel", level="warning")
+            config.add_component(category, virtual_component(search_term), search_term)
+    
+    # Ajouter les composants alternatifs uniquement si demandé
+    if include_alternatives:
+        debug_print("Ajout des composants alternatifs à la configuration", level="info")
+        for category, search_terms in alternative_components.items():
+            for search_term in search_terms:
+                debug_print(f"Recherche de composant alternatif {category}: {search_term}", level="info")
+                component = resolve(search_term)
+                
+                if component:
+                    config.add_alternative_component(category, component, search_term)
+                else:
+                    debug_print(f"Aucun résultat pour l'alternative {category}: {search_term}, création d'un composant virtuel", level="warning")
+                    config.add_alternative_component(category, virtual_component(search_term), search_term)
+    
+    # Mettre en cache les images en arrière-plan pour l'affichage des résultats
+    prefetch(component.get('image_url') for component in config.components.values())
+    prefetch(alt.get('image_url') for alts in config.alternative_components.values() for alt in alts)
+    
+    debug_print(f"Configuration {specs_type} créée: {config.name}", level="success")
+    debug_print(f"UUID du jeu: {config.game_uuid}", level="success")
+    debug_print(f"Prix total des composants principaux: {config.get_total_price()}", level="success")
+    
+    return config
+
 def create_config_from_game_requirements(json_path, use_recommended=True):
     """
     Crée une configuration PC basée sur les spécifications d'un jeu
@@ -703,11 +1013,14 @@ def create_config_from_game_requirements(json_path, use_recommended=True):
         # Stockage
         if "Storage" in specs:
             storage = specs["Storage"]
+            # Capacité avec son unité ("1 TB" -> "1TB") : sans elle, 1 To serait pris pour 1 Go
+            size = re.search(r"(\d+(?:[.,]\d+)?)\s*(TB|GB|To|Go)?", storage, re.IGNORECASE)
+            size = f"{size.group(1)}{(size.group(2) or '').upper().replace('O', 'B')}" if size else "1TB"
             # Déterminer le type de stockage (SSD/HDD)
             if "SSD" in storage or "SSD" in specs.get("Additional Notes", ""):
-                primary_components["SSD"] = f"SSD {storage.split()[0]}" if any(char.isdigit() for char in storage) else "SSD 1TB"
+                primary_components["SSD"] = f"SSD {size}"
             else:
-                primary_components["HDD"] = f"HDD {storage.split()[0]}" if any(char.isdigit() for char in storage) else "HDD 1TB"
+                primary_components["HDD"] = f"HDD {size}"
         
         # Système d'exploitation
         if "OS" in specs:
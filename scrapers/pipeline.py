@@ -0,0 +1,217 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.instant_gaming import InstantGaming
+from scrapers.pcpartpicker import PCPartPickerScraper
+from scrapers.batch_planner import plan_batch, run_batch
+from utils.debug_color import debug_print
+from utils.game_records import find_game_record
+from utils.memory_diagnostics import checkpoint
+from utils.profiling import start_profiler
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Dossier des jeux et configurations (GAMECONFIG_DATA_DIR pour un autre emplacement)
+DATA_DIR = os.environ.get("GAMECONFIG_DATA_DIR", os.path.join(PROJECT_ROOT, "data"))
+
+class PipelineError(Exception):
+    """Erreur d'une étape du flux de génération de configuration"""
+    pass
+
+def sanitize_game_name(game_name):
+    """
+    Nettoie le nom d'un jeu pour l'utiliser dans un nom de fichier
+
+    Args:
+        game_name (str): Nom du jeu tel qu'extrait d'Instant Gaming
+
+    Returns:
+        str: Nom nettoyé (ex: 'Cyberpunk 2077' -> 'cyberpunk_2077')
+    """
+    return game_name.replace(":", "").replace(" ", "_").replace("/", "_").lower()
+
+def _report_browser_usage(on_browser_usage, site, browser):
+    # Appelée après la fermeture du navigateur : la consommation couvre toute la session
+    if on_browser_usage is not None and browser is not None:
+        on_browser_usage(site, browser.resource_usage())
+
+def fetch_game_requirements(game_name, headless=True, on_warning=None, on_browser_usage=None):
+    """
+    Phase 1 : recherche le jeu sur Instant Gaming et extrait ses configurations requises
+
+    Args:
+        game_name (str): Nom du jeu à rechercher
+        headless (bool): Lance Chrome sans interface
+        on_warning (callable): Appelée avec un message pour les problèmes non bloquants
+        on_browser_usage (callable): Appelée avec ("instant_gaming", consommation de Chrome) si un navigateur a été lancé
+
+    Returns:
+        tuple: (données du jeu, chemin du fichier JSON enregistré)
+
+    Raises:
+        PipelineError: Si une étape bloquante échoue
+    """
+    # Fiche locale récente (crawler du catalogue ou recherche précédente) : aucun navigateur à lancer
+    local_path = find_game_record(game_name)
+    if local_path:
+        with open(local_path, "r", encoding="utf-8") as f:
+            game_data = json.load(f)
+        debug_print(f"Spécifications de {game_name} lues depuis la base locale: {local_path}", level="info")
+        return game_data, local_path
+
+    ig_scraper = InstantGaming(headless=headless, game_name=game_name)
+    try:
+        # Le navigateur est fermé à la fin de cette phase, même en cas d'erreur
+        with ig_scraper:
+            # Chemin rapide (deux chargements de page), puis parcours de l'interface en secours
+            if not ig_scraper.open_first_result_direct():
+                if not ig_scraper.access_site():
+                    raise PipelineError("Impossible d'accéder au site Instant Gaming.")
+
+                if not ig_scraper.accept_cookies() and on_warning:
+                    on_warning("Problème avec l'acceptation des cookies, mais on continue...")
+
+                if not ig_scraper.search_game():
+                    raise PipelineError("Impossible de rechercher le jeu.")
+
+                if not ig_scraper.click_first_result():
+                    raise PipelineError("Impossible de sélectionner le jeu.")
+
+            game_data = ig_scraper.extract_system_requirements()
+            if not game_data or not ig_scraper.saved_json_path:
+                raise PipelineError("Impossible d'extraire les spécifications du jeu.")
+
+            return game_data, ig_scraper.saved_json_path
+    finally:
+        _report_browser_usage(on_browser_usage, "instant_gaming", ig_scraper.browser)
+
+def generate_configuration(json_path, use_recommended=True, include_alternatives=False, headless=True, previous_config=None,
+                           on_browser_usage=None):
+    """
+    Phase 2 : construit la configuration PC correspondant aux spécifications du jeu
+
+    Args:
+        json_path (str): Chemin du fichier JSON des spécifications du jeu
+        use_recommended (bool): Si True, utilise les spécifications recommandées
+        include_alternatives (bool): Si True, inclut les composants alternatifs
+        headless (bool): Lance Chrome sans interface
+        previous_config (PCConfiguration): Configuration déjà construite pour ce jeu, dont les
+            composants aux termes de recherche identiques sont repris sans nouvelle recherche
+        on_browser_usage (callable): Appelée avec ("pcpartpicker", consommation de Chrome) à la fermeture du navigateur
+
+    Returns:
+        PCConfiguration: La configuration créée
+    """
+    pp_scraper = PCPartPickerScraper(headless=headless)
+    try:
+        with pp_scraper:
+            if previous_config is not None:
+                return pp_scraper.rebuild_configuration(previous_config, json_path, use_recommended, include_alternatives)
+            if use_recommended:
+                return pp_scraper.create_recommended_configuration(json_path, include_alternatives=include_alternatives)
+            return pp_scraper.create_minimal_configuration(json_path, include_alternatives=include_alternatives)
+    finally:
+        _report_browser_usage(on_browser_usage, "pcpartpicker", pp_scraper.browser)
+
+def generate_both_configurations(json_path, include_alternatives=False, headless=True, previous_config=None,
+                                 on_browser_usage=None):
+    """
+    Phase 2 en un seul passage : configurations minimale et recommandée d'un jeu
+
+    Les deux blocs de spécifications sont lus ensemble ; chaque recherche distincte de
+    l'union des deux (OS, RAM, stockage souvent communs) n'est effectuée qu'une fois.
+
+    Args:
+        json_path (str): Chemin du fichier JSON des spécifications du jeu
+        include_alternatives (bool): Si True, inclut les composants alternatifs
+        headless (bool): Lance Chrome sans interface
+        previous_config (PCConfiguration): Configuration déjà construite pour ce jeu, dont les
+            composants aux termes de recherche identiques sont repris sans nouvelle recherche
+        on_browser_usage (callable): Appelée avec ("pcpartpicker", consommation de Chrome) à la fermeture du navigateur
+
+    Returns:
+        tuple: (configuration minimale, configuration recommandée)
+    """
+    plan = plan_batch([json_path], include_alternatives=include_alternatives, both_profiles=True)
+    known = previous_config.resolved_lookups() if previous_config is not None else None
+
+    pp_scraper = PCPartPickerScraper(headless=headless)
+    try:
+        with pp_scraper:
+            minimal_config, recommended_config = run_batch(plan, scraper=pp_scraper, known=known)
+    finally:
+        _report_browser_usage(on_browser_usage, "pcpartpicker", pp_scraper.browser)
+    return minimal_config, recommended_config
+
+def configuration_path(game_name, use_recommended, include_alternatives, game_uuid):
+    """
+    Construit le chemin de sauvegarde d'une configuration dans data/pcpartpicker
+
+    Returns:
+        str: Chemin du fichier JSON (ex: 'data/pcpartpicker/gta_v_rec_<uuid>.json')
+    """
+    config_type_abbrev = "rec" if use_recommended else "min"
+    alt_suffix = "_avec_alternatives" if include_alternatives else ""
+    data_dir = os.path.join(DATA_DIR, "pcpartpicker")
+    os.makedirs(data_dir, exist_ok=True)
+    return os.path.join(data_dir, f"{sanitize_game_name(game_name)}_{config_type_abbrev}{alt_suffix}_{game_uuid}.json")
+
+def run_pipeline(game_name, use_recommended=True, include_alternatives=False, headless=True, profile=None,
+                 both_profiles=False):
+    """
+    Exécute le flux complet : Instant Gaming, PCPartPicker puis sauvegarde dans data/
+
+    Args:
+        profile (bool): Profile les deux phases (par défaut : variable GAMECONFIG_PROFILE)
+        both_profiles (bool): Produit les configurations minimale et recommandée en un seul passage
+            (use_recommended est alors ignoré)
+
+    Returns:
+        dict: Résumé du traitement (jeu, fichiers produits, prix total, consommation de Chrome par site,
+            profil éventuel). Avec both_profiles, config_json et total_price sont ceux de la
+            configuration recommandée et "configs" détaille les deux.
+    """
+    profiler = start_profiler(profile)
+    browser_usage = {}
+
+    with profiler.phase("instant_gaming"):
+        game_data, game_json_path = fetch_game_requirements(game_name, headless=headless, on_browser_usage=browser_usage.__setitem__)
+    checkpoint("pipeline.instant_gaming")
+    debug_print(f"Spécifications de '{game_data['game']}' enregistrées: {game_json_path}", level="success")
+
+    with profiler.phase("pcpartpicker"):
+        if both_profiles:
+            pc_configs = generate_both_configurations(
+                game_json_path, include_alternatives, headless, on_browser_usage=browser_usage.__setitem__
+            )
+        else:
+            pc_configs = [generate_configuration(
+                game_json_path, use_recommended, include_alternatives, headless, on_browser_usage=browser_usage.__setitem__
+            )]
+    checkpoint("pipeline.pcpartpicker")
+
+    configs = {}
+    for pc_config in pc_configs:
+        config_json_path = configuration_path(game_data["game"], pc_config.is_recommended, include_alternatives, pc_config.game_uuid)
+        pc_config.save_to_json(config_json_path)
+        configs["rec" if pc_config.is_recommended else "min"] = {
+            "config_json": config_json_path,
+            "total_price": pc_config.get_total_price(),
+        }
+
+    summary = {
+        "game": game_data["game"],
+        "game_json": game_json_path,
+        "config_json": config_json_path,
+        "total_price": pc_config.get_total_price(),
+        "browser_usage": browser_usage,
+    }
+    if both_profiles:
+        summary["configs"] = configs
+    profile_files = profiler.save(config_json_path)
+    if profile_files:
+        summary["profile"] = profile_files
+    return summary
@@ -0,0 +1,200 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scrapers.pcpartpicker import PCPartPickerScraper
+from utils.atomic_io import atomic_write_json, file_lock
+from utils.debug_color import debug_print
+from utils.prices import parse_price
+from utils.search_index import index_document
+from utils.storage import mirror_configuration
+
+CONFIG_DIR = os.path.join(
+    os.environ.get("GAMECONFIG_DATA_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")),
+    "pcpartpicker"
+)
+
+# Navigateurs ouverts en parallèle
+WORKERS = int(os.environ.get("GAMECONFIG_REPRICE_WORKERS", 2))
+
+# Délai minimum (secondes) entre deux chargements de page, tous navigateurs confondus
+REQUEST_INTERVAL = float(os.environ.get("GAMECONFIG_REPRICE_INTERVAL", 2))
+
+class RateLimiter:
+    """Espace les chargements de page partagés entre plusieurs threads"""
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def _iter_components(data):
+    yield from data.get("components", {}).values()
+    for alternatives in data.get("alternative_components", {}).values():
+        yield from alternatives
+
+def collect_links(config_paths):
+    """
+    Liens produit distincts utilisés par les configurations
+
+    Args:
+        config_paths (list): Fichiers JSON de configurations
+
+    Returns:
+        dict: Lien -> liste des fichiers qui l'utilisent
+    """
+    links = {}
+    for path in config_paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            debug_print(f"Configuration illisible {path}: {e}", level="warning")
+            continue
+        for component in _iter_components(data):
+            # Les composants virtuels ("non trouvé") n'ont pas de lien
+            if not component.get("link"):
+                continue
+            paths = links.setdefault(component["link"], [])
+            if path not in paths:
+                paths.append(path)
+    return links
+
+def fetch_details(links, workers=WORKERS, min_interval=REQUEST_INTERVAL, headless=True):
+    """
+    Charge la page produit de chaque lien, une seule fois, sur plusieurs navigateurs en parallèle
+
+    Args:
+        links (iterable): Liens produit PCPartPicker
+        workers (int): Nombre de navigateurs
+        min_interval (float): Délai minimum entre deux chargements de page
+        headless (bool): Lance Chrome sans interface
+
+    Returns:
+        dict: Lien -> détails renvoyés par get_component_details (None en cas d'échec)
+    """
+    links = list(links)
+    limiter = RateLimiter(min_interval)
+    local = threading.local()
+    scrapers = []
+    scrapers_lock = threading.Lock()
+
+    def fetch(link):
+        try:
+            # Un navigateur par thread, créé à la première page ; s'il ne démarre pas, seule
+            # cette page est perdue et le thread réessaiera à la suivante
+            if not hasattr(local, "scraper"):
+                local.scraper = PCPartPickerScraper(headless=headless)
+                with scrapers_lock:
+                    scrapers.append(local.scraper)
+            limiter.wait()
+            return link, local.scraper.get_component_details(link)
+        except Exception as e:
+            debug_print(f"Échec du chargement de {link}: {e}", level="warning")
+            return link, None
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(links) or 1))) as executor:
+            return dict(executor.map(fetch, links))
+    finally:
+        for scraper in scrapers:
+            scraper.close()
+
+def _total_price(components):
+    total = sum(parse_price(component.get("price")) or 0.0 for component in components.values())
+    return f"{total:.2f}€".replace('.', ',')
+
+def apply_prices(path, details):
+    """
+    Met à jour les prix d'une configuration sauvegardée, en place
+
+    Args:
+        path (str): Fichier JSON de la configuration
+        details (dict): Lien -> détails renvoyés par get_component_details
+
+    Returns:
+        int: Nombre de composants dont l'offre a changé
+    """
+    # Lecture-modification-écriture protégée contre une sauvegarde concurrente du même fichier
+    with file_lock(path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        changed = 0
+        for component in _iter_components(data):
+            best_deal = (details.get(component.get("link")) or {}).get("best_deal")
+            if not best_deal:
+                continue
+            update = {"price": best_deal["price"], "merchant": best_deal["merchant"], "buy_link": best_deal["link"],
+                      "merchant_options": details[component["link"]]["merchant_options"]}
+            if any(component.get(key) != value for key, value in update.items()):
+                component.update(update)
+                changed += 1
+
+        data["total_price"] = _total_price(data.get("components", {}))
+        data["priced_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        atomic_write_json(path, data, indent=2)
+
+    index_document(path, data)
+    mirror_configuration(path, data)
+    return changed
+
+def reprice(config_paths=None, workers=WORKERS, min_interval=REQUEST_INTERVAL, headless=True):
+    """
+    Rafraîchit les prix de configurations sauvegardées sans refaire aucune recherche
+
+    Args:
+        config_paths (list): Fichiers à mettre à jour (par défaut : toutes les configurations)
+        workers (int): Nombre de navigateurs en parallèle
+        min_interval (float): Délai minimum entre deux chargements de page
+        headless (bool): Lance Chrome sans interface
+
+    Returns:
+        dict: Statistiques (configurations, liens, pages chargées, composants mis à jour)
+    """
+    config_paths = config_paths or sorted(glob.glob(os.path.join(CONFIG_DIR, "*.json")))
+    links = collect_links(config_paths)
+    debug_print(f"{len(config_paths)} configurations, {len(links)} produits distincts", level="info")
+
+    details = fetch_details(links, workers=workers, min_interval=min_interval, headless=headless)
+
+    updated = 0
+    for path in sorted({path for paths in links.values() for path in paths}):
+        try:
+            updated += apply_prices(path, details)
+        except Exception as e:
+            debug_print(f"Impossible de mettre à jour {path}: {e}", level="error")
+
+    stats = {
+        "configurations": len(config_paths),
+        "links": len(links),
+        "fetched": sum(1 for value in details.values() if value),
+        "updated_components": updated,
+    }
+    debug_print(f"Prix rafraîchis: {stats}", level="success")
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rafraîchit les prix des configurations sauvegardées")
+    parser.add_argument("config_paths", nargs="*", help="Configurations à mettre à jour (par défaut: tout data/pcpartpicker)")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="Navigateurs en parallèle")
+    parser.add_argument("--interval", type=float, default=REQUEST_INTERVAL, help="Délai minimum entre deux pages (secondes)")
+    parser.add_argument("--no-headless", action="store_true", help="Affiche les navigateurs")
+    args = parser.parse_args()
+
+    reprice(args.config_paths, workers=args.workers, min_interval=args.interval, headless=not args.no_headless)
@@ -0,0 +1,249 @@
+import argparse
+import copy
+import json
+import os
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.atomic_io import atomic_write_json, file_lock
+
+CATALOG_PATH = os.environ.get(
+    "GAMECONFIG_CATALOG_PATH",
+    os.path.join(Path(__file__).parent.parent, "data", "static_catalog.json")
+)
+
+# Durée de validité d'une entrée avant qu'elle soit recherchée à nouveau sur PCPartPicker
+MAX_AGE_HOURS = float(os.environ.get("GAMECONFIG_CATALOG_MAX_AGE_HOURS", 24 * 7))
+
+# Tailles du commerce : une exigence est arrondie à la taille disponible immédiatement supérieure
+RAM_SIZES_GB = [4, 8, 16, 32, 64, 128]
+STORAGE_SIZES_GB = {
+    "SSD": [250, 500, 1000, 2000, 4000],
+    "HDD": [500, 1000, 2000, 4000, 8000],
+}
+
+# Entrées résolues par défaut lors d'un rafraîchissement complet
+DEFAULT_KEYS = [
+    "os:windows-10", "os:windows-11",
+    "ram:8", "ram:16", "ram:32",
+    "ssd:500", "ssd:1000",
+    "hdd:1000",
+]
+
+_cache = {"mtime": None, "entries": {}}
+
+def _snap(value, sizes):
+    for size in sizes:
+        if value <= size:
+            return size
+    return sizes[-1]
+
+def _size_label(size_gb):
+    return f"{size_gb // 1000}TB" if size_gb >= 1000 and size_gb % 1000 == 0 else f"{size_gb}GB"
+
+def catalog_key(category, search_term):
+    """
+    Clé du catalogue correspondant à une exigence (OS, RAM, stockage)
+
+    Args:
+        category (str): Catégorie du composant (OS, RAM, SSD, HDD)
+        search_term (str): Terme issu des spécifications (ex: "Windows 10 64-bit", "8 DDR", "SSD 50")
+
+    Returns:
+        str: Clé normalisée (ex: "os:windows-10", "ram:8", "ssd:250") ou None si hors catalogue
+    """
+    text = " ".join(str(search_term).lower().split())
+
+    if category == "OS":
+        match = re.search(r"windows\W*(11|10|8\.1|8|7|vista|xp)?", text)
+        if not match:
+            return None
+        # Les versions antérieures à Windows 10 ne sont plus vendues : Windows 10 les couvre
+        return "os:windows-11" if match.group(1) == "11" else "os:windows-10"
+
+    if category == "RAM":
+        match = re.search(r"(\d+(?:[.,]\d+)?)\s*(mb|mo)?", text)
+        if not match:
+            return None
+        size = float(match.group(1).replace(",", "."))
+        if match.group(2):
+            size /= 1024
+        return f"ram:{_snap(size, RAM_SIZES_GB)}"
+
+    if category in STORAGE_SIZES_GB:
+        match = re.search(r"(\d+(?:[.,]\d+)?)\s*(tb|to|gb|go)?", text)
+        if not match:
+            return None
+        size = float(match.group(1).replace(",", "."))
+        # Sans unité, une valeur sous 10 ne peut être qu'en To (aucun disque de moins de 10 Go)
+        if match.group(2) in ("tb", "to") or (match.group(2) is None and size < 10):
+            size *= 1000
+        return f"{category.lower()}:{_snap(size, STORAGE_SIZES_GB[category])}"
+
+    return None
+
+def catalog_query(key):
+    """
+    Terme de recherche PCPartPicker canonique d'une clé du catalogue
+
+    Args:
+        key (str): Clé produite par catalog_key
+
+    Returns:
+        str: Terme de recherche (ex: "Windows 10 Home", "16GB DDR4", "SSD 500GB")
+    """
+    kind, value = key.split(":", 1)
+    if kind == "os":
+        return "Windows 11 Home" if value == "windows-11" else "Windows 10 Home"
+    if kind == "ram":
+        return f"{value}GB DDR4"
+    return f"{kind.upper()} {_size_label(int(value))}"
+
+def _read_catalog(catalog_path):
+    try:
+        with open(catalog_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        debug_print(f"Catalogue statique illisible, ignoré: {e}", level="warning")
+        return {}
+
+def load_catalog(catalog_path=CATALOG_PATH):
+    """Charge le catalogue (relu uniquement si le fichier a changé depuis le dernier appel)"""
+    try:
+        mtime = os.path.getmtime(catalog_path)
+    except OSError:
+        return {}
+    if _cache["mtime"] != (catalog_path, mtime):
+        _cache["entries"] = _read_catalog(catalog_path)
+        _cache["mtime"] = (catalog_path, mtime)
+    return _cache["entries"]
+
+def _is_fresh(entry, max_age_hours):
+    try:
+        refreshed_at = datetime.fromisoformat(entry["refreshed_at"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return datetime.now(timezone.utc) - refreshed_at < timedelta(hours=max_age_hours)
+
+def store(key, component, catalog_path=CATALOG_PATH):
+    """
+    Enregistre le composant résolu d'une clé du catalogue
+
+    Args:
+        key (str): Clé produite par catalog_key
+        component (dict): Composant résolu (nom, prix, lien, marchand...)
+    """
+    with file_lock(catalog_path):
+        entries = _read_catalog(catalog_path)
+        entries[key] = {
+            "query": catalog_query(key),
+            "component": component,
+            "refreshed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        atomic_write_json(catalog_path, entries)
+
+def lookup(category, search_term, max_age_hours=MAX_AGE_HOURS, catalog_path=CATALOG_PATH):
+    """
+    Cherche une exigence dans le catalogue
+
+    Args:
+        category (str): Catégorie du composant
+        search_term (str): Terme issu des spécifications
+
+    Returns:
+        dict: Copie du composant pré-résolu, ou None si absent, périmé ou hors catalogue
+    """
+    key = catalog_key(category, search_term)
+    if key is None:
+        return None
+    entry = load_catalog(catalog_path).get(key)
+    if entry and entry.get("component") and _is_fresh(entry, max_age_hours):
+        return copy.deepcopy(entry["component"])
+    return None
+
+def catalog_resolve(category, search_term, resolve, catalog_path=CATALOG_PATH):
+    """
+    Résout une exigence via le catalogue, en le complétant en cas d'absence
+
+    Hors catalogue (CPU, GPU...), la recherche est déléguée telle quelle à resolve.
+    Sinon le composant pré-résolu est renvoyé ; s'il manque ou est périmé, le terme
+    canonique est recherché une fois et le résultat est enregistré pour les suivants.
+
+    Args:
+        category (str): Catégorie du composant
+        search_term (str): Terme issu des spécifications
+        resolve (callable): Fonction terme de recherche -> composant (dict) ou None
+
+    Returns:
+        dict: Le composant, ou None si aucun résultat
+    """
+    key = catalog_key(category, search_term)
+    if key is None:
+        return resolve(search_term)
+
+    component = lookup(category, search_term, catalog_path=catalog_path)
+    if component:
+        debug_print(f"Composant {category} trouvé dans le catalogue statique ({key})", level="debug")
+        return component
+
+    component = resolve(catalog_query(key))
+    if component:
+        store(key, component, catalog_path)
+    return component
+
+def refresh(scraper=None, keys=None, force=False, headless=True, catalog_path=CATALOG_PATH):
+    """
+    Rafraîchit les entrées périmées du catalogue
+
+    Args:
+        scraper (PCPartPickerScraper): Scraper existant à réutiliser (un nouveau est créé sinon)
+        keys (list): Clés à rafraîchir (par défaut : entrées existantes et DEFAULT_KEYS)
+        force (bool): Rafraîchit aussi les entrées encore valides
+        headless (bool): Lance Chrome sans interface si un scraper est créé
+
+    Returns:
+        int: Nombre d'entrées mises à jour
+    """
+    entries = _read_catalog(catalog_path)
+    keys = keys or sorted(set(entries) | set(DEFAULT_KEYS))
+    stale = [key for key in keys if force or not _is_fresh(entries.get(key, {}), MAX_AGE_HOURS)]
+    if not stale:
+        debug_print("Catalogue statique à jour", level="info")
+        return 0
+
+    own_scraper = scraper is None
+    if own_scraper:
+        from scrapers.pcpartpicker import PCPartPickerScraper
+        scraper = PCPartPickerScraper(headless=headless)
+
+    updated = 0
+    try:
+        for i, key in enumerate(stale, 1):
+            query = catalog_query(key)
+            debug_print(f"[{i}/{len(stale)}] Rafraîchissement du catalogue: {query}", level="fetch")
+            component = scraper.resolve_component(query)
+            if component:
+                store(key, component, catalog_path)
+                updated += 1
+            else:
+                debug_print(f"Aucun résultat pour {query}, entrée conservée", level="warning")
+    finally:
+        if own_scraper:
+            scraper.close()
+
+    debug_print(f"Catalogue statique: {updated}/{len(stale)} entrées mises à jour", level="success")
+    return updated
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rafraîchit le catalogue statique (OS, RAM, stockage)")
+    parser.add_argument("--force", action="store_true", help="Rafraîchit toutes les entrées, même valides")
+    parser.add_argument("--no-headless", action="store_true", help="Affiche le navigateur")
+    args = parser.parse_args()
+
+    refresh(force=args.force, headless=not args.no_headless)
@@ -0,0 +1,95 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.job_queue import JobQueue
+
+# Baux courts : l'expiration est atteinte en quelques dixièmes de seconde
+LEASE = 0.2
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.db"), lease_seconds=LEASE)
+
+def test_job_leased_by_a_single_worker(queue):
+    job_id = queue.enqueue({"game": "Cyberpunk 2077"})
+    barrier = threading.Barrier(2)
+    leased = {}
+
+    def take(worker_id):
+        barrier.wait()
+        leased[worker_id] = queue.lease(worker_id)
+
+    threads = [threading.Thread(target=take, args=(worker_id,)) for worker_id in ("w1", "w2")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    jobs = [job for job in leased.values() if job is not None]
+    assert len(jobs) == 1
+    assert jobs[0]["id"] == job_id
+    assert jobs[0]["attempts"] == 1
+    assert queue.get(job_id)["worker_id"] in leased
+
+def test_expired_lease_is_leased_again(queue):
+    job_id = queue.enqueue({"game": "Elden Ring"})
+    assert queue.lease("w1")["id"] == job_id
+    assert queue.lease("w2") is None
+
+    time.sleep(LEASE * 1.5)
+    job = queue.lease("w2")
+    assert job["id"] == job_id
+    assert job["attempts"] == 2
+
+    # Le premier worker a perdu son bail : ni heartbeat ni résultat ne sont acceptés
+    assert queue.heartbeat(job_id, "w1") is False
+    queue.complete(job_id, "w1", {"config_json": "w1.json"})
+    assert queue.get(job_id)["status"] == "leased"
+
+    queue.complete(job_id, "w2", {"config_json": "w2.json"})
+    job = queue.get(job_id)
+    assert job["status"] == "done"
+    assert job["result"] == {"config_json": "w2.json"}
+
+def test_heartbeat_keeps_the_lease(queue):
+    job_id = queue.enqueue({"game": "Hades"})
+    queue.lease("w1")
+    for _ in range(3):
+        time.sleep(LEASE / 2)
+        assert queue.heartbeat(job_id, "w1") is True
+    # Plus d'une durée de bail écoulée depuis la réservation, mais le bail a été renouvelé
+    assert queue.lease("w2") is None
+
+def test_expired_lease_without_attempts_left_fails(queue):
+    job_id = queue.enqueue({"game": "Starfield"}, max_attempts=2)
+    queue.lease("w1")
+    time.sleep(LEASE * 1.5)
+    assert queue.lease("w2")["attempts"] == 2
+    time.sleep(LEASE * 1.5)
+
+    assert queue.lease("w3") is None
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert job["error"] == "Bail expiré"
+    assert queue.stats() == {"failed": 1}
+
+def test_fail_retries_until_max_attempts(queue):
+    job_id = queue.enqueue({"game": "Doom"}, max_attempts=2)
+
+    queue.lease("w1")
+    queue.fail(job_id, "w1", "Instant Gaming indisponible")
+    job = queue.get(job_id)
+    assert job["status"] == "pending"
+    assert job["worker_id"] is None
+
+    assert queue.lease("w2")["attempts"] == 2
+    queue.fail(job_id, "w2", "Instant Gaming indisponible")
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert job["error"] == "Instant Gaming indisponible"
+    assert queue.lease("w3") is None
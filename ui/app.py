@@ -4,14 +4,20 @@ import sys
 import json
 import glob
 import time
-from pathlib import Path
 
 # Ajouter le chemin parent pour importer les scrapers
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(parent_dir)
 
-from scrapers.instant_gaming import InstantGaming
-from scrapers.pcpartpicker import PCPartPickerScraper, PCConfiguration
+from utils.image_cache import cached_image
+from utils.memory_diagnostics import checkpoint
+
+# Les scrapers (selenium, webdriver_manager) ne sont importés qu'au lancement d'une génération,
+# pour que l'affichage des pages reste rapide
+
+# Âge maximum (secondes) de la configuration gardée en session pour être réutilisée :
+# au-delà, les prix sont jugés périmés et tous les composants sont recherchés à nouveau
+SESSION_CONFIG_MAX_AGE = float(os.environ.get("GAMECONFIG_SESSION_CONFIG_MAX_AGE", 1800))
 
 # Configuration de la page
 st.set_page_config(
@@ -31,6 +37,104 @@ css_path = os.path.join(os.path.dirname(__file__), "styles", "style.css")
 st.markdown(load_css(css_path), unsafe_allow_html=True)
 
 
+# Affichage d'une configuration générée : résumé, composants puis alternatives éventuelles
+def show_configuration(pc_config, config_label, game_title, include_alternatives):
+    st.markdown(f"<h3>Détails de la configuration {config_label}</h3>", unsafe_allow_html=True)
+
+    # Utiliser un conteneur Streamlit pour les informations générales
+    with st.container():
+        st.markdown(f"""
+        <div class="config-details-container">
+            <h4>{pc_config.name}</h4>
+            <div class="config-summary">
+                <p>Prix total: <span class="config-price">{pc_config.get_total_price()}</span></p>
+                <p>Configuration {config_label} pour {game_title}</p>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Déterminer le nombre de colonnes (3 colonnes par défaut)
+        num_components = len(pc_config.components)
+        num_cols = min(3, max(1, num_components))  # Au moins 1, au plus 3 colonnes
+
+        # Créer des colonnes Streamlit au lieu d'une grille HTML
+        cols = st.columns(num_cols)
+
+        # Distribuer les composants dans les colonnes
+        for i, (category, component) in enumerate(pc_config.components.items()):
+            col_idx = i % num_cols  # Distribution circulaire
+
+            with cols[col_idx]:
+                name = component.get('name', 'N/A')
+                price = component.get('price', 'N/A')
+                image_url = component.get('image_url', '')
+                merchant = component.get('merchant', 'N/A')
+                buy_link = component.get('buy_link', '')
+
+                # Utiliser un conteneur avec bordure pour créer une "carte"
+                with st.container(border=True):
+                    # Catégorie
+                    st.markdown(f"<div class='component-category'>{category}</div>", unsafe_allow_html=True)
+
+                    # Image (miniature locale, placeholder si pas d'image disponible)
+                    st.image(cached_image(image_url), use_container_width=True)
+
+                    # Nom et prix
+                    st.markdown(f"**{name}**")
+                    st.markdown(f"<span class='component-price'>Prix: {price}</span>", unsafe_allow_html=True)
+
+                    # Détails supplémentaires
+                    st.markdown(f"Fournisseur: {merchant}")
+
+                    # Bouton d'achat
+                    if buy_link and price != "N/A":
+                        st.markdown(f"<a href='{buy_link}' target='_blank' class='buy-button'>Acheter</a>", unsafe_allow_html=True)
+
+    # Afficher les composants alternatifs si demandé
+    if include_alternatives and pc_config.alternative_components:
+        st.markdown('<h3 class="alternatives-title">Composants alternatifs</h3>', unsafe_allow_html=True)
+
+        for category, alternatives in pc_config.alternative_components.items():
+            st.markdown(f"<h4>Alternatives pour {category}</h4>", unsafe_allow_html=True)
+
+            # Déterminer le nombre de colonnes pour les alternatives
+            num_alts = len(alternatives)
+            num_alt_cols = min(3, max(1, num_alts))
+
+            # Créer des colonnes pour les alternatives
+            alt_cols = st.columns(num_alt_cols)
+
+            # Distribuer les alternatives dans les colonnes
+            for i, alt in enumerate(alternatives):
+                alt_col_idx = i % num_alt_cols
+
+                with alt_cols[alt_col_idx]:
+                    name = alt.get('name', 'N/A')
+                    price = alt.get('price', 'N/A')
+                    image_url = alt.get('image_url', '')
+                    merchant = alt.get('merchant', 'N/A')
+                    buy_link = alt.get('buy_link', '')
+
+                    # Utiliser un conteneur avec bordure
+                    with st.container(border=True):
+                        # Catégorie
+                        st.markdown(f"<div class='component-category'>{category} (Alternative)</div>", unsafe_allow_html=True)
+
+                        # Image (miniature locale, placeholder si pas d'image disponible)
+                        st.image(cached_image(image_url), use_container_width=True)
+
+                        # Nom et prix
+                        st.markdown(f"**{name}**")
+                        st.markdown(f"<span class='component-price'>Prix: {price}</span>", unsafe_allow_html=True)
+
+                        # Détails supplémentaires
+                        st.markdown(f"Fournisseur: {merchant}")
+
+                        # Bouton d'achat
+                        if buy_link and price != "N/A":
+                            st.markdown(f"<a href='{buy_link}' target='_blank' class='buy-button'>Acheter</a>", unsafe_allow_html=True)
+
+
 # Titre de l'application
 st.markdown('<div class="main-title">🎮 GameConfig Hub</div>', unsafe_allow_html=True)
 
@@ -50,13 +154,15 @@ with st.form(key="config_form"):
     with col1:
         config_type = st.radio(
             "Type de configuration",
-            ["Minimale", "Recommandée"],
+            ["Minimale", "Recommandée", "Les deux"],
             index=1
         )
     
     with col2:
         include_alternatives = st.checkbox("Inclure les composants alternatifs", value=False)
         headless_mode = st.checkbox("Mode sans interface", value=True)
+        # Coché par défaut si GAMECONFIG_PROFILE=1
+        profile_run = st.checkbox("Profiler cette génération", value=os.environ.get("GAMECONFIG_PROFILE", "0") == "1")
     
     submit_config = st.form_submit_button("Générer ma configuration PC")
 
@@ -64,205 +170,113 @@ with st.form(key="config_form"):
         # Phase 1: Recherche du jeu sur Instant Gaming
         status_placeholder = st.empty()
         game_data = None
+        json_path = None
         success = False
         
+        # Import différé du pipeline (charge selenium et le WebDriver)
+        from scrapers.pipeline import (
+            PipelineError, fetch_game_requirements, generate_configuration, generate_both_configurations, configuration_path
+        )
+        from utils.profiling import start_profiler
+        
+        # Profileur inactif (aucun surcoût) si la case n'est pas cochée
+        profiler = start_profiler(profile_run)
+        
         # Premier spinner pour la recherche du jeu
         with st.spinner(f"Recherche de '{game_name}' sur Instant Gaming..."):
             try:
                 # Utiliser le scraper Instant Gaming pour récupérer les données du jeu
-                ig_scraper = InstantGaming(headless=headless_mode, game_name=game_name)
-
-                if not ig_scraper.access_site():
-                    status_placeholder.error("Impossible d'accéder au site Instant Gaming.")
-                else:
-                    success = True
-
-                    if not ig_scraper.accept_cookies():
-                        st.warning("Problème avec l'acceptation des cookies, mais on continue...")
-                
-                    if not ig_scraper.search_game():
-                        status_placeholder.error("Impossible de rechercher le jeu.")
-                        success = False
-                        
-                    if success and not ig_scraper.click_first_result():
-                        status_placeholder.error("Impossible de sélectionner le jeu.")
-                        success = False
-                        
-                    if success:
-                        game_data = ig_scraper.extract_system_requirements()
-                
-                # Fermer le navigateur à la fin de cette phase
-                ig_scraper.quit()
-                
+                # (le navigateur est fermé à la fin de cette phase)
+                with profiler.phase("instant_gaming"):
+                    game_data, json_path = fetch_game_requirements(game_name, headless=headless_mode, on_warning=st.warning)
+                checkpoint("pipeline.instant_gaming")
+                success = True
+            except PipelineError as e:
+                status_placeholder.error(str(e))
             except Exception as e:
                 st.error(f"Une erreur s'est produite lors de la recherche du jeu: {str(e)}")
-                if 'ig_scraper' in locals():
-                    ig_scraper.quit()
         
         # Affichage du résultat de la première phase
         if success and game_data:
             status_placeholder.success(f"✅ Recherche de '{game_name}' terminée avec succès!")
             
             # Phase 2: Création de la configuration PC
-            # Récupérer le chemin du fichier JSON
-            project_root = Path(parent_dir)
-            data_folder = os.path.join(project_root, "data", "instantgaming")
-            
-            # Trouver le fichier le plus récent pour ce jeu
-            json_files = [f for f in os.listdir(data_folder) if f.endswith('.json') and game_data["game"].replace(":", "").replace(" ", "_").replace("/", "_").lower() in f.lower()]
-            
-            if json_files:
-                json_path = os.path.join(data_folder, sorted(json_files)[-1])  # Prendre le plus récent
-                
+            if json_path:
                 # Deuxième spinner pour la génération de configuration
                 config_status = st.empty()
                 
                 # Ce spinner est séparé du premier (pas imbriqué)
                 with st.spinner("Création de la configuration PC en cours..."):
                     try:
-                        pp_scraper = PCPartPickerScraper(headless=headless_mode)
                         use_recommended = config_type == "Recommandée"
-                    
-                        if use_recommended:
-                            pc_config = pp_scraper.create_recommended_configuration(
-                                json_path, 
-                                include_alternatives=include_alternatives
-                            )
-                        else:
-                            pc_config = pp_scraper.create_minimal_configuration(
-                                json_path, 
-                                include_alternatives=include_alternatives
-                            )
                         
-                        # Fermer le navigateur de PCPartPicker
-                        pp_scraper.close()
+                        # Réutiliser la dernière configuration construite pour ce jeu (ex: minimale puis recommandée),
+                        # si elle porte sur les mêmes spécifications et reste récente
+                        previous_config = None
+                        config_key = (json_path, game_data.get("uuid"))
+                        last_built = st.session_state.get("last_built_config")
+                        if (last_built and last_built["key"] == config_key
+                                and time.time() - last_built["built_at"] <= SESSION_CONFIG_MAX_AGE):
+                            previous_config = last_built["config"]
                         
-                        # Message de succès pour la génération de configuration
-                        config_status.success(f"✅ Configuration PC {config_type.lower()} créée avec succès!")
+                        # Le navigateur de PCPartPicker est fermé par generate_configuration
+                        with profiler.phase("pcpartpicker"):
+                            if config_type == "Les deux":
+                                # Un seul passage : chaque recherche commune aux deux profils n'est faite qu'une fois
+                                minimal_config, recommended_config = generate_both_configurations(
+                                    json_path,
+                                    include_alternatives=include_alternatives,
+                                    headless=headless_mode,
+                                    previous_config=previous_config
+                                )
+                                built_configs = [("minimale", minimal_config), ("recommandée", recommended_config)]
+                            else:
+                                pc_config = generate_configuration(
+                                    json_path,
+                                    use_recommended=use_recommended,
+                                    include_alternatives=include_alternatives,
+                                    headless=headless_mode,
+                                    previous_config=previous_config
+                                )
+                                built_configs = [(config_type.lower(), pc_config)]
+                        checkpoint("pipeline.pcpartpicker")
                         
-                        # Sauvegarder la configuration
-                        data_dir = os.path.join(project_root, "data", "pcpartpicker")
-                        os.makedirs(data_dir, exist_ok=True)
+                        # Une seule configuration gardée en session pour limiter la mémoire
+                        st.session_state.last_built_config = {
+                            "key": config_key, "built_at": time.time(), "config": built_configs[-1][1],
+                        }
                         
-                        config_type_abbrev = "rec" if use_recommended else "min"
-                        alt_suffix = "_avec_alternatives" if include_alternatives else ""
+                        # Message de succès pour la génération de configuration
+                        config_status.success(
+                            f"✅ Configuration PC {' et '.join(label for label, _ in built_configs)} créée avec succès!"
+                        )
                         
-                        game_name_sanitized = game_data["game"].replace(":", "").replace(" ", "_").replace("/", "_").lower()
-                        json_config_path = os.path.join(data_dir, f"{game_name_sanitized}_{config_type_abbrev}{alt_suffix}_{pc_config.game_uuid}.json")
+                        # Sauvegarder les configurations
+                        for _, pc_config in built_configs:
+                            json_config_path = configuration_path(game_data["game"], pc_config.is_recommended, include_alternatives, pc_config.game_uuid)
+                            
+                            pc_config.save_to_json(json_config_path)
                         
-                        pc_config.save_to_json(json_config_path)
+                        # Profil enregistré à côté de la configuration
+                        profile_files = profiler.save(json_config_path)
+                        if profile_files:
+                            with st.expander("Profil de la génération"):
+                                st.caption(f"Profil: {profile_files['profile']} (pstats, snakeviz)")
+                                with open(profile_files["summary"], "r", encoding="utf-8") as f:
+                                    st.code(f.read(), language=None)
                         
                         # Phase 3: Affichage des résultats (en dehors du spinner)
-                        st.markdown(f"<h3>Détails de la configuration</h3>", unsafe_allow_html=True)
-                        
-                        # Utiliser un conteneur Streamlit pour les informations générales
-                        with st.container():
-                            st.markdown(f"""
-                            <div class="config-details-container">
-                                <h4>{pc_config.name}</h4>
-                                <div class="config-summary">
-                                    <p>Prix total: <span class="config-price">{pc_config.get_total_price()}</span></p>
-                                    <p>Configuration {config_type.lower()} pour {game_data['game']}</p>
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            # Déterminer le nombre de colonnes (3 colonnes par défaut)
-                            num_components = len(pc_config.components)
-                            num_cols = min(3, max(1, num_components))  # Au moins 1, au plus 3 colonnes
-                            
-                            # Créer des colonnes Streamlit au lieu d'une grille HTML
-                            cols = st.columns(num_cols)
-                            
-                            # Distribuer les composants dans les colonnes
-                            for i, (category, component) in enumerate(pc_config.components.items()):
-                                col_idx = i % num_cols  # Distribution circulaire
-                                
-                                with cols[col_idx]:
-                                    name = component.get('name', 'N/A')
-                                    price = component.get('price', 'N/A')
-                                    image_url = component.get('image_url', '')
-                                    merchant = component.get('merchant', 'N/A')
-                                    buy_link = component.get('buy_link', '')
-                                    
-                                    # Image placeholder si pas d'image disponible
-                                    if not image_url:
-                                        image_url = "https://www.svgrepo.com/show/508699/landscape-placeholder.svg"
-                                    
-                                    # Utiliser un conteneur avec bordure pour créer une "carte"
-                                    with st.container(border=True):
-                                        # Catégorie
-                                        st.markdown(f"<div class='component-category'>{category}</div>", unsafe_allow_html=True)
-                                        
-                                        # Image
-                                        st.image(image_url, use_container_width=True)
-                                        
-                                        # Nom et prix
-                                        st.markdown(f"**{name}**")
-                                        st.markdown(f"<span class='component-price'>Prix: {price}</span>", unsafe_allow_html=True)
-                                        
-                                        # Détails supplémentaires
-                                        st.markdown(f"Fournisseur: {merchant}")
-                                        
-                                        # Bouton d'achat
-                                        if buy_link and price != "N/A":
-                                            st.markdown(f"<a href='{buy_link}' target='_blank' class='buy-button'>Acheter</a>", unsafe_allow_html=True)
-                        
-                        # Afficher les composants alternatifs si demandé
-                        if include_alternatives and pc_config.alternative_components:
-                            st.markdown('<h3 class="alternatives-title">Composants alternatifs</h3>', unsafe_allow_html=True)
-                            
-                            for category, alternatives in pc_config.alternative_components.items():
-                                st.markdown(f"<h4>Alternatives pour {category}</h4>", unsafe_allow_html=True)
-                                
-                                # Déterminer le nombre de colonnes pour les alternatives
-                                num_alts = len(alternatives)
-                                num_alt_cols = min(3, max(1, num_alts))
-                                
-                                # Créer des colonnes pour les alternatives
-                                alt_cols = st.columns(num_alt_cols)
-                                
-                                # Distribuer les alternatives dans les colonnes
-                                for i, alt in enumerate(alternatives):
-                                    alt_col_idx = i % num_alt_cols
-                                    
-                                    with alt_cols[alt_col_idx]:
-                                        name = alt.get('name', 'N/A')
-                                        price = alt.get('price', 'N/A')
-                                        image_url = alt.get('image_url', '')
-                                        merchant = alt.get('merchant', 'N/A')
-                                        buy_link = alt.get('buy_link', '')
-                                        
-                                        # Image placeholder si pas d'image disponible
-                                        if not image_url:
-                                            image_url = "https://www.svgrepo.com/show/508699/landscape-placeholder.svg"
-                                        
-                                        # Utiliser un conteneur avec bordure
-                                        with st.container(border=True):
-                                            # Catégorie
-                                            st.markdown(f"<div class='component-category'>{category} (Alternative)</div>", unsafe_allow_html=True)
-                                            
-                                            # Image
-                                            st.image(image_url, use_container_width=True)
-                                            
-                                            # Nom et prix
-                                            st.markdown(f"**{name}**")
-                                            st.markdown(f"<span class='component-price'>Prix: {price}</span>", unsafe_allow_html=True)
-                                            
-                                            # Détails supplémentaires
-                                            st.markdown(f"Fournisseur: {merchant}")
-                                            
-                                            # Bouton d'achat
-                                            if buy_link and price != "N/A":
-                                                st.markdown(f"<a href='{buy_link}' target='_blank' class='buy-button'>Acheter</a>", unsafe_allow_html=True)
+                        for config_label, pc_config in built_configs:
+                            show_configuration(pc_config, config_label, game_data["game"], include_alternatives)
                     
                     except Exception as e:
                         config_status.error(f"Erreur lors de la création de la configuration PC: {str(e)}")
-                        if 'pp_scraper' in locals():
-                            pp_scraper.close()
             else:
                 st.error("Impossible de trouver les données du jeu.")
         elif not success:
             st.error("La recherche du jeu a échoué.")
         elif not game_data:
-            st.error("Impossible d'extraire les spécifications du jeu.")
\ No newline at end of file
+            st.error("Impossible d'extraire les spécifications du jeu.")
+
+# Mesure mémoire de fin de rendu (GAMECONFIG_MEMORY_DIAGNOSTICS=1)
+checkpoint("render.accueil")
@@ -0,0 +1,121 @@
+import streamlit as st
+import os
+import sys
+
+# Ajouter le chemin parent pour importer les modules nécessaires
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from utils.config_analytics import ConfigAnalytics
+from utils.memory_diagnostics import checkpoint
+
+# Configuration de la page
+st.set_page_config(
+    page_title="GameConfig - Statistiques des configurations",
+    page_icon="🎮",
+    layout="wide",
+)
+
+# Style CSS personnalisé
+st.markdown("""
+<style>
+    .main-title {
+        font-size: 2.5rem;
+        font-weight: bold;
+        color: #FF4B4B;
+        margin-bottom: 1.5rem;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# Instance partagée entre les sessions : seuls les fichiers nouveaux ou modifiés sont relus
+@st.cache_resource
+def get_analytics():
+    return ConfigAnalytics()
+
+# Titre de la page
+st.markdown('<div class="main-title">📊 Statistiques des configurations</div>', unsafe_allow_html=True)
+
+analytics = get_analytics()
+analytics.refresh()
+configs = analytics.configs
+
+if configs.empty:
+    st.info("Aucune configuration sauvegardée pour le moment. Les statistiques apparaîtront ici après leur création.")
+else:
+    # Indicateurs généraux
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Configurations", len(configs))
+    col2.metric("Jeux", configs["game"].nunique())
+    col3.metric("Coût moyen", f"{configs['total_price'].mean():.2f}€".replace('.', ','))
+
+    st.divider()
+
+    # Coût moyen par jeu
+    st.markdown("### Coût des configurations par jeu")
+    st.dataframe(
+        analytics.average_cost_per_game().rename(columns={
+            "game": "Jeu", "config_type": "Type", "count": "Nombre",
+            "mean": "Moyenne (€)", "min": "Minimum (€)", "max": "Maximum (€)",
+        }),
+        hide_index=True,
+        use_container_width=True,
+    )
+
+    # Écart entre configuration minimale et recommandée
+    st.markdown("### Écart de prix entre configuration minimale et recommandée")
+    spread = analytics.min_rec_spread()
+    if spread.empty:
+        st.info("Aucun jeu ne possède à la fois une configuration minimale et une recommandée.")
+    else:
+        st.dataframe(
+            spread.rename(columns={
+                "game": "Jeu", "min": "Minimale (€)", "rec": "Recommandée (€)",
+                "spread": "Écart (€)", "ratio": "Ratio",
+            }),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+    # Composants les plus fréquents par catégorie
+    st.markdown("### Composants les plus utilisés")
+    categories = sorted(analytics.components["category"].dropna().unique().tolist())
+    default_index = categories.index("GPU") if "GPU" in categories else 0
+    category = st.selectbox("Catégorie", categories, index=default_index)
+    include_alternatives = st.checkbox("Inclure les composants alternatifs", value=False)
+
+    most_common = analytics.most_common_components(category, include_alternatives=include_alternatives)
+    st.bar_chart(most_common, x="component", y="count")
+    st.dataframe(
+        most_common.rename(columns={"component": "Composant", "count": "Utilisations", "mean": "Prix moyen (€)"}),
+        hide_index=True,
+        use_container_width=True,
+    )
+
+    st.divider()
+
+    # Export des données
+    col_export1, col_export2 = st.columns(2)
+    with col_export1:
+        st.download_button(
+            "Exporter les composants (Parquet)",
+            data=analytics.to_parquet(table="components"),
+            file_name="composants.parquet",
+            mime="application/octet-stream",
+            use_container_width=True,
+        )
+    with col_export2:
+        st.download_button(
+            "Exporter les configurations (Parquet)",
+            data=analytics.to_parquet(table="configs"),
+            file_name="configurations.parquet",
+            mime="application/octet-stream",
+            use_container_width=True,
+        )
+
+# Mesure mémoire de fin de rendu (GAMECONFIG_MEMORY_DIAGNOSTICS=1)
+checkpoint("render.analytique")
+
+# Bouton pour retourner à la page d'accueil
+if st.button("Retour à l'accueil"):
+    st.switch_page("app.py")
@@ -8,6 +8,11 @@ import base64
 parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.append(parent_dir)
 
+from utils.image_cache import cached_image, PLACEHOLDER_URL
+from utils.budget_optimizer import component_offers, optimize
+from utils.prices import parse_price
+from utils.memory_diagnostics import checkpoint
+
 # Configuration de la page
 st.set_page_config(
     page_title="GameConfig - Détails de configuration",
@@ -118,7 +123,7 @@ else:
     components = config.get('components', {})
     
     # Placeholder image pour les composants sans image
-    placeholder_img = "https://www.svgrepo.com/show/508699/landscape-placeholder.svg"
+    placeholder_img = PLACEHOLDER_URL
     
     # Calculer le nombre de colonnes (max 3)
     num_cols = min(3, len(components))
@@ -149,7 +154,7 @@ else:
                 st.markdown(f"<div class='category-badge'>{category}</div>", unsafe_allow_html=True)
                 
                 # Image du composant
-                st.image(image_url, caption=None, use_container_width='auto') # Ajustement de l'image
+                st.image(cached_image(image_url), caption=None, use_container_width='auto') # Ajustement de l'image
                 
                 # Nom du composant
                 st.markdown(f"**{name}**")
@@ -210,7 +215,7 @@ else:
                                 image_url = placeholder_img
                             
                             # Image du composant
-                            st.image(image_url, caption=None, use_container_width='auto') # Ajustement de l'image
+                            st.image(cached_image(image_url), caption=None, use_container_width='auto') # Ajustement de l'image
                             
                             # Nom du composant
                             st.markdown(f"**{name}**")
@@ -225,6 +230,54 @@ else:
                             if buy_link and price != "N/A":
                                 st.markdown(f"<a href='{buy_link}' target='_blank' class='buy-button'>Acheter</a>", unsafe_allow_html=True)
     
+    # Optimisation du budget à partir des alternatives et des offres déjà relevées (aucune recherche)
+    with st.expander("Optimiser le budget"):
+        all_merchants = sorted({
+            offer["merchant"]
+            for component in list(components.values()) + [alt for alts in alternative_components.values() for alt in alts]
+            for offer in component_offers(component)
+        })
+        opt_col1, opt_col2 = st.columns(2)
+        with opt_col1:
+            max_budget = st.number_input("Budget maximum (€, 0 = sans limite)", min_value=0.0, value=0.0, step=50.0)
+            single_merchant = st.checkbox("Tout acheter chez un seul marchand", value=False)
+        with opt_col2:
+            allowed_merchants = st.multiselect("Marchands autorisés", all_merchants, default=all_merchants)
+        
+        # Une liste vide signifierait "tous les marchands" pour optimize : l'inverse de la sélection
+        result = None
+        if all_merchants and not allowed_merchants:
+            st.warning("Sélectionnez au moins un marchand autorisé.")
+        else:
+            result = optimize(
+                components, alternative_components,
+                max_budget=max_budget or None,
+                max_merchants=1 if single_merchant else None,
+                allowed_merchants=allowed_merchants
+            )
+            if result is None:
+                st.warning("Aucune combinaison ne respecte ces contraintes.")
+        if result is not None:
+            current_total = parse_price(config.get('total_price'))
+            saving = f" (économie: {current_total - result['total_price']:.2f}€)" if current_total else ""
+            st.markdown(f"**Prix optimisé:** <span class='price-value'>{result['total_price']:.2f}€</span>{saving}", unsafe_allow_html=True)
+            st.markdown(f"**Marchands:** {', '.join(result['merchants'])}")
+            rows = []
+            for category, chosen in result["selection"].items():
+                index = chosen["alternative_index"]
+                component = components[category] if index is None else alternative_components[category][index]
+                rows.append({
+                    "Catégorie": category,
+                    "Composant": component.get('name', 'N/A') + ("" if index is None else " (alternative)"),
+                    "Marchand": chosen["merchant"],
+                    "Prix": f"{chosen['price']:.2f}€",
+                    "Lien": chosen["link"],
+                })
+            st.dataframe(rows, use_container_width=True, hide_index=True,
+                         column_config={"Lien": st.column_config.LinkColumn("Lien")})
+            if result["unpriced"]:
+                st.caption(f"Sans prix (non comptés): {', '.join(result['unpriced'])}")
+    
     # Séparateur
     st.divider()
     
@@ -248,4 +301,7 @@ else:
     with col3:
         # Bouton pour partager la configuration
         if st.button("Partager la configuration", key="share_config", use_container_width=True):
-            st.info("Fonctionnalité de partage à implémenter.")
\ No newline at end of file
+            st.info("Fonctionnalité de partage à implémenter.")
+
+# Mesure mémoire de fin de rendu (GAMECONFIG_MEMORY_DIAGNOSTICS=1)
+checkpoint("render.detail_config")
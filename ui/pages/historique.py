@@ -2,13 +2,17 @@ import streamlit as st
 import os
 import sys
 import json
-import glob
 from pathlib import Path
 
 # Ajouter le chemin parent pour importer les modules nécessaires
 parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.append(parent_dir)
 
+from utils.image_cache import prefetch
+from utils import search_index
+from utils.storage import get_storage, configuration_id
+from utils.memory_diagnostics import checkpoint
+
 # Configuration de la page
 st.set_page_config(
     page_title="GameConfig - Historique des configurations",
@@ -56,36 +60,68 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Rattrapage des fichiers enregistrés par d'autres processus (workers) : au plus une fois par minute,
+# partagé entre les sessions. Les sauvegardes de l'application sont indexées au fil de l'eau.
+@st.cache_data(ttl=60, show_spinner=False)
+def sync_search_index():
+    return search_index.sync()
+
 # Titre de la page
 st.markdown('<div class="main-title">💾 Historique des configurations</div>', unsafe_allow_html=True)
 
 # Chemin vers le dossier data contenant les fichiers JSON
-data_dir = os.path.join(parent_dir, "data", "pcpartpicker")
+data_dir = os.path.join(os.environ.get("GAMECONFIG_DATA_DIR", os.path.join(parent_dir, "data")), "pcpartpicker")
 
 # Vérifier si le dossier existe
 if not os.path.exists(data_dir):
     st.warning(f"Aucun dossier de données trouvé à l'emplacement : {data_dir}")
     st.info("Les configurations sauvegardées apparaîtront ici après leur création.")
 else:
-    # Rechercher tous les fichiers JSON dans le dossier data
-    json_files = glob.glob(os.path.join(data_dir, "*.json"))
+    # Recherche plein texte (jeux, composants, spécifications)
+    search_query = st.text_input("Rechercher", placeholder="Ex: RTX 3060, Cyberpunk, i5-4460...")
     
-    if not json_files:
-        st.info("Aucune configuration sauvegardée pour le moment. Les configurations que vous créerez apparaîtront ici.")
-    else:
-        # Afficher les configurations sauvegardées
-        configs = []
-        for json_file in json_files:
+    # Backend de stockage configuré (fichiers JSON par défaut, SQLite avec GAMECONFIG_STORAGE=sqlite)
+    storage = get_storage()
+    configs = []
+    
+    if search_query.strip():
+        sync_search_index()
+        for result in search_index.search(search_query, kind="config", limit=200):
+            config_id = configuration_id(result['path'])
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                    configs.append({
-                        'filename': os.path.basename(json_file),
-                        'filepath': json_file,
-                        'data': config_data
-                    })
+                config_data = storage.get_configuration(config_id)
+                if config_data is None and os.path.exists(result['path']):
+                    # Fichier indexé mais absent de la base SQLite (antérieur à la migration,
+                    # miroir en échec) : lu directement
+                    with open(result['path'], 'r', encoding='utf-8') as f:
+                        config_data = json.load(f)
             except Exception as e:
-                st.error(f"Erreur lors du chargement de {json_file}: {e}")
+                st.error(f"Erreur lors du chargement de {config_id}: {e}")
+                continue
+            if config_data:
+                configs.append({'filename': f"{config_id}.json", 'data': config_data})
+        
+        matching_games = search_index.search(search_query, kind="game", limit=10)
+        if matching_games:
+            st.caption("Jeux correspondants : " + ", ".join(dict.fromkeys(result['title'] for result in matching_games)))
+    else:
+        # Charger toutes les configurations sauvegardées
+        configs = [
+            {'filename': f"{config_id}.json", 'data': config_data}
+            for config_id, config_data in storage.list_configurations()
+        ]
+    
+    if not configs and search_query.strip():
+        st.info(f"Aucune configuration ne correspond à « {search_query} ».")
+    elif not configs:
+        st.info("Aucune configuration sauvegardée pour le moment. Les configurations que vous créerez apparaîtront ici.")
+    else:
+        # Préparer en arrière-plan les miniatures affichées par la page de détails
+        prefetch(
+            component.get('image_url')
+            for config in configs
+            for component in config['data'].get('components', {}).values()
+        )
         
         # Diviser en deux colonnes pour afficher plus de configurations
         col1, col2 = st.columns(2)
@@ -127,6 +163,9 @@ else:
                             st.session_state.selected_config = config['data']
                             st.switch_page("pages/detail_config.py")
 
+# Mesure mémoire de fin de rendu (GAMECONFIG_MEMORY_DIAGNOSTICS=1)
+checkpoint("render.historique")
+
 # Bouton pour retourner à la page d'accueil
 if st.button("Retour à l'accueil"):
     st.switch_page("app.py")
\ No newline at end of file
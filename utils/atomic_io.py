@@ -0,0 +1,99 @@
+import contextlib
+import json
+import os
+import tempfile
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+def _fsync_directory(directory):
+    # Rend le renommage durable (sans effet sous Windows, où un dossier ne peut pas être ouvert)
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def atomic_write_bytes(path, content):
+    """
+    Écrit un fichier de façon atomique : fichier temporaire, fsync puis renommage
+
+    Un lecteur concurrent voit soit l'ancien fichier, soit le nouveau, jamais un fichier partiel.
+
+    Args:
+        path (str): Chemin final du fichier
+        content (bytes): Contenu à écrire
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    # Le fichier temporaire est créé dans le même dossier pour que le renommage reste atomique
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    _fsync_directory(directory)
+
+def atomic_write_json(path, data, indent=2):
+    """
+    Sérialise des données en JSON et les écrit de façon atomique
+
+    Args:
+        path (str): Chemin final du fichier
+        data: Données sérialisables en JSON
+        indent (int): Indentation du fichier
+    """
+    content = json.dumps(data, ensure_ascii=False, indent=indent).encode("utf-8")
+    atomic_write_bytes(path, content)
+
+@contextlib.contextmanager
+def file_lock(path, blocking=True):
+    """
+    Verrou consultatif inter-processus, posé sur un fichier '<path>.lock'
+
+    À utiliser autour des séquences lecture-modification-écriture partagées entre
+    sessions Streamlit et workers.
+
+    Args:
+        path (str): Ressource à protéger
+        blocking (bool): Si False, lève BlockingIOError quand le verrou est déjà pris
+    """
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(os.path.abspath(lock_path)), exist_ok=True)
+    with open(lock_path, "a+b") as lock_file:
+        if os.name == "nt":
+            lock_file.seek(0)
+            if not blocking:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                except OSError:
+                    raise BlockingIOError(f"Verrou déjà pris: {lock_path}")
+            # LK_LOCK réessaie pendant 10 secondes : on boucle pour un verrou bloquant
+            while blocking:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,202 @@
+import argparse
+import copy
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.prices import parse_price
+
+def component_offers(component):
+    """
+    Offres d'achat connues d'un composant
+
+    Args:
+        component (dict): Composant d'une configuration (merchant_options si la page produit
+            a été visitée, sinon seulement son prix et son marchand)
+
+    Returns:
+        list: Offres (marchand, prix numérique, lien), sans les prix indisponibles
+    """
+    options = component.get("merchant_options") or [
+        {"merchant": component.get("merchant"), "price": component.get("price"), "link": component.get("buy_link", "")}
+    ]
+    offers = []
+    for option in options:
+        price = parse_price(option.get("price"))
+        if price is not None and option.get("merchant") not in (None, "", "N/A"):
+            offers.append({"merchant": option["merchant"], "price": price, "link": option.get("link", "")})
+    return offers
+
+def _candidates(components, alternative_components):
+    # Candidats par catégorie : composant principal puis alternatives (toutes répondent aux spécifications)
+    candidates = {}
+    for category, component in components.items():
+        candidates[category] = [(None, component)]
+        for index, alternative in enumerate(alternative_components.get(category, [])):
+            candidates[category].append((index, alternative))
+    return candidates
+
+def optimize(components, alternative_components=None, max_budget=None, max_merchants=None, allowed_merchants=None):
+    """
+    Combinaison la moins chère de composants et de marchands pour une configuration
+
+    Chaque catégorie est pourvue par son composant principal ou l'une de ses alternatives,
+    acheté chez l'un des marchands déjà relevés : aucune page n'est chargée. La recherche est
+    un branch-and-bound : catégories les plus contraintes d'abord, offres par prix croissant,
+    et abandon d'une branche dès que son coût plus le minimum des catégories restantes
+    (restreint aux marchands déjà retenus quand leur nombre maximum est atteint) dépasse la
+    meilleure solution trouvée ou le budget.
+
+    Args:
+        components (dict): Catégorie -> composant principal
+        alternative_components (dict): Catégorie -> composants alternatifs
+        max_budget (float): Prix total maximum
+        max_merchants (int): Nombre maximum de marchands distincts (1 : un seul marchand)
+        allowed_merchants (iterable): Marchands autorisés (tous par défaut)
+
+    Returns:
+        dict: Prix total, marchands retenus, choix par catégorie (alternative_index à None pour
+            le composant principal) et catégories sans prix (laissées telles quelles),
+            ou None si aucune combinaison ne respecte les contraintes
+    """
+    started = time.perf_counter()
+    allowed = set(allowed_merchants) if allowed_merchants else None
+
+    # Options par catégorie : (prix, marchand, index de l'alternative, offre), par prix croissant
+    options, unpriced = {}, []
+    for category, candidates in _candidates(components, alternative_components or {}).items():
+        category_options = [
+            (offer["price"], offer["merchant"], index, offer)
+            for index, component in candidates
+            for offer in component_offers(component)
+            if allowed is None or offer["merchant"] in allowed
+        ]
+        if category_options:
+            options[category] = sorted(category_options, key=lambda option: option[0])
+        elif not any(component_offers(component) for _, component in candidates):
+            # Composant introuvable ou sans prix : il ne peut ni coûter ni être acheté
+            unpriced.append(category)
+        else:
+            return None
+
+    # Moins d'options d'abord : les choix contraints sont faits tôt, ce qui élague davantage
+    categories = sorted(options, key=lambda category: len(options[category]))
+    cheapest = {category: options[category][0][0] for category in categories}
+    cheapest_by_merchant = {}
+    for category in categories:
+        best = {}
+        for price, merchant, _, _ in options[category]:
+            best.setdefault(merchant, price)
+        cheapest_by_merchant[category] = best
+    # Minimum restant sans contrainte de marchand, à partir de chaque profondeur
+    remaining_floor = [0.0] * (len(categories) + 1)
+    for depth in range(len(categories) - 1, -1, -1):
+        remaining_floor[depth] = remaining_floor[depth + 1] + cheapest[categories[depth]]
+
+    limit = max_budget if max_budget is not None else math.inf
+    best = {"cost": math.inf, "choice": None}
+    choice = [None] * len(categories)
+
+    def lower_bound(depth, cost, merchants):
+        if max_merchants is None or len(merchants) < max_merchants:
+            return cost + remaining_floor[depth]
+        # Plus de nouveau marchand possible : seules les offres des marchands retenus comptent
+        bound = cost
+        for category in categories[depth:]:
+            prices = [cheapest_by_merchant[category][m] for m in merchants if m in cheapest_by_merchant[category]]
+            if not prices:
+                return math.inf
+            bound += min(prices)
+        return bound
+
+    def explore(depth, cost, merchants):
+        if depth == len(categories):
+            if cost < best["cost"]:
+                best["cost"], best["choice"] = cost, list(choice)
+            return
+        for option in options[categories[depth]]:
+            price, merchant = option[0], option[1]
+            new_merchant = merchant not in merchants
+            if new_merchant and max_merchants is not None and len(merchants) >= max_merchants:
+                continue
+            # Offres triées : si celle-ci dépasse déjà, les suivantes aussi
+            if cost + price + remaining_floor[depth + 1] >= min(best["cost"], limit + 1e-9):
+                break
+            merchants_after = merchants | {merchant} if new_merchant else merchants
+            if lower_bound(depth + 1, cost + price, merchants_after) >= min(best["cost"], limit + 1e-9):
+                continue
+            choice[depth] = option
+            explore(depth + 1, cost + price, merchants_after)
+
+    explore(0, 0.0, frozenset())
+    if best["choice"] is None:
+        return None
+
+    selection = {
+        category: {"alternative_index": index, "merchant": merchant, "price": price, "link": offer["link"]}
+        for category, (price, merchant, index, offer) in zip(categories, best["choice"])
+    }
+    debug_print(
+        f"Optimisation: {best['cost']:.2f}€ en {(time.perf_counter() - started) * 1000:.1f} ms",
+        level="debug"
+    )
+    return {
+        "total_price": round(best["cost"], 2),
+        "merchants": sorted({entry["merchant"] for entry in selection.values()}),
+        "selection": selection,
+        "unpriced": unpriced,
+    }
+
+def apply_selection(components, alternative_components, result):
+    """
+    Construit les composants d'une configuration à partir du résultat d'optimize
+
+    Le composant choisi devient le composant principal de sa catégorie, avec l'offre retenue ;
+    le composant qu'il remplace prend sa place parmi les alternatives.
+
+    Args:
+        components (dict): Catégorie -> composant principal
+        alternative_components (dict): Catégorie -> composants alternatifs
+        result (dict): Résultat d'optimize
+
+    Returns:
+        tuple: (composants principaux, composants alternatifs), copies indépendantes des originaux
+    """
+    components = copy.deepcopy(components)
+    alternative_components = copy.deepcopy(alternative_components or {})
+    for category, chosen in result["selection"].items():
+        index = chosen["alternative_index"]
+        if index is not None:
+            alternatives = alternative_components[category]
+            components[category], alternatives[index] = alternatives[index], components[category]
+        components[category].update({
+            "price": f"{chosen['price']:.2f}€".replace(".", ","),
+            "merchant": chosen["merchant"],
+            "buy_link": chosen["link"],
+        })
+    return components, alternative_components
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Combinaison la moins chère des composants et marchands d'une configuration sauvegardée")
+    parser.add_argument("config_path", help="Fichier JSON de la configuration (data/pcpartpicker)")
+    parser.add_argument("--max-budget", type=float, default=None, help="Prix total maximum")
+    parser.add_argument("--single-merchant", action="store_true", help="Tout acheter chez un seul marchand")
+    parser.add_argument("--max-merchants", type=int, default=None, help="Nombre maximum de marchands")
+    parser.add_argument("--merchant", action="append", default=None, help="Marchand autorisé (répétable)")
+    args = parser.parse_args()
+
+    with open(args.config_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    result = optimize(
+        data.get("components", {}), data.get("alternative_components", {}),
+        max_budget=args.max_budget, max_merchants=1 if args.single_merchant else args.max_merchants,
+        allowed_merchants=args.merchant,
+    )
+    if result is None:
+        debug_print("Aucune combinaison ne respecte ces contraintes", level="warning")
+        sys.exit(1)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
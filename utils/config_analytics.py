@@ -0,0 +1,193 @@
+import io
+import json
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.prices import parse_price
+
+CONFIG_DIR = os.path.join(os.environ.get("GAMECONFIG_DATA_DIR", os.path.join(Path(__file__).parent.parent, "data")), "pcpartpicker")
+
+CONFIG_COLUMNS = {
+    "file": "string",
+    "name": "string",
+    "game": "category",
+    "config_type": "category",
+    "with_alternatives": "bool",
+    "created_at": "datetime64[ns]",
+    "total_price": "float64",
+    "component_count": "int64",
+}
+
+COMPONENT_COLUMNS = {
+    "file": "string",
+    "game": "category",
+    "config_type": "category",
+    "category": "category",
+    "is_alternative": "bool",
+    "component": "string",
+    "price": "float64",
+    "merchant": "category",
+    "link": "string",
+}
+
+_NAME_PATTERN = re.compile(r"^Config (recommandée|minimale) pour (.+)$")
+
+def _describe(data, filename):
+    """Retrouve le jeu et le type de configuration (les anciens fichiers n'ont que le nom)"""
+    game = data.get("game_name")
+    is_recommended = data.get("is_recommended")
+    match = _NAME_PATTERN.match(data.get("name", ""))
+    if match:
+        game = game or match.group(2)
+        if is_recommended is None:
+            is_recommended = match.group(1) == "recommandée"
+    if is_recommended is None:
+        is_recommended = "_rec" in filename
+    return game or "Inconnu", "rec" if is_recommended else "min"
+
+def _rows_from_file(path):
+    """
+    Lit un fichier de configuration
+
+    Returns:
+        tuple: (ligne de la configuration, lignes des composants)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    filename = os.path.basename(path)
+    game, config_type = _describe(data, filename)
+    created_at = data.get("created_at")
+    created_at = pd.Timestamp(created_at) if created_at else pd.Timestamp(os.path.getmtime(path), unit="s")
+    config_row = {
+        "file": filename,
+        "name": data.get("name", ""),
+        "game": game,
+        "config_type": config_type,
+        "with_alternatives": bool(data.get("alternative_components")),
+        "created_at": created_at,
+        "total_price": parse_price(data.get("total_price")),
+        "component_count": len(data.get("components", {})),
+    }
+
+    component_rows = []
+    groups = [(False, {category: [component] for category, component in data.get("components", {}).items()}),
+              (True, data.get("alternative_components", {}))]
+    for is_alternative, components_by_category in groups:
+        for category, components in components_by_category.items():
+            for component in components:
+                component_rows.append({
+                    "file": filename,
+                    "game": game,
+                    "config_type": config_type,
+                    "category": category,
+                    "is_alternative": is_alternative,
+                    "component": component.get("name", ""),
+                    "price": parse_price(component.get("price")),
+                    "merchant": component.get("merchant"),
+                    "link": component.get("link", ""),
+                })
+    return config_row, component_rows
+
+def _typed_frame(rows, columns):
+    df = pd.DataFrame(rows, columns=list(columns))
+    return df.astype(columns)
+
+class ConfigAnalytics:
+    """Charge les configurations sauvegardées dans des DataFrames typés, rafraîchis de façon incrémentale"""
+
+    def __init__(self, config_dir=CONFIG_DIR):
+        self.config_dir = config_dir
+        self._files = {}  # Chemin -> (mtime, ligne de configuration, lignes de composants)
+        self._lock = threading.Lock()
+        self.configs = _typed_frame([], CONFIG_COLUMNS)
+        self.components = _typed_frame([], COMPONENT_COLUMNS)
+        self._exports = {}  # Exports Parquet déjà calculés depuis le dernier changement
+
+    def refresh(self):
+        """
+        Relit uniquement les fichiers ajoutés ou modifiés depuis le dernier appel
+
+        Returns:
+            int: Nombre de fichiers (re)lus
+        """
+        with self._lock:
+            current = {}
+            try:
+                with os.scandir(self.config_dir) as it:
+                    for entry in it:
+                        if entry.is_file() and entry.name.endswith(".json"):
+                            current[entry.path] = entry.stat().st_mtime
+            except FileNotFoundError:
+                pass
+
+            changed = [path for path, mtime in current.items() if self._files.get(path, (None,))[0] != mtime]
+            removed = [path for path in self._files if path not in current]
+
+            for path in removed:
+                del self._files[path]
+            for path in changed:
+                try:
+                    config_row, component_rows = _rows_from_file(path)
+                    self._files[path] = (current[path], config_row, component_rows)
+                except Exception as e:
+                    # Fichier illisible (en cours d'écriture ?) : il sera relu au prochain rafraîchissement
+                    debug_print(f"Configuration ignorée {path}: {e}", level="warning")
+                    self._files.pop(path, None)
+
+            if changed or removed:
+                entries = list(self._files.values())
+                self.configs = _typed_frame([entry[1] for entry in entries], CONFIG_COLUMNS)
+                self.components = _typed_frame([row for entry in entries for row in entry[2]], COMPONENT_COLUMNS)
+                self._exports = {}
+            return len(changed)
+
+    def average_cost_per_game(self):
+        """Coût moyen, minimum et maximum des configurations par jeu et par type"""
+        return (self.configs.groupby(["game", "config_type"], observed=True)["total_price"]
+                .agg(["count", "mean", "min", "max"]).reset_index())
+
+    def min_rec_spread(self):
+        """Écart de prix moyen entre configuration recommandée et minimale, par jeu"""
+        pivot = self.configs.pivot_table(index="game", columns="config_type", values="total_price",
+                                         aggfunc="mean", observed=True)
+        pivot.columns = pivot.columns.astype(str)
+        if "min" not in pivot or "rec" not in pivot:
+            return pd.DataFrame(columns=["game", "min", "rec", "spread", "ratio"])
+        pivot = pivot.dropna(subset=["min", "rec"])
+        pivot["spread"] = pivot["rec"] - pivot["min"]
+        pivot["ratio"] = pivot["rec"] / pivot["min"].where(pivot["min"] > 0)
+        return pivot.reset_index().sort_values("spread", ascending=False, ignore_index=True)
+
+    def most_common_components(self, category="GPU", top_n=10, include_alternatives=False):
+        """Composants les plus utilisés dans une catégorie, avec leur prix moyen"""
+        df = self.components[self.components["category"] == category]
+        if not include_alternatives:
+            df = df[~df["is_alternative"]]
+        return (df.groupby("component")["price"].agg(["count", "mean"])
+                .sort_values("count", ascending=False).head(top_n).reset_index())
+
+    def to_parquet(self, path=None, table="components"):
+        """
+        Exporte une table au format Parquet
+
+        Args:
+            path (str): Fichier de destination (si None, retourne les octets)
+            table (str): 'components' (une ligne par composant) ou 'configs' (une ligne par configuration)
+        """
+        df = self.components if table == "components" else self.configs
+        if path is None:
+            if table not in self._exports:
+                buffer = io.BytesIO()
+                df.to_parquet(buffer, index=False)
+                self._exports[table] = buffer.getvalue()
+            return self._exports[table]
+        df.to_parquet(path, index=False)
+        return path
@@ -0,0 +1,172 @@
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+# Emplacement par défaut de la frontière du crawler (surchargeable via GAMECONFIG_CRAWL_DB)
+DEFAULT_DB_PATH = os.environ.get(
+    "GAMECONFIG_CRAWL_DB",
+    os.path.join(Path(__file__).parent.parent, "data", "crawl_frontier.db")
+)
+
+# Types de pages : listes de résultats (découverte) et pages produit (extraction)
+LISTING = "listing"
+PRODUCT = "product"
+
+class CrawlFrontier:
+    """Frontière persistante du crawler : pages connues, date de dernière visite et prochaine échéance"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, wal=True):
+        """
+        Args:
+            db_path (str): Chemin de la base SQLite
+            wal (bool): Active le mode WAL (à désactiver si la base est sur un partage réseau)
+        """
+        self.db_path = db_path
+        self.wal = wal
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_schema()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = 30000")
+        if self.wal:
+            conn.execute("PRAGMA journal_mode = WAL")
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    discovered_at REAL NOT NULL,
+                    fetched_at REAL,
+                    next_fetch_at REAL NOT NULL,
+                    game TEXT,
+                    json_path TEXT,
+                    error TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_due ON pages (status, next_fetch_at)")
+        finally:
+            conn.close()
+
+    def add(self, urls, kind):
+        """
+        Ajoute des pages à la frontière (les pages déjà connues sont ignorées)
+
+        Args:
+            urls (iterable): Adresses découvertes
+            kind (str): LISTING ou PRODUCT
+
+        Returns:
+            int: Nombre de nouvelles pages
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            before = conn.total_changes
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR IGNORE INTO pages (url, kind, discovered_at, next_fetch_at) VALUES (?, ?, ?, ?)",
+                [(url, kind, now, now) for url in urls]
+            )
+            conn.execute("COMMIT")
+            return conn.total_changes - before
+        finally:
+            conn.close()
+
+    def due(self, limit=100, now=None):
+        """
+        Pages dont la visite est échue, listes de résultats d'abord
+
+        Args:
+            limit (int): Nombre maximum de pages renvoyées
+            now (float): Instant de référence (maintenant par défaut)
+
+        Returns:
+            list: Pages (url, kind, attempts)
+        """
+        now = time.time() if now is None else now
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                """SELECT url, kind, attempts FROM pages
+                   WHERE status != 'failed' AND next_fetch_at <= ?
+                   ORDER BY kind = 'product', next_fetch_at LIMIT ?""",
+                (now, limit)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
+
+    def mark_fetched(self, url, refresh_seconds, game=None, json_path=None):
+        """
+        Enregistre une visite réussie et planifie la prochaine
+
+        Args:
+            url (str): Page visitée
+            refresh_seconds (float): Délai avant la prochaine visite
+            game (str): Nom du jeu extrait (pages produit)
+            json_path (str): Fichier de spécifications correspondant (pages produit)
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                """UPDATE pages SET status = 'done', attempts = 0, error = NULL, fetched_at = ?, next_fetch_at = ?,
+                   game = COALESCE(?, game), json_path = COALESCE(?, json_path) WHERE url = ?""",
+                (now, now + refresh_seconds, game, json_path, url)
+            )
+        finally:
+            conn.close()
+
+    def mark_failed(self, url, error, retry_seconds, max_attempts=3):
+        """
+        Enregistre un échec : nouvelle tentative plus tard, abandon après max_attempts
+
+        Args:
+            url (str): Page en échec
+            error (Exception or str): Erreur rencontrée
+            retry_seconds (float): Délai de base avant une nouvelle tentative (doublé à chaque échec)
+            max_attempts (int): Nombre d'échecs consécutifs avant abandon
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT attempts FROM pages WHERE url = ?", (url,)).fetchone()
+            attempts = (row["attempts"] if row else 0) + 1
+            status = "failed" if attempts >= max_attempts else "pending"
+            conn.execute(
+                "UPDATE pages SET status = ?, attempts = ?, error = ?, next_fetch_at = ? WHERE url = ?",
+                (status, attempts, str(error), now + retry_seconds * 2 ** (attempts - 1), url)
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def stats(self):
+        """
+        Nombre de pages par type et par statut, et nombre de pages échues
+
+        Returns:
+            dict: {"listing": {"pending": n, ...}, "product": {...}, "due": n}
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT kind, status, COUNT(*) FROM pages GROUP BY kind, status").fetchall()
+            due = conn.execute(
+                "SELECT COUNT(*) FROM pages WHERE status != 'failed' AND next_fetch_at <= ?", (time.time(),)
+            ).fetchone()[0]
+        finally:
+            conn.close()
+        stats = {LISTING: {}, PRODUCT: {}, "due": due}
+        for kind, status, count in rows:
+            stats.setdefault(kind, {})[status] = count
+        return stats
@@ -0,0 +1,184 @@
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.atomic_io import atomic_write_json, file_lock
+
+# Dossier des jeux, configurations et de leurs index (GAMECONFIG_DATA_DIR pour un autre emplacement)
+DATA_DIR = os.environ.get("GAMECONFIG_DATA_DIR", os.path.join(Path(__file__).parent.parent, "data"))
+GAMES_DIR = os.path.join(DATA_DIR, "instantgaming")
+
+# Index empreinte -> fiche de jeu, gardé hors de data/instantgaming pour ne pas être pris pour un jeu
+RECORDS_INDEX = os.path.join(DATA_DIR, "game_records.json")
+
+# Nombre maximum d'observations conservées par fiche
+MAX_OBSERVATIONS = 500
+
+# Âge maximum (jours) d'une fiche locale utilisée à la place d'un scraping à la demande
+LOCAL_MAX_AGE_DAYS = float(os.environ.get("GAMECONFIG_LOCAL_MAX_AGE_DAYS", 7))
+
+def _normalize(value):
+    """Normalise une valeur de spécifications (espaces multiples, casse) pour le calcul de l'empreinte"""
+    if isinstance(value, dict):
+        return {str(key).strip().lower(): _normalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    if value is None:
+        return ""
+    return re.sub(r"\s+", " ", str(value)).strip().lower()
+
+def requirements_hash(data):
+    """
+    Empreinte des configurations requises d'un jeu
+
+    Seuls le nom du jeu et les configurations minimale et recommandée sont pris en compte :
+    le prix et l'image changent sans que les spécifications changent.
+
+    Args:
+        data (dict): Données extraites d'Instant Gaming (game, minimal, recommended)
+
+    Returns:
+        str: Empreinte SHA-256 hexadécimale
+    """
+    normalized = {
+        "game": _normalize(data.get("game")),
+        "minimal": _normalize(data.get("minimal", {})),
+        "recommended": _normalize(data.get("recommended", {})),
+    }
+    payload = json.dumps(normalized, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _game_filename(game_name, game_uuid):
+    base = game_name.replace(":", "").replace(" ", "_").replace("/", "_").lower()
+    return f"{base}_{game_uuid}.json"
+
+def _rebuild_index(games_dir):
+    """Reconstruit l'index à partir des fichiers existants (le plus ancien fichier d'un contenu l'emporte)"""
+    records = {}
+    paths = sorted(glob.glob(os.path.join(games_dir, "*.json")), key=os.path.getmtime)
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        digest = requirements_hash(data)
+        if digest in records or not data.get("uuid"):
+            continue
+        observed_at = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc).isoformat()
+        records[digest] = {
+            "uuid": data["uuid"],
+            "file": os.path.basename(path),
+            "game": data.get("game"),
+            "observations": [{"observed_at": observed_at, "price": data.get("price")}],
+        }
+    if records:
+        debug_print(f"Index des fiches de jeux reconstruit: {len(records)} contenus distincts", level="debug")
+    return records
+
+def _load_index(index_path, games_dir):
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return _rebuild_index(games_dir)
+    except (OSError, json.JSONDecodeError) as e:
+        debug_print(f"Index des fiches de jeux illisible, reconstruction: {e}", level="warning")
+        return _rebuild_index(games_dir)
+
+def save_game_record(data, games_dir=GAMES_DIR, index_path=RECORDS_INDEX):
+    """
+    Enregistre les configurations requises d'un jeu sans dupliquer un contenu déjà connu
+
+    Si un fichier avec exactement les mêmes spécifications existe, il est réutilisé (même uuid)
+    et seule la date d'observation est ajoutée à l'index. Sinon une nouvelle fiche est écrite.
+
+    Args:
+        data (dict): Données extraites (game, image_url, price, minimal, recommended)
+
+    Returns:
+        tuple: (chemin du fichier, données avec uuid, True si une nouvelle fiche a été écrite)
+    """
+    digest = requirements_hash(data)
+    observation = {"observed_at": datetime.now(timezone.utc).isoformat(), "price": data.get("price")}
+
+    # Lecture-modification-écriture de l'index protégée entre sessions et workers
+    with file_lock(index_path):
+        records = _load_index(index_path, games_dir)
+        record = records.get(digest)
+        path = os.path.join(games_dir, record["file"]) if record else None
+
+        if record and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            record["observations"] = (record.get("observations", []) + [observation])[-MAX_OBSERVATIONS:]
+            atomic_write_json(index_path, records)
+            debug_print(f"Spécifications inchangées pour {data.get('game')}, fiche {record['uuid']} réutilisée", level="debug")
+            return path, stored, False
+
+        game_uuid = str(uuid.uuid4())
+        stored = {"uuid": game_uuid, "content_hash": digest, **data}
+        path = os.path.join(games_dir, _game_filename(data["game"], game_uuid))
+        atomic_write_json(path, stored, indent=4)
+
+        records[digest] = {
+            "uuid": game_uuid,
+            "file": os.path.basename(path),
+            "game": data.get("game"),
+            "observations": [observation],
+        }
+        atomic_write_json(index_path, records)
+        return path, stored, True
+
+def observations(game_uuid, index_path=RECORDS_INDEX, games_dir=GAMES_DIR):
+    """
+    Dates (et prix) auxquelles une fiche de jeu a été observée
+
+    Args:
+        game_uuid (str): UUID de la fiche
+
+    Returns:
+        list: Observations (observed_at, price), de la plus ancienne à la plus récente
+    """
+    records = _load_index(index_path, games_dir)
+    for record in records.values():
+        if record["uuid"] == game_uuid:
+            return record.get("observations", [])
+    return []
+
+def _name_key(game_name):
+    return re.sub(r"[\W_]+", "", str(game_name).lower())
+
+def find_game_record(game_name, max_age_days=LOCAL_MAX_AGE_DAYS, games_dir=GAMES_DIR, index_path=RECORDS_INDEX):
+    """
+    Cherche une fiche locale récente pour un jeu (alimentée par le crawler ou un scraping précédent)
+
+    Args:
+        game_name (str): Nom du jeu (casse, espaces et ponctuation ignorés)
+        max_age_days (float): Âge maximum de la dernière observation
+
+    Returns:
+        str: Chemin du fichier le plus récemment observé, ou None
+    """
+    key = _name_key(game_name)
+    if not key:
+        return None
+    oldest = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+
+    best_path, best_seen = None, None
+    for record in _load_index(index_path, games_dir).values():
+        if _name_key(record.get("game")) != key or not record.get("observations"):
+            continue
+        seen = datetime.fromisoformat(record["observations"][-1]["observed_at"])
+        path = os.path.join(games_dir, record["file"])
+        if seen >= oldest and (best_seen is None or seen > best_seen) and os.path.exists(path):
+            best_path, best_seen = path, seen
+    return best_path
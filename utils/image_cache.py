@@ -0,0 +1,180 @@
+import hashlib
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.atomic_io import atomic_write_bytes
+
+CACHE_DIR = os.environ.get(
+    "GAMECONFIG_IMAGE_CACHE_DIR",
+    os.path.join(os.environ.get("GAMECONFIG_DATA_DIR", os.path.join(Path(__file__).parent.parent, "data")), "image_cache")
+)
+
+# Image affichée quand un composant ou un jeu n'a pas d'image
+PLACEHOLDER_URL = "https://www.svgrepo.com/show/508699/landscape-placeholder.svg"
+
+# Taille maximale des miniatures (les cartes affichent les images sur 160px de haut)
+THUMBNAIL_SIZE = (400, 400)
+
+# Taille maximale du cache sur disque avant éviction des images les moins récemment utilisées
+MAX_CACHE_BYTES = int(os.environ.get("GAMECONFIG_IMAGE_CACHE_BYTES", 200 * 1024 * 1024))
+
+DOWNLOAD_TIMEOUT = 10
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-cache")
+_pending = set()
+_pending_lock = threading.Lock()
+
+def _cache_key(url):
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+def _find_cached(url):
+    """Retourne le chemin de l'image en cache pour cette URL, ou None"""
+    key = _cache_key(url)
+    for ext in (".jpg", ".png", ".svg"):
+        path = os.path.join(CACHE_DIR, key + ext)
+        if os.path.exists(path):
+            return path
+    return None
+
+def _touch(path):
+    # La date de modification sert de date de dernier accès pour l'éviction LRU
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+def _make_thumbnail(content):
+    """
+    Redimensionne une image téléchargée
+
+    Returns:
+        tuple: (octets de la miniature, extension) ou (contenu brut, '.svg') pour les images vectorielles
+    """
+    if b"<svg" in content[:1024]:
+        return content, ".svg"
+
+    from PIL import Image
+
+    with Image.open(io.BytesIO(content)) as image:
+        image.thumbnail(THUMBNAIL_SIZE)
+        buffer = io.BytesIO()
+        if image.mode in ("RGBA", "LA", "P"):
+            image.save(buffer, format="PNG", optimize=True)
+            return buffer.getvalue(), ".png"
+        image.convert("RGB").save(buffer, format="JPEG", quality=85, optimize=True)
+        return buffer.getvalue(), ".jpg"
+
+def fetch_image(url):
+    """
+    Télécharge une image, en stocke une miniature dans le cache et retourne son chemin local
+
+    Args:
+        url (str): URL de l'image distante
+
+    Returns:
+        str: Chemin local de la miniature, ou None en cas d'échec
+    """
+    if not url:
+        return None
+
+    cached = _find_cached(url)
+    if cached:
+        _touch(cached)
+        return cached
+
+    import requests
+
+    try:
+        response = requests.get(url, timeout=DOWNLOAD_TIMEOUT, headers={"User-Agent": "Mozilla/5.0"})
+        response.raise_for_status()
+        content, ext = _make_thumbnail(response.content)
+    except Exception as e:
+        debug_print(f"Impossible de mettre en cache l'image {url}: {e}", level="warning")
+        return None
+
+    path = os.path.join(CACHE_DIR, _cache_key(url) + ext)
+    atomic_write_bytes(path, content)
+    debug_print(f"Image mise en cache: {url} ({len(content) // 1024} Ko)", level="debug")
+
+    evict()
+    return path
+
+def _fetch_in_background(url):
+    try:
+        fetch_image(url)
+    finally:
+        with _pending_lock:
+            _pending.discard(url)
+
+def prefetch(urls):
+    """
+    Planifie le téléchargement en arrière-plan des images pas encore en cache
+
+    Args:
+        urls (iterable): URLs des images à mettre en cache
+    """
+    for url in urls:
+        if not url or _find_cached(url):
+            continue
+        with _pending_lock:
+            if url in _pending:
+                continue
+            _pending.add(url)
+        _executor.submit(_fetch_in_background, url)
+
+def cached_image(url, placeholder=PLACEHOLDER_URL):
+    """
+    Retourne la source à passer à st.image pour une URL d'image
+
+    Sert la miniature locale si elle est en cache. Sinon, l'URL distante est retournée
+    pour ce rendu et le téléchargement est lancé en arrière-plan pour les suivants.
+
+    Args:
+        url (str): URL de l'image (peut être vide)
+        placeholder (str): Image utilisée si l'URL est vide
+
+    Returns:
+        str: Chemin local ou URL distante
+    """
+    url = url or placeholder
+    cached = _find_cached(url)
+    if cached:
+        _touch(cached)
+        return cached
+    prefetch([url])
+    return url
+
+def evict(max_bytes=MAX_CACHE_BYTES):
+    """Supprime les images les moins récemment utilisées jusqu'à repasser sous la taille maximale"""
+    try:
+        entries = []
+        total = 0
+        with os.scandir(CACHE_DIR) as it:
+            for entry in it:
+                if not entry.is_file() or entry.name.endswith(".tmp"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+    except FileNotFoundError:
+        return
+
+    if total <= max_bytes:
+        return
+
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+    debug_print(f"Cache d'images réduit à {total // 1024} Ko", level="debug")
@@ -0,0 +1,203 @@
+import sqlite3
+import json
+import time
+import os
+import uuid
+from pathlib import Path
+
+# Emplacement par défaut de la file de tâches (surchargeable via GAMECONFIG_QUEUE_DB)
+DEFAULT_DB_PATH = os.environ.get(
+    "GAMECONFIG_QUEUE_DB",
+    os.path.join(Path(__file__).parent.parent, "data", "jobs.db")
+)
+
+# Durée d'un bail avant qu'une tâche soit considérée comme abandonnée
+DEFAULT_LEASE_SECONDS = 600
+
+class JobQueue:
+    """File de tâches durable stockée dans une table SQLite, distribuée aux workers par baux"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, lease_seconds=DEFAULT_LEASE_SECONDS, wal=True):
+        """
+        Args:
+            db_path (str): Chemin de la base SQLite partagée par les workers
+            lease_seconds (int): Durée d'un bail, renouvelée par heartbeat pendant l'exécution
+            wal (bool): Active le mode WAL (à désactiver si la base est sur un partage réseau)
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.wal = wal
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_schema()
+
+    def _connect(self):
+        # isolation_level=None : les transactions sont gérées explicitement (BEGIN IMMEDIATE)
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = 30000")
+        if self.wal:
+            conn.execute("PRAGMA journal_mode = WAL")
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 3,
+                    worker_id TEXT,
+                    lease_expires_at REAL,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+        finally:
+            conn.close()
+
+    def enqueue(self, payload, max_attempts=3):
+        """
+        Ajoute une tâche à la file
+
+        Args:
+            payload (dict): Paramètres de la tâche (nom du jeu, type de configuration, ...)
+            max_attempts (int): Nombre maximum de tentatives avant l'échec définitif
+
+        Returns:
+            str: Identifiant de la tâche
+        """
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO jobs (id, payload, max_attempts, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, json.dumps(payload, ensure_ascii=False), max_attempts, now, now)
+            )
+        finally:
+            conn.close()
+        return job_id
+
+    def lease(self, worker_id):
+        """
+        Réserve la plus ancienne tâche disponible pour un worker
+
+        Une tâche est disponible si elle est en attente ou si le bail de son worker
+        a expiré (worker planté). Les tâches expirées ayant épuisé leurs tentatives
+        sont marquées en échec.
+
+        Args:
+            worker_id (str): Identifiant du worker qui prend la tâche
+
+        Returns:
+            dict: La tâche réservée (id, payload, attempts) ou None si la file est vide
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            # BEGIN IMMEDIATE prend le verrou d'écriture : deux workers ne peuvent pas réserver la même tâche
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                """UPDATE jobs SET status = 'failed', error = COALESCE(error, 'Bail expiré'), updated_at = ?
+                   WHERE status = 'leased' AND lease_expires_at < ? AND attempts >= max_attempts""",
+                (now, now)
+            )
+            row = conn.execute(
+                """SELECT id, payload, attempts FROM jobs
+                   WHERE status = 'pending' OR (status = 'leased' AND lease_expires_at < ?)
+                   ORDER BY created_at LIMIT 1""",
+                (now,)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                """UPDATE jobs SET status = 'leased', worker_id = ?, lease_expires_at = ?,
+                   attempts = attempts + 1, updated_at = ? WHERE id = ?""",
+                (worker_id, now + self.lease_seconds, now, row["id"])
+            )
+            conn.execute("COMMIT")
+            return {
+                "id": row["id"],
+                "payload": json.loads(row["payload"]),
+                "attempts": row["attempts"] + 1,
+            }
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def heartbeat(self, job_id, worker_id):
+        """
+        Prolonge le bail d'une tâche en cours d'exécution
+
+        Returns:
+            bool: False si le bail a été perdu (tâche reprise par un autre worker)
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                """UPDATE jobs SET lease_expires_at = ?, updated_at = ?
+                   WHERE id = ? AND worker_id = ? AND status = 'leased'""",
+                (now + self.lease_seconds, now, job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def complete(self, job_id, worker_id, result=None):
+        """Marque une tâche comme terminée et enregistre son résultat"""
+        conn = self._connect()
+        try:
+            conn.execute(
+                """UPDATE jobs SET status = 'done', result = ?, error = NULL, lease_expires_at = NULL, updated_at = ?
+                   WHERE id = ? AND worker_id = ?""",
+                (json.dumps(result, ensure_ascii=False), time.time(), job_id, worker_id)
+            )
+        finally:
+            conn.close()
+
+    def fail(self, job_id, worker_id, error):
+        """Enregistre l'échec d'une tâche, remise en attente s'il reste des tentatives"""
+        conn = self._connect()
+        try:
+            conn.execute(
+                """UPDATE jobs SET
+                       status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END,
+                       error = ?, worker_id = NULL, lease_expires_at = NULL, updated_at = ?
+                   WHERE id = ? AND worker_id = ?""",
+                (str(error), time.time(), job_id, worker_id)
+            )
+        finally:
+            conn.close()
+
+    def get(self, job_id):
+        """Retourne l'état d'une tâche sous forme de dictionnaire, ou None"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def stats(self):
+        """Retourne le nombre de tâches par statut"""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        finally:
+            conn.close()
+        return {row["status"]: row["n"] for row in rows}
@@ -0,0 +1,243 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import psutil
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.atomic_io import atomic_write_json
+from utils.standin_sites import GAMES, StandinSites
+
+# Intervalle (secondes) entre deux mesures de la mémoire et des processus
+SAMPLE_INTERVAL = 0.5
+
+def percentile(values, pct):
+    """
+    Percentile par interpolation linéaire
+
+    Args:
+        values (list): Mesures
+        pct (float): Percentile voulu (0-100)
+
+    Returns:
+        float: Valeur du percentile, ou None si aucune mesure
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+class ResourceSampler:
+    """Mesure en continu la mémoire du processus et de ses descendants (chromedriver, Chrome)"""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak_rss_mb = 0.0
+        self.peak_chrome_processes = 0
+        self.peak_chromedrivers = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        root = psutil.Process()
+        rss, chrome, drivers = 0, 0, 0
+        for process in [root] + root.children(recursive=True):
+            try:
+                rss += process.memory_info().rss
+                name = process.name().lower()
+            except psutil.Error:
+                continue
+            if "chromedriver" in name:
+                drivers += 1
+            elif "chrome" in name or "chromium" in name:
+                chrome += 1
+        self.peak_rss_mb = max(self.peak_rss_mb, rss / (1024 * 1024))
+        self.peak_chrome_processes = max(self.peak_chrome_processes, chrome)
+        self.peak_chromedrivers = max(self.peak_chromedrivers, drivers)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+def _isolate_environment(work_dir, warm):
+    """
+    Oriente les données et les caches partagés vers un dossier temporaire, avant tout import des scrapers
+
+    Les jeux et configurations de test, la table des fiches, l'index de recherche, le miroir
+    SQLite, les images téléchargées et le rapport mémoire sont écrits dans ce dossier : les
+    données de production ne sont jamais touchées.
+
+    Sans --warm, les fiches locales et le catalogue statique sont ignorés : chaque
+    utilisateur simulé parcourt le flux complet.
+    """
+    os.environ["GAMECONFIG_DATA_DIR"] = os.path.join(work_dir, "data")
+    os.environ["GAMECONFIG_CATALOG_PATH"] = os.path.join(work_dir, "static_catalog.json")
+    os.environ["GAMECONFIG_PAGE_CACHE_DB"] = os.path.join(work_dir, "page_cache.db")
+    os.environ["GAMECONFIG_PRICE_HISTORY_DIR"] = os.path.join(work_dir, "price_history")
+    os.environ["GAMECONFIG_IMAGE_CACHE_DIR"] = os.path.join(work_dir, "image_cache")
+    os.environ["GAMECONFIG_MEMORY_REPORT"] = os.path.join(work_dir, "memory_diagnostics.jsonl")
+    os.environ["GAMECONFIG_CHROME_PROFILE_DIR"] = os.path.join(work_dir, "chrome_profiles")
+    if not warm:
+        os.environ["GAMECONFIG_LOCAL_MAX_AGE_DAYS"] = "0"
+        os.environ["GAMECONFIG_CATALOG_MAX_AGE_HOURS"] = "0"
+
+def run_load_test(users=4, runs_per_user=2, ramp_up=0.0, headless=True, warm=False,
+                  site_latency=0.0, ig_url=None, pcpp_url=None, seed=0, keep_output=False):
+    """
+    Lance des utilisateurs simulés en parallèle sur le flux complet de génération
+
+    Chaque utilisateur enchaîne runs_per_user générations (run_pipeline, le même enchaînement
+    que ui/app.py) avec un jeu et un type de configuration tirés au hasard.
+
+    Args:
+        users (int): Nombre d'utilisateurs simultanés
+        runs_per_user (int): Générations par utilisateur
+        ramp_up (float): Durée (secondes) sur laquelle les utilisateurs démarrent
+        headless (bool): Lance Chrome sans interface
+        warm (bool): Autorise les fiches locales et le catalogue statique entre utilisateurs
+        site_latency (float): Latence ajoutée par les sites de substitution (secondes)
+        ig_url (str): Instant Gaming à utiliser à la place du site de substitution
+        pcpp_url (str): PCPartPicker à utiliser à la place du site de substitution
+        seed (int): Graine du tirage des jeux et types de configuration
+        keep_output (bool): Conserve le dossier de travail (jeux, configurations, caches produits)
+
+    Returns:
+        dict: Rapport (débit, latences, mémoire et processus Chrome maximum, erreurs)
+    """
+    work_dir = tempfile.mkdtemp(prefix="gameconfig-loadtest-")
+    _isolate_environment(work_dir, warm)
+
+    sites = None
+    if not (ig_url and pcpp_url):
+        sites = StandinSites(latency=site_latency).start()
+    os.environ["GAMECONFIG_IG_BASE_URL"] = ig_url or sites.instant_gaming_url
+    os.environ["GAMECONFIG_PCPP_BASE_URL"] = pcpp_url or sites.pcpartpicker_url
+
+    # Import après la configuration de l'environnement : les adresses des sites sont lues à l'import
+    from scrapers.pipeline import run_pipeline
+
+    rng = random.Random(seed)
+    plan = [
+        [(rng.choice(GAMES)["name"], rng.choice([True, False])) for _ in range(runs_per_user)]
+        for _ in range(users)
+    ]
+    results = []
+    results_lock = threading.Lock()
+
+    def simulate_user(index):
+        time.sleep(ramp_up * index / max(users, 1))
+        for game_name, use_recommended in plan[index]:
+            started = time.perf_counter()
+            try:
+                summary = run_pipeline(game_name, use_recommended=use_recommended, headless=headless)
+                outcome = {"ok": True, "browser_usage": summary.get("browser_usage", {})}
+            except Exception as e:
+                outcome = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            outcome.update(user=index, game=game_name, latency=time.perf_counter() - started)
+            with results_lock:
+                results.append(outcome)
+
+    debug_print(f"Test de charge: {users} utilisateurs x {runs_per_user} générations", level="info")
+    started = time.perf_counter()
+    try:
+        with ResourceSampler() as sampler:
+            with ThreadPoolExecutor(max_workers=users) as executor:
+                list(executor.map(simulate_user, range(users)))
+            sampler.sample()
+    finally:
+        if sites:
+            sites.stop()
+    duration = time.perf_counter() - started
+
+    if not keep_output:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    latencies = [result["latency"] for result in results if result["ok"]]
+    errors = [result for result in results if not result["ok"]]
+
+    # Coût de Chrome par génération et par site (mesuré par ManagedBrowser sur l'arbre de processus)
+    browser_cost = {}
+    for result in results:
+        for site, usage in result.get("browser_usage", {}).items():
+            browser_cost.setdefault(site, []).append(usage)
+    browser_cost = {
+        site: {
+            "sessions": len(usages),
+            "peak_rss_mb_p50": round(percentile([u["peak_rss_mb"] for u in usages], 50), 1),
+            "peak_rss_mb_max": max(u["peak_rss_mb"] for u in usages),
+            "cpu_seconds_p50": round(percentile([u["cpu_seconds"] for u in usages], 50), 2),
+            "cpu_seconds_total": round(sum(u["cpu_seconds"] for u in usages), 2),
+            "peak_processes_max": max(u["peak_processes"] for u in usages),
+        }
+        for site, usages in browser_cost.items()
+    }
+    return {
+        "users": users,
+        "runs": len(results),
+        "succeeded": len(latencies),
+        "failed": len(errors),
+        "duration_s": round(duration, 2),
+        "throughput_per_min": round(len(latencies) / duration * 60, 2) if duration else 0.0,
+        "latency_s": {
+            name: round(value, 2) if value is not None else None
+            for name, value in (
+                ("p50", percentile(latencies, 50)),
+                ("p90", percentile(latencies, 90)),
+                ("p95", percentile(latencies, 95)),
+                ("p99", percentile(latencies, 99)),
+                ("max", max(latencies) if latencies else None),
+            )
+        },
+        "peak_rss_mb": round(sampler.peak_rss_mb, 1),
+        "peak_chrome_processes": sampler.peak_chrome_processes,
+        "peak_chromedrivers": sampler.peak_chromedrivers,
+        "browser_cost": browser_cost,
+        "errors": [f"{error['game']}: {error['error']}" for error in errors[:10]],
+        "work_dir": work_dir if keep_output else None,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test de charge du flux de génération de configurations")
+    parser.add_argument("--users", type=int, default=4, help="Utilisateurs simultanés")
+    parser.add_argument("--runs", type=int, default=2, help="Générations par utilisateur")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Démarrage progressif des utilisateurs (secondes)")
+    parser.add_argument("--warm", action="store_true", help="Autorise les fiches locales et le catalogue statique")
+    parser.add_argument("--site-latency", type=float, default=0.0, help="Latence des sites de substitution (secondes)")
+    parser.add_argument("--ig-url", default=None, help="Instant Gaming à utiliser (par défaut: site de substitution)")
+    parser.add_argument("--pcpp-url", default=None, help="PCPartPicker à utiliser (par défaut: site de substitution)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep-output", action="store_true", help="Conserve le dossier de travail (jeux, configurations, caches)")
+    parser.add_argument("--no-headless", action="store_true", help="Affiche les navigateurs")
+    parser.add_argument("--output", default=None, help="Écrit le rapport JSON dans ce fichier")
+    args = parser.parse_args()
+
+    report = run_load_test(
+        users=args.users, runs_per_user=args.runs, ramp_up=args.ramp_up, headless=not args.no_headless,
+        warm=args.warm, site_latency=args.site_latency, ig_url=args.ig_url, pcpp_url=args.pcpp_url,
+        seed=args.seed, keep_output=args.keep_output,
+    )
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if args.output:
+        atomic_write_json(args.output, report)
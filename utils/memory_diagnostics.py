@@ -0,0 +1,157 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.atomic_io import file_lock
+
+# Diagnostic mémoire activé (GAMECONFIG_MEMORY_DIAGNOSTICS=1) : tracemalloc démarre au premier point de mesure
+ENABLED = os.environ.get("GAMECONFIG_MEMORY_DIAGNOSTICS", "0") == "1"
+
+# Profondeur de pile conservée par allocation (plus profond = sites plus précis, mais plus coûteux)
+TRACE_FRAMES = int(os.environ.get("GAMECONFIG_MEMORY_FRAMES", 10))
+
+# Nombre de sites d'allocation rapportés par point de mesure
+TOP_N = 15
+
+REPORT_PATH = os.environ.get(
+    "GAMECONFIG_MEMORY_REPORT",
+    os.path.join(
+        os.environ.get("GAMECONFIG_DATA_DIR", os.path.join(Path(__file__).parent.parent, "data")),
+        "memory_diagnostics.jsonl"
+    )
+)
+
+# Dernier instantané global et dernier instantané par point de mesure
+_lock = threading.Lock()
+_previous = None
+_previous_by_label = {}
+
+def _snapshot():
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACE_FRAMES)
+    # Les allocations du module tracemalloc et de l'import système ne sont pas pertinentes
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+
+def _site(stat):
+    # Frame la plus récente située dans le projet, sinon la plus récente tout court
+    frames = list(stat.traceback)
+    for frame in reversed(frames):
+        if "site-packages" not in frame.filename and "lib/python" not in frame.filename:
+            return f"{frame.filename}:{frame.lineno}"
+    frame = frames[-1]
+    return f"{frame.filename}:{frame.lineno}"
+
+def _top(stats, top, key):
+    return [
+        {"site": _site(stat), "size_kb": round(getattr(stat, key) / 1024, 1), "count": stat.count}
+        for stat in stats[:top]
+    ]
+
+def checkpoint(label, top=TOP_N):
+    """
+    Point de mesure mémoire : fin d'une phase du scraping ou d'un rendu de page
+
+    Sans diagnostic activé, la fonction ne fait rien. Sinon elle rapporte les principaux
+    sites d'allocation, la croissance depuis le point de mesure précédent et depuis le
+    dernier passage par ce même point (croissance d'un rendu ou d'une génération à l'autre),
+    dans les logs et dans data/memory_diagnostics.jsonl.
+
+    Args:
+        label (str): Nom du point de mesure (ex: "pipeline.pcpartpicker", "render.historique")
+        top (int): Nombre de sites d'allocation rapportés
+
+    Returns:
+        dict: Rapport du point de mesure, ou None si le diagnostic est désactivé
+    """
+    if not ENABLED:
+        return None
+    global _previous
+
+    import tracemalloc
+
+    with _lock:
+        snapshot = _snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        report = {
+            "label": label,
+            "timestamp": time.time(),
+            "pid": os.getpid(),
+            "traced_mb": round(current / (1024 * 1024), 2),
+            "peak_mb": round(peak / (1024 * 1024), 2),
+            "top": _top(snapshot.statistics("traceback"), top, "size"),
+        }
+        if _previous is not None:
+            growth = snapshot.compare_to(_previous, "traceback")
+            report["growth_since_previous"] = _top([stat for stat in growth if stat.size_diff > 0], top, "size_diff")
+        previous_run = _previous_by_label.get(label)
+        if previous_run is not None:
+            growth = snapshot.compare_to(previous_run, "traceback")
+            report["growth_since_last_run_kb"] = round(sum(stat.size_diff for stat in growth) / 1024, 1)
+            report["growth_since_last_run"] = _top([stat for stat in growth if stat.size_diff > 0], top, "size_diff")
+        _previous = snapshot
+        _previous_by_label[label] = snapshot
+
+    message = f"Mémoire [{label}]: {report['traced_mb']} Mo suivis (pic {report['peak_mb']} Mo)"
+    if "growth_since_last_run_kb" in report:
+        message += f", {report['growth_since_last_run_kb']:+} Ko depuis le passage précédent"
+        for entry in report["growth_since_last_run"][:3]:
+            message += f"\n    +{entry['size_kb']} Ko  {entry['site']}"
+    debug_print(message, level="debug")
+
+    try:
+        os.makedirs(os.path.dirname(REPORT_PATH), exist_ok=True)
+        with file_lock(REPORT_PATH):
+            with open(REPORT_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(report, ensure_ascii=False) + "\n")
+    except OSError as e:
+        debug_print(f"Impossible d'écrire le rapport mémoire: {e}", level="warning")
+    return report
+
+def summarize(report_path=REPORT_PATH, top=5):
+    """
+    Croissance mémoire par point de mesure, d'un passage à l'autre
+
+    Args:
+        report_path (str): Fichier JSONL produit par checkpoint
+        top (int): Nombre de sites d'allocation affichés par point de mesure
+
+    Returns:
+        dict: Par point de mesure : passages, mémoire suivie au premier et au dernier passage,
+            croissance cumulée et sites qui grossissent le plus souvent
+    """
+    summary = {}
+    with open(report_path, "r", encoding="utf-8") as f:
+        for line in f:
+            report = json.loads(line)
+            entry = summary.setdefault(report["label"], {
+                "runs": 0, "first_mb": report["traced_mb"], "last_mb": None, "growth_kb": 0.0, "sites": {},
+            })
+            entry["runs"] += 1
+            entry["last_mb"] = report["traced_mb"]
+            entry["growth_kb"] = round(entry["growth_kb"] + report.get("growth_since_last_run_kb", 0.0), 1)
+            for site in report.get("growth_since_last_run", []):
+                entry["sites"][site["site"]] = round(entry["sites"].get(site["site"], 0.0) + site["size_kb"], 1)
+    for entry in summary.values():
+        entry["sites"] = dict(sorted(entry["sites"].items(), key=lambda item: -item[1])[:top])
+    return summary
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Synthèse des diagnostics mémoire (GAMECONFIG_MEMORY_DIAGNOSTICS=1)")
+    parser.add_argument("--report", default=REPORT_PATH, help="Fichier JSONL des points de mesure")
+    parser.add_argument("--top", type=int, default=5, help="Sites d'allocation affichés par point de mesure")
+    args = parser.parse_args()
+
+    print(json.dumps(summarize(args.report, args.top), indent=2, ensure_ascii=False))
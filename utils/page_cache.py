@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+
+CACHE_PATH = os.environ.get(
+    "GAMECONFIG_PAGE_CACHE_DB",
+    os.path.join(Path(__file__).parent.parent, "data", "page_cache.db")
+)
+
+# Renvoie le HTML concaténé des éléments correspondant aux sélecteurs, en un seul aller-retour WebDriver
+_REGION_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0])).map(function (e) { return e.outerHTML; }).join('');
+"""
+
+def _connect(cache_path=CACHE_PATH):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    conn = sqlite3.connect(cache_path, timeout=30)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA busy_timeout = 30000")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS extractions (
+            scope TEXT NOT NULL,
+            url TEXT NOT NULL,
+            region_hash TEXT NOT NULL,
+            result TEXT NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (scope, url)
+        )
+    """)
+    return conn
+
+def region_hash(driver, selectors):
+    """
+    Empreinte de la zone utile d'une page (prix, images, spécifications...)
+
+    Args:
+        driver: WebDriver positionné sur la page
+        selectors (str): Sélecteurs CSS de la zone, séparés par des virgules
+
+    Returns:
+        str: Empreinte SHA-256, ou None si la zone est vide ou illisible
+    """
+    try:
+        html = driver.execute_script(_REGION_SCRIPT, selectors)
+    except Exception as e:
+        debug_print(f"Zone de page illisible pour l'empreinte: {e}", level="debug")
+        return None
+    if not html:
+        return None
+    # Les espaces de mise en forme ne constituent pas un changement
+    normalized = re.sub(r"\s+", " ", html).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+def cached_extraction(scope, url, digest, cache_path=CACHE_PATH):
+    """
+    Résultat d'extraction précédent d'une page, s'il a été obtenu sur un contenu identique
+
+    Args:
+        scope (str): Extracteur concerné (ex: "pcpartpicker.details")
+        url (str): Adresse de la page
+        digest (str): Empreinte actuelle de la zone utile
+
+    Returns:
+        dict: Résultat réutilisable, ou None si la page a changé ou n'a jamais été extraite
+    """
+    if digest is None:
+        return None
+    try:
+        conn = _connect(cache_path)
+        try:
+            row = conn.execute(
+                "SELECT region_hash, result FROM extractions WHERE scope = ? AND url = ?", (scope, url)
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        debug_print(f"Cache d'extraction indisponible: {e}", level="warning")
+        return None
+    if row is None or row[0] != digest:
+        return None
+    return json.loads(row[1])
+
+def store_extraction(scope, url, digest, result, cache_path=CACHE_PATH):
+    """
+    Conserve le résultat d'extraction d'une page avec l'empreinte de sa zone utile
+
+    Args:
+        scope (str): Extracteur concerné
+        url (str): Adresse de la page
+        digest (str): Empreinte de la zone utile au moment de l'extraction
+        result (dict): Résultat sérialisable en JSON
+    """
+    if digest is None:
+        return
+    try:
+        conn = _connect(cache_path)
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO extractions (scope, url, region_hash, result, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (scope, url, digest, json.dumps(result, ensure_ascii=False), time.time())
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        # Le cache n'est qu'une optimisation : l'extraction reste valable
+        debug_print(f"Impossible de mettre en cache l'extraction de {url}: {e}", level="warning")
@@ -0,0 +1,187 @@
+import glob
+import io
+import os
+import sys
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.prices import parse_price
+from utils.atomic_io import atomic_write_bytes, file_lock
+
+HISTORY_DIR = os.environ.get(
+    "GAMECONFIG_PRICE_HISTORY_DIR",
+    os.path.join(Path(__file__).parent.parent, "data", "price_history")
+)
+
+# Fichier consolidé (Parquet) et segments ajoutés depuis la dernière consolidation
+HISTORY_FILE = "history.parquet"
+SEGMENT_PATTERN = "segment-*.parquet"
+
+# Nombre de segments au-delà duquel ils sont fusionnés dans le fichier consolidé
+COMPACT_THRESHOLD = 50
+
+COLUMNS = ["observed_at", "link", "merchant", "price", "buy_link"]
+
+_compact_lock = threading.Lock()
+
+def _empty_frame():
+    return pd.DataFrame({
+        "observed_at": pd.Series(dtype="datetime64[ns, UTC]"),
+        "link": pd.Series(dtype="string"),
+        "merchant": pd.Series(dtype="string"),
+        "price": pd.Series(dtype="float64"),
+        "buy_link": pd.Series(dtype="string"),
+    })
+
+def _normalize_types(df):
+    df = df.astype({"link": "string", "merchant": "string", "price": "float64", "buy_link": "string"})
+    df["observed_at"] = pd.to_datetime(df["observed_at"], utc=True)
+    return df
+
+def _write_parquet(df, path):
+    # Écriture atomique : un lecteur ne voit jamais de fichier partiel
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False)
+    atomic_write_bytes(path, buffer.getvalue())
+
+def record_prices(link, merchant_options, observed_at=None):
+    """
+    Ajoute les prix observés d'un produit à l'historique
+
+    Args:
+        link (str): Lien PCPartPicker du produit
+        merchant_options (list): Offres renvoyées par get_component_details (merchant, price, link)
+        observed_at (datetime): Date d'observation (maintenant par défaut)
+
+    Returns:
+        int: Nombre d'observations enregistrées
+    """
+    observed_at = observed_at or datetime.now(timezone.utc)
+    rows = []
+    for option in merchant_options:
+        price = parse_price(option.get("price"))
+        if price is None:
+            continue
+        rows.append({
+            "observed_at": observed_at,
+            "link": link,
+            "merchant": option.get("merchant") or "N/A",
+            "price": price,
+            "buy_link": option.get("link") or "",
+        })
+
+    if not rows:
+        return 0
+
+    try:
+        os.makedirs(HISTORY_DIR, exist_ok=True)
+        segment_name = f"segment-{observed_at.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+        _write_parquet(_normalize_types(pd.DataFrame(rows, columns=COLUMNS)), os.path.join(HISTORY_DIR, segment_name))
+    except Exception as e:
+        debug_print(f"Impossible d'enregistrer l'historique des prix de {link}: {e}", level="warning")
+        return 0
+
+    if len(glob.glob(os.path.join(HISTORY_DIR, SEGMENT_PATTERN))) >= COMPACT_THRESHOLD:
+        compact()
+
+    return len(rows)
+
+def compact():
+    """Fusionne les segments dans le fichier consolidé, trié par produit, marchand et date"""
+    # Verrou inter-processus : une seule consolidation à la fois entre sessions et workers
+    with _compact_lock, file_lock(os.path.join(HISTORY_DIR, HISTORY_FILE)):
+        segments = sorted(glob.glob(os.path.join(HISTORY_DIR, SEGMENT_PATTERN)))
+        if not segments:
+            return
+
+        history_path = os.path.join(HISTORY_DIR, HISTORY_FILE)
+        frames = [pd.read_parquet(path) for path in segments]
+        if os.path.exists(history_path):
+            frames.insert(0, pd.read_parquet(history_path))
+
+        df = _normalize_types(pd.concat(frames, ignore_index=True))
+        df = df.drop_duplicates().sort_values(["link", "merchant", "observed_at"], ignore_index=True)
+        _write_parquet(df, history_path)
+
+        # Les segments ne sont supprimés qu'une fois le fichier consolidé en place
+        for path in segments:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        debug_print(f"Historique des prix consolidé: {len(df)} observations", level="debug")
+
+def load_history(link=None, since=None):
+    """
+    Charge l'historique des prix dans un DataFrame
+
+    Args:
+        link (str or list): Limite l'historique à un ou plusieurs produits
+        since (datetime): Ne garde que les observations postérieures à cette date
+
+    Returns:
+        pandas.DataFrame: Colonnes observed_at, link, merchant, price, buy_link
+    """
+    paths = glob.glob(os.path.join(HISTORY_DIR, HISTORY_FILE)) + glob.glob(os.path.join(HISTORY_DIR, SEGMENT_PATTERN))
+    frames = []
+    for path in paths:
+        try:
+            frames.append(pd.read_parquet(path))
+        except (FileNotFoundError, OSError):
+            # Segment supprimé par une consolidation concurrente : ses lignes sont dans le fichier consolidé
+            continue
+
+    if not frames:
+        return _empty_frame()
+
+    df = _normalize_types(pd.concat(frames, ignore_index=True)).drop_duplicates()
+
+    if link is not None:
+        links = [link] if isinstance(link, str) else list(link)
+        df = df[df["link"].isin(links)]
+    if since is not None:
+        since = pd.Timestamp(since)
+        since = since.tz_localize("UTC") if since.tzinfo is None else since.tz_convert("UTC")
+        df = df[df["observed_at"] >= since]
+
+    return df.sort_values("observed_at", ignore_index=True)
+
+def cheapest_prices(link=None, days=7):
+    """
+    Meilleur prix observé par produit sur une période
+
+    Args:
+        link (str or list): Produit(s) à interroger (tous par défaut)
+        days (int): Nombre de jours d'historique à considérer
+
+    Returns:
+        pandas.DataFrame: Une ligne par produit (link, price, merchant, buy_link, observed_at)
+    """
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    df = load_history(link=link, since=since)
+    if df.empty:
+        return df
+    cheapest = df.loc[df.groupby("link")["price"].idxmin()]
+    return cheapest[["link", "price", "merchant", "buy_link", "observed_at"]].reset_index(drop=True)
+
+def price_trend(link, freq="D"):
+    """
+    Évolution du meilleur prix d'un produit
+
+    Args:
+        link (str): Lien du produit
+        freq (str): Période d'agrégation pandas ('D' pour jour, 'W' pour semaine)
+
+    Returns:
+        pandas.DataFrame: Prix minimum, maximum et moyen par période
+    """
+    df = load_history(link=link)
+    if df.empty:
+        return pd.DataFrame(columns=["min", "max", "mean"])
+    return df.set_index("observed_at")["price"].resample(freq).agg(["min", "max", "mean"]).dropna()
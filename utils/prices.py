@@ -0,0 +1,36 @@
+import re
+
+def parse_price(price_text):
+    """
+    Convertit un prix affiché en nombre
+
+    Gère les formats produits par les scrapers ('114,90€', '1,234,90€', '€114.90+').
+    Le dernier séparateur suivi de 1 ou 2 chiffres est considéré comme décimal,
+    les autres comme séparateurs de milliers.
+
+    Args:
+        price_text (str): Prix au format texte
+
+    Returns:
+        float: Prix numérique, ou None si le prix n'est pas disponible
+    """
+    if price_text is None:
+        return None
+    if isinstance(price_text, (int, float)):
+        return float(price_text)
+
+    text = re.sub(r"[^\d,.]", "", str(price_text))
+    if not text:
+        return None
+
+    match = re.search(r"[,.](\d{1,2})$", text)
+    if match:
+        integer_part = re.sub(r"[,.]", "", text[:match.start()])
+        text = f"{integer_part or '0'}.{match.group(1)}"
+    else:
+        text = re.sub(r"[,.]", "", text)
+
+    try:
+        return float(text)
+    except ValueError:
+        return None
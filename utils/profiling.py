@@ -0,0 +1,131 @@
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.atomic_io import atomic_write_bytes
+
+# Profilage activé pour toutes les générations (GAMECONFIG_PROFILE=1), en plus de la case du formulaire
+PROFILE_BY_DEFAULT = os.environ.get("GAMECONFIG_PROFILE", "0") == "1"
+
+# Nombre de fonctions listées dans le résumé
+TOP_N = int(os.environ.get("GAMECONFIG_PROFILE_TOP", 30))
+
+# Un seul profileur déterministe peut être actif à la fois dans un processus
+_active_lock = threading.Lock()
+
+class _DisabledProfiler:
+    """Profileur inactif : aucune instrumentation, aucun fichier produit"""
+
+    enabled = False
+
+    def phase(self, name):
+        return contextlib.nullcontext()
+
+    def save(self, config_path, top=TOP_N):
+        return None
+
+_DISABLED = _DisabledProfiler()
+
+class RunProfiler:
+    """Profil cProfile d'une génération, découpé en phases (Instant Gaming, PCPartPicker...)"""
+
+    enabled = True
+
+    def __init__(self):
+        import cProfile
+
+        self.profile = cProfile.Profile()
+        self.phases = []  # (nom, durée en secondes)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Profile le bloc et mesure sa durée
+
+        Args:
+            name (str): Nom de la phase dans le résumé
+        """
+        # Une seule génération profilée à la fois : les autres s'exécutent sans instrumentation
+        if not _active_lock.acquire(blocking=False):
+            debug_print(f"Profilage déjà actif dans ce processus, phase '{name}' non profilée", level="warning")
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            self.profile.enable()
+            try:
+                yield
+            finally:
+                self.profile.disable()
+        finally:
+            _active_lock.release()
+            self.phases.append((name, time.perf_counter() - started))
+
+    def summary(self, top=TOP_N):
+        """
+        Résumé texte : durée des phases puis fonctions les plus coûteuses
+
+        Args:
+            top (int): Nombre de fonctions listées par critère
+
+        Returns:
+            str: Résumé lisible
+        """
+        import pstats
+
+        lines = ["Phases:"]
+        lines += [f"  {name:<20} {duration:8.2f} s" for name, duration in self.phases]
+
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream).strip_dirs()
+        stream.write(f"\nTop {top} par temps cumulé:\n")
+        stats.sort_stats("cumulative").print_stats(top)
+        stream.write(f"\nTop {top} par temps propre:\n")
+        stats.sort_stats("tottime").print_stats(top)
+        return "\n".join(lines) + "\n" + stream.getvalue()
+
+    def save(self, config_path, top=TOP_N):
+        """
+        Écrit le profil (.prof, lisible avec pstats ou snakeviz) et son résumé à côté de la configuration
+
+        Args:
+            config_path (str): Fichier JSON de la configuration sauvegardée
+            top (int): Nombre de fonctions listées dans le résumé
+
+        Returns:
+            dict: Chemins produits (profile, summary) et durée des phases, ou None si rien n'a été profilé
+        """
+        if not self.phases:
+            return None
+        import marshal
+        import pstats
+
+        base = os.path.splitext(config_path)[0]
+        profile_path = f"{base}.prof"
+        summary_path = f"{base}.profile.txt"
+
+        # Même format que Profile.dump_stats, écrit de façon atomique
+        self.profile.create_stats()
+        atomic_write_bytes(profile_path, marshal.dumps(pstats.Stats(self.profile).stats))
+        atomic_write_bytes(summary_path, self.summary(top).encode("utf-8"))
+        debug_print(f"Profil enregistré: {profile_path}", level="info")
+        return {"profile": profile_path, "summary": summary_path, "phases": dict(self.phases)}
+
+def start_profiler(enabled=None):
+    """
+    Profileur d'une génération
+
+    Args:
+        enabled (bool): Active le profilage (par défaut : variable GAMECONFIG_PROFILE)
+
+    Returns:
+        RunProfiler ou profileur inactif (sans aucun surcoût) selon enabled
+    """
+    if enabled is None:
+        enabled = PROFILE_BY_DEFAULT
+    return RunProfiler() if enabled else _DISABLED
@@ -0,0 +1,205 @@
+import json
+import os
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+
+DATA_DIR = os.environ.get("GAMECONFIG_DATA_DIR", os.path.join(Path(__file__).parent.parent, "data"))
+INDEX_PATH = os.path.join(DATA_DIR, "search_index.db")
+
+# Dossiers indexés et type de document associé
+INDEXED_DIRS = {
+    "game": os.path.join(DATA_DIR, "instantgaming"),
+    "config": os.path.join(DATA_DIR, "pcpartpicker"),
+}
+
+def _connect(index_path=INDEX_PATH):
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    conn = sqlite3.connect(index_path, timeout=30)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA busy_timeout = 30000")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS documents (
+            path TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            mtime REAL NOT NULL,
+            title TEXT NOT NULL
+        )
+    """)
+    # Index inversé : diacritiques ignorés pour que "recommandee" trouve "recommandée"
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+            path UNINDEXED, kind UNINDEXED, title, body,
+            tokenize = 'unicode61 remove_diacritics 2'
+        )
+    """)
+    return conn
+
+def _kind_of(path):
+    directory = os.path.dirname(os.path.abspath(path))
+    for kind, indexed_dir in INDEXED_DIRS.items():
+        if directory == os.path.abspath(indexed_dir):
+            return kind
+    return None
+
+def _flatten(value):
+    """Liste les chaînes contenues dans une valeur JSON (specs avec alternatives, etc.)"""
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _flatten(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in _flatten(item)]
+    return [str(value)] if value not in (None, "") else []
+
+def _document_text(kind, data):
+    """
+    Construit le titre et le texte indexé d'un document
+
+    Returns:
+        tuple: (titre, corps)
+    """
+    if kind == "game":
+        title = data.get("game", "")
+        body = _flatten(data.get("minimal", {})) + _flatten(data.get("recommended", {}))
+        return title, " ".join(body)
+
+    title = data.get("name", "")
+    body = [data.get("game_name") or ""]
+    for component in data.get("components", {}).values():
+        body.append(component.get("name", ""))
+    for alternatives in data.get("alternative_components", {}).values():
+        body.extend(alternative.get("name", "") for alternative in alternatives)
+    body += _flatten(data.get("search_terms", {}))
+    return title, " ".join(body)
+
+def index_document(path, data=None, index_path=INDEX_PATH):
+    """
+    Ajoute ou met à jour un fichier de jeu ou de configuration dans l'index
+
+    Args:
+        path (str): Chemin du fichier JSON (dans data/instantgaming ou data/pcpartpicker)
+        data (dict): Contenu déjà chargé du fichier (relu depuis le disque si None)
+
+    Returns:
+        bool: True si le document a été indexé
+    """
+    kind = _kind_of(path)
+    if kind is None:
+        return False
+    try:
+        if data is None:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        title, body = _document_text(kind, data)
+        path = os.path.abspath(path)
+        conn = _connect(index_path)
+        try:
+            with conn:
+                conn.execute("DELETE FROM documents_fts WHERE path = ?", (path,))
+                conn.execute("INSERT INTO documents_fts (path, kind, title, body) VALUES (?, ?, ?, ?)", (path, kind, title, body))
+                conn.execute(
+                    "INSERT OR REPLACE INTO documents (path, kind, mtime, title) VALUES (?, ?, ?, ?)",
+                    (path, kind, os.path.getmtime(path), title)
+                )
+        finally:
+            conn.close()
+        return True
+    except Exception as e:
+        # L'index se resynchronise au prochain sync() : une erreur ne doit pas bloquer la sauvegarde
+        debug_print(f"Impossible d'indexer {path}: {e}", level="warning")
+        return False
+
+def sync(index_path=INDEX_PATH):
+    """
+    Met l'index à jour avec les fichiers ajoutés, modifiés ou supprimés depuis le dernier passage
+
+    Returns:
+        int: Nombre de documents (ré)indexés ou supprimés
+    """
+    conn = _connect(index_path)
+    try:
+        indexed = dict(conn.execute("SELECT path, mtime FROM documents").fetchall())
+    finally:
+        conn.close()
+
+    on_disk = {}
+    for indexed_dir in INDEXED_DIRS.values():
+        try:
+            with os.scandir(indexed_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".json"):
+                        on_disk[os.path.abspath(entry.path)] = entry.stat().st_mtime
+        except FileNotFoundError:
+            continue
+
+    changes = 0
+    for path, mtime in on_disk.items():
+        if indexed.get(path) != mtime and index_document(path, index_path=index_path):
+            changes += 1
+
+    removed = [path for path in indexed if path not in on_disk]
+    if removed:
+        conn = _connect(index_path)
+        try:
+            with conn:
+                conn.executemany("DELETE FROM documents_fts WHERE path = ?", [(path,) for path in removed])
+                conn.executemany("DELETE FROM documents WHERE path = ?", [(path,) for path in removed])
+        finally:
+            conn.close()
+        changes += len(removed)
+
+    if changes:
+        debug_print(f"Index de recherche mis à jour: {changes} documents", level="debug")
+    return changes
+
+def _fts_query(query):
+    # Chaque mot doit apparaître ; le dernier est traité comme un préfixe ("rtx 30" trouve "RTX 3060")
+    tokens = re.findall(r"\w+", query, flags=re.UNICODE)
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens[:-1]] + [f'"{tokens[-1]}"*']
+    return " ".join(terms)
+
+def search(query, kind=None, limit=50, index_path=INDEX_PATH):
+    """
+    Recherche plein texte dans les jeux et configurations sauvegardés
+
+    Args:
+        query (str): Texte recherché (ex: "RTX 3060")
+        kind (str): 'game' ou 'config' pour limiter le type de document
+        limit (int): Nombre maximum de résultats
+
+    Returns:
+        list: Résultats triés par pertinence (path, kind, title, snippet)
+    """
+    fts_query = _fts_query(query)
+    if fts_query is None:
+        return []
+
+    sql = """
+        SELECT path, kind, title, snippet(documents_fts, 3, '**', '**', '…', 12)
+        FROM documents_fts WHERE documents_fts MATCH ?
+    """
+    params = [fts_query]
+    if kind:
+        sql += " AND kind = ?"
+        params.append(kind)
+    sql += " ORDER BY bm25(documents_fts) LIMIT ?"
+    params.append(limit)
+
+    conn = _connect(index_path)
+    try:
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+    return [{"path": path, "kind": kind, "title": title, "snippet": snippet} for path, kind, title, snippet in rows]
+
+if __name__ == "__main__":
+    changes = sync()
+    debug_print(f"Index synchronisé ({changes} changements)", level="success")
+    if len(sys.argv) > 1:
+        for result in search(" ".join(sys.argv[1:])):
+            print(f"[{result['kind']}] {result['title']} — {result['snippet']}")
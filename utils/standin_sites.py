@@ -0,0 +1,237 @@
+import argparse
+import base64
+import hashlib
+import html
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Jeux servis par l'Instant Gaming de substitution (spécifications au format du vrai site)
+GAMES = [
+    {
+        "name": "Loadtest Racing",
+        "price": "19,99",
+        "minimal": {"OS": "Windows 10 64-bit", "Processor": "Intel Core i5-4460 / AMD FX-6300", "Memory": "8 GB RAM",
+                    "Graphics": "NVIDIA GeForce GTX 960 / AMD Radeon R7 370", "Storage": "50 GB available space"},
+        "recommended": {"OS": "Windows 10 64-bit", "Processor": "Intel Core i7-8700 / AMD Ryzen 5 3600", "Memory": "16 GB RAM",
+                        "Graphics": "NVIDIA GeForce RTX 2060 / AMD Radeon RX 5700", "Storage": "50 GB SSD"},
+    },
+    {
+        "name": "Loadtest Shooter",
+        "price": "39,99",
+        "minimal": {"OS": "Windows 10 64-bit", "Processor": "Intel Core i5-6600K / AMD Ryzen 5 1600", "Memory": "12 GB RAM",
+                    "Graphics": "NVIDIA GeForce GTX 1060 / AMD Radeon RX 580", "Storage": "100 GB available space"},
+        "recommended": {"OS": "Windows 11 64-bit", "Processor": "Intel Core i7-10700K / AMD Ryzen 7 3700X", "Memory": "16 GB RAM",
+                        "Graphics": "NVIDIA GeForce RTX 3070 / AMD Radeon RX 6800", "Storage": "100 GB SSD"},
+    },
+    {
+        "name": "Loadtest Strategy",
+        "price": "29,99",
+        "minimal": {"OS": "Windows 7 64-bit", "Processor": "Intel Core i3-2100 / AMD Phenom II X4 965", "Memory": "4 GB RAM",
+                    "Graphics": "NVIDIA GeForce GTX 650 / AMD Radeon HD 7750", "Storage": "30 GB available space"},
+        "recommended": {"OS": "Windows 10 64-bit", "Processor": "Intel Core i5-8400 / AMD Ryzen 5 2600", "Memory": "8 GB RAM",
+                        "Graphics": "NVIDIA GeForce GTX 1660 / AMD Radeon RX 590", "Storage": "30 GB SSD"},
+    },
+    {
+        "name": "Loadtest Open World",
+        "price": "59,99",
+        "minimal": {"OS": "Windows 10 64-bit", "Processor": "Intel Core i7-6700 / AMD Ryzen 5 1600", "Memory": "12 GB RAM",
+                    "Graphics": "NVIDIA GeForce GTX 1060 / AMD Radeon RX 580", "Storage": "70 GB SSD"},
+        "recommended": {"OS": "Windows 10 64-bit", "Processor": "Intel Core i7-12700 / AMD Ryzen 7 7800X3D", "Memory": "16 GB RAM",
+                        "Graphics": "NVIDIA GeForce RTX 2060 SUPER / AMD Radeon RX 5700 XT", "Storage": "70 GB SSD"},
+    },
+]
+
+# Marchands des pages produit de substitution, du moins cher au plus cher
+MERCHANTS = ["Amazon", "LDLC", "Materiel.net"]
+
+# Image PNG 1x1 servie pour toutes les images
+PIXEL_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+)
+
+RESULTS_PER_PAGE = 20
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+def _price(seed, offset=0.0):
+    # Prix déterministe par produit : les mêmes recherches donnent les mêmes résultats d'un test à l'autre
+    cents = int(hashlib.sha256(seed.encode("utf-8")).hexdigest()[:6], 16) % 90000
+    return f"{50 + cents / 100 + offset:.2f}"
+
+def _page(title, body):
+    return f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title></head><body>{body}</body></html>"
+
+def _specs_list(specs):
+    items = "".join(f"<li>{html.escape(key)}: {html.escape(value)}</li>" for key, value in specs.items())
+    return f"<ul class='specs'>{items}</ul>"
+
+def instant_gaming_search(query, page):
+    matches = [(i, game) for i, game in enumerate(GAMES, 1) if query.lower() in game["name"].lower()]
+    matches = matches[(page - 1) * RESULTS_PER_PAGE:page * RESULTS_PER_PAGE]
+    items = "".join(
+        f"<div class='item'><a class='cover' href='/fr/{i}-acheter-{_slug(game['name'])}-pc/'></a>"
+        f"<div class='title' title='{html.escape(game['name'])}'>{html.escape(game['name'])}</div></div>"
+        for i, game in matches
+    )
+    return _page("Rechercher - Instant Gaming", f"<div class='search listing-items'>{items}</div>")
+
+def instant_gaming_product(game_id):
+    if not 1 <= game_id <= len(GAMES):
+        return None
+    game = GAMES[game_id - 1]
+    body = (
+        f"<div class='presentation'><picture class='banner'><img src='/static/game-{game_id}.png'></picture></div>"
+        f"<div class='total'>{game['price']}€</div>"
+        "<div class='specs-container listing-slider'>"
+        f"<div class='minimal'>{_specs_list(game['minimal'])}</div>"
+        f"<div class='recommended'>{_specs_list(game['recommended'])}</div>"
+        "</div>"
+    )
+    return _page(f"{game['name']} - Instant Gaming", body)
+
+def pcpartpicker_home(consent_given):
+    banner = "" if consent_given else (
+        "<div class='cc-window'><a class='cc-btn cc-allow' href='#' onclick=\"document.cookie="
+        "'cookieconsent_status=allow; path=/'; this.parentNode.remove(); return false;\">Allow</a></div>"
+    )
+    body = (
+        f"{banner}<span class='nav__search'>Rechercher</span>"
+        "<form id='site_search_nav' action='/search/' method='get'>"
+        "<input id='search_q' name='q'><button class='button--primary' type='submit'>OK</button></form>"
+    )
+    return _page("PCPartPicker", body)
+
+def pcpartpicker_search(query):
+    items = ""
+    for i in range(1, 4):
+        name = f"{query.strip()} Modèle {i}"
+        slug = _slug(f"{query}-{i}")
+        items += (
+            f"<li><div class='search_results--link'><a href='/product/{slug}'>{html.escape(name)}</a></div>"
+            f"<div class='search_results--price'><a href='/product/{slug}'>€{_price(slug)}</a></div></li>"
+        )
+    body = f"<div class='search-results__pageContent'><ul class='list-unstyled'>{items}</ul></div>"
+    return _page(f"Recherche {query} - PCPartPicker", body)
+
+def pcpartpicker_product(slug):
+    rows = "".join(
+        f"<tr><td class='td__logo'><img alt='{merchant}'></td>"
+        f"<td class='td__finalPrice'><a href='https://example.invalid/{_slug(merchant)}/{slug}'>€{_price(slug, offset=i * 5)}</a></td></tr>"
+        for i, merchant in enumerate(MERCHANTS)
+    )
+    body = (
+        f"<div class='product__image'><img id='pp_main_product_image' src='/static/{slug}.png'></div>"
+        f"<div id='prices'><table><tbody>{rows}</tbody></table></div>"
+    )
+    return _page(f"{slug} - PCPartPicker", body)
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Sert les pages d'Instant Gaming (/fr/...) et de PCPartPicker (/pcpp/...) de substitution"""
+
+    latency = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, content, content_type="text/html; charset=utf-8"):
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        # Latence simulée du site distant
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        path = url.path
+
+        if path.startswith("/static/"):
+            return self._send(200, PIXEL_PNG, "image/png")
+        if path == "/fr/":
+            return self._send(200, _page("Instant Gaming", "<div class='icon-search-input'></div>"))
+        if path == "/fr/rechercher/":
+            page = int(params.get("page", ["1"])[0])
+            return self._send(200, instant_gaming_search(params.get("query", [""])[0], page))
+        match = re.match(r"^/fr/(\d+)-acheter-", path)
+        if match:
+            content = instant_gaming_product(int(match.group(1)))
+            return self._send(200, content) if content else self._send(404, _page("Introuvable", ""))
+
+        if path in ("/pcpp", "/pcpp/"):
+            return self._send(200, pcpartpicker_home("cookieconsent_status" in self.headers.get("Cookie", "")))
+        if path == "/search/":
+            return self._send(200, pcpartpicker_search(params.get("q", [""])[0]))
+        if path.startswith("/product/"):
+            return self._send(200, pcpartpicker_product(path.rsplit("/", 1)[-1]))
+
+        return self._send(404, _page("Introuvable", ""))
+
+class StandinSites:
+    """Serveur HTTP local imitant Instant Gaming et PCPartPicker, pour les tests de charge"""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0):
+        """
+        Args:
+            host (str): Adresse d'écoute
+            port (int): Port d'écoute (0 pour un port libre)
+            latency (float): Délai (secondes) ajouté à chaque réponse
+        """
+        handler = type("Handler", (StandinHandler,), {"latency": latency})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def root_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def instant_gaming_url(self):
+        """Valeur de GAMECONFIG_IG_BASE_URL"""
+        return f"{self.root_url}/fr/"
+
+    @property
+    def pcpartpicker_url(self):
+        """Valeur de GAMECONFIG_PCPP_BASE_URL"""
+        return f"{self.root_url}/pcpp/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sites de substitution (Instant Gaming, PCPartPicker)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Délai ajouté à chaque réponse (secondes)")
+    args = parser.parse_args()
+
+    sites = StandinSites(port=args.port, latency=args.latency)
+    print(f"GAMECONFIG_IG_BASE_URL={sites.instant_gaming_url}")
+    print(f"GAMECONFIG_PCPP_BASE_URL={sites.pcpartpicker_url}")
+    try:
+        sites.server.serve_forever()
+    except KeyboardInterrupt:
+        sites.stop()
@@ -0,0 +1,150 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+
+PROJECT_ROOT = Path(__file__).parent.parent
+APP_PATH = os.path.join(PROJECT_ROOT, "ui", "app.py")
+
+# Budget de temps (en secondes) pour le premier rendu de la page d'accueil, imports compris
+DEFAULT_RENDER_BUDGET = 3.0
+
+# Modules qui ne doivent jamais être chargés par un simple affichage de page
+HEAVY_MODULES = ["selenium", "webdriver_manager", "scrapers.instant_gaming", "scrapers.pcpartpicker"]
+
+# Modules mesurés individuellement dans le rapport
+REPORTED_MODULES = ["streamlit", "pandas", "selenium", "webdriver_manager", "scrapers.instant_gaming", "scrapers.pcpartpicker"]
+
+# Script exécuté dans un interpréteur neuf pour mesurer un démarrage à froid
+_RENDER_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app_path!r}, default_timeout=60)
+at.run()
+elapsed = time.perf_counter() - t0
+print(json.dumps({{
+    "elapsed": elapsed,
+    "exceptions": [e.message for e in at.exception],
+    "heavy_loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+def parse_importtime(stderr_text):
+    """
+    Analyse la sortie de `python -X importtime`
+
+    Args:
+        stderr_text (str): Sortie d'erreur de l'interpréteur
+
+    Returns:
+        dict: Temps cumulé en secondes par module de premier niveau d'import
+    """
+    timings = {}
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative_us = int(cumulative.strip())
+        except ValueError:
+            # Ligne d'en-tête ("self [us] | cumulative | imported package")
+            continue
+        # Les imports imbriqués sont indentés : on ne garde que ceux déclenchés directement
+        if name.startswith("  "):
+            continue
+        timings[name.strip()] = cumulative_us / 1_000_000
+    return timings
+
+def measure_import_times(modules=REPORTED_MODULES):
+    """
+    Mesure le temps d'import à froid de chaque module, chacun dans un interpréteur neuf
+
+    Returns:
+        dict: Temps en secondes par module (None si l'import échoue)
+    """
+    results = {}
+    for module in modules:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            results[module] = None
+            continue
+        results[module] = parse_importtime(proc.stderr).get(module)
+    return results
+
+def measure_first_render(top_n=10):
+    """
+    Rend la page d'accueil une fois dans un interpréteur neuf avec le testeur de Streamlit
+
+    Returns:
+        dict: Durée du rendu, exceptions levées, modules lourds chargés et imports les plus coûteux
+    """
+    script = _RENDER_SCRIPT.format(app_path=APP_PATH, heavy=HEAVY_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Échec du rendu de la page d'accueil:\n{proc.stderr[-2000:]}")
+
+    report = json.loads(proc.stdout.strip().splitlines()[-1])
+    timings = parse_importtime(proc.stderr)
+    report["top_imports"] = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:top_n]
+    return report
+
+def check_startup(budget=DEFAULT_RENDER_BUDGET):
+    """
+    Vérifie que le premier rendu respecte le budget et ne charge pas les scrapers
+
+    Returns:
+        bool: True si aucune régression n'est détectée
+    """
+    report = measure_first_render()
+
+    debug_print(f"Premier rendu de la page d'accueil: {report['elapsed']:.2f}s (budget: {budget:.2f}s)", level="info")
+    debug_print("Imports les plus coûteux:", level="info")
+    for name, seconds in report["top_imports"]:
+        debug_print(f"  {seconds * 1000:8.1f} ms  {name}", level="debug")
+
+    ok = True
+    if report["exceptions"]:
+        debug_print(f"Exceptions pendant le rendu: {report['exceptions']}", level="error")
+        ok = False
+    if report["heavy_loaded"]:
+        debug_print(f"Modules lourds chargés au rendu: {', '.join(report['heavy_loaded'])}", level="error")
+        ok = False
+    if report["elapsed"] > budget:
+        debug_print(f"Budget de rendu dépassé de {report['elapsed'] - budget:.2f}s", level="error")
+        ok = False
+
+    if ok:
+        debug_print("Démarrage à froid conforme au budget", level="success")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="Rapport de temps de démarrage de l'application Streamlit")
+    parser.add_argument("--budget", type=float, default=float(os.environ.get("GAMECONFIG_RENDER_BUDGET", DEFAULT_RENDER_BUDGET)),
+                        help="Budget en secondes pour le premier rendu")
+    parser.add_argument("--imports-only", action="store_true", help="Affiche seulement les temps d'import par module")
+    args = parser.parse_args()
+
+    debug_print("Temps d'import à froid par module:", level="info")
+    for module, seconds in measure_import_times().items():
+        if seconds is None:
+            debug_print(f"  {'échec':>11}  {module}", level="warning")
+        else:
+            debug_print(f"  {seconds * 1000:8.1f} ms  {module}", level="debug")
+
+    if not args.imports_only:
+        sys.exit(0 if check_startup(args.budget) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+import abc
+import glob
+import json
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.debug_color import debug_print
+from utils.prices import parse_price
+from utils.atomic_io import atomic_write_json
+
+# Racine des données : data/ du projet, ou GAMECONFIG_DATA_DIR
+DATA_DIR = os.environ.get("GAMECONFIG_DATA_DIR", os.path.join(Path(__file__).parent.parent, "data"))
+SQLITE_PATH = os.path.join(DATA_DIR, "gameconfig.db")
+
+# Backend utilisé par l'application : 'json' (fichiers, par défaut) ou 'sqlite'
+STORAGE_BACKEND = os.environ.get("GAMECONFIG_STORAGE", "json")
+
+REQUIREMENT_TIERS = ("minimal", "recommended")
+
+def configuration_id(path):
+    """Identifiant d'une configuration : nom de son fichier JSON sans extension"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+class StorageBackend(abc.ABC):
+    """Interface commune des backends de persistance des jeux et configurations"""
+
+    @abc.abstractmethod
+    def save_game(self, data):
+        """Enregistre les spécifications d'un jeu (dict produit par InstantGaming, avec 'uuid')"""
+
+    def save_games(self, records):
+        """Enregistre plusieurs jeux"""
+        for data in records:
+            self.save_game(data)
+
+    @abc.abstractmethod
+    def get_game(self, game_uuid):
+        """Retourne les spécifications d'un jeu, ou None"""
+
+    @abc.abstractmethod
+    def list_games(self):
+        """Liste les jeux enregistrés (uuid, game)"""
+
+    @abc.abstractmethod
+    def save_configuration(self, config_id, data):
+        """Enregistre une configuration (dict produit par PCConfiguration.save_to_json)"""
+
+    def save_configurations(self, records):
+        """Enregistre plusieurs configurations, données sous forme de couples (id, data)"""
+        for config_id, data in records:
+            self.save_configuration(config_id, data)
+
+    @abc.abstractmethod
+    def get_configuration(self, config_id):
+        """Retourne une configuration, ou None"""
+
+    @abc.abstractmethod
+    def list_configurations(self, game_uuid=None):
+        """Liste les configurations enregistrées sous forme de couples (id, data)"""
+
+class JsonFileStorage(StorageBackend):
+    """Backend historique : un fichier JSON par jeu et par configuration dans data/"""
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.games_dir = os.path.join(data_dir, "instantgaming")
+        self.configs_dir = os.path.join(data_dir, "pcpartpicker")
+
+    def _read(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write(self, path, data, indent):
+        atomic_write_json(path, data, indent=indent)
+
+    def save_game(self, data):
+        game_name = data["game"].replace(":", "").replace(" ", "_").replace("/", "_").lower()
+        self._write(os.path.join(self.games_dir, f"{game_name}_{data['uuid']}.json"), data, indent=4)
+        return data["uuid"]
+
+    def get_game(self, game_uuid):
+        for path in glob.glob(os.path.join(self.games_dir, f"*_{game_uuid}.json")):
+            return self._read(path)
+        return None
+
+    def list_games(self):
+        games = []
+        for path in glob.glob(os.path.join(self.games_dir, "*.json")):
+            try:
+                data = self._read(path)
+                games.append({"uuid": data.get("uuid"), "game": data.get("game")})
+            except Exception as e:
+                debug_print(f"Erreur lors du chargement de {path}: {e}", level="warning")
+        return games
+
+    def save_configuration(self, config_id, data):
+        self._write(os.path.join(self.configs_dir, f"{config_id}.json"), data, indent=2)
+        return config_id
+
+    def get_configuration(self, config_id):
+        path = os.path.join(self.configs_dir, f"{config_id}.json")
+        return self._read(path) if os.path.exists(path) else None
+
+    def list_configurations(self, game_uuid=None):
+        configs = []
+        for path in glob.glob(os.path.join(self.configs_dir, "*.json")):
+            try:
+                data = self._read(path)
+            except Exception as e:
+                debug_print(f"Erreur lors du chargement de {path}: {e}", level="warning")
+                continue
+            if game_uuid is None or data.get("game_uuid") == game_uuid:
+                configs.append((configuration_id(path), data))
+        return configs
+
+class SQLiteStorage(StorageBackend):
+    """Backend SQLite en mode WAL : lectures concurrentes pendant les écritures, insertions groupées en transaction"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS games (
+            uuid TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            image_url TEXT,
+            price TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_games_name ON games (name);
+
+        CREATE TABLE IF NOT EXISTS requirement_sets (
+            game_uuid TEXT NOT NULL REFERENCES games (uuid) ON DELETE CASCADE,
+            tier TEXT NOT NULL,
+            field TEXT NOT NULL,
+            option_index INTEGER NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (game_uuid, tier, field, option_index)
+        );
+        CREATE INDEX IF NOT EXISTS idx_requirements_value ON requirement_sets (field, value);
+
+        CREATE TABLE IF NOT EXISTS configurations (
+            id TEXT PRIMARY KEY,
+            game_uuid TEXT,
+            name TEXT NOT NULL,
+            game_name TEXT,
+            is_recommended INTEGER,
+            created_at TEXT,
+            total_price REAL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_configurations_game ON configurations (game_uuid);
+
+        CREATE TABLE IF NOT EXISTS components (
+            configuration_id TEXT NOT NULL REFERENCES configurations (id) ON DELETE CASCADE,
+            category TEXT NOT NULL,
+            is_alternative INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            price REAL,
+            merchant TEXT,
+            link TEXT,
+            PRIMARY KEY (configuration_id, category, is_alternative, position)
+        );
+        CREATE INDEX IF NOT EXISTS idx_components_name ON components (category, name);
+        CREATE INDEX IF NOT EXISTS idx_components_link ON components (link);
+    """
+
+    def __init__(self, db_path=SQLITE_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn().executescript(self.SCHEMA)
+
+    def _conn(self):
+        # Une connexion par thread (les sessions Streamlit s'exécutent dans des threads différents)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA busy_timeout = 30000")
+            self._local.conn = conn
+        return conn
+
+    def _insert_game(self, conn, data):
+        game_uuid = data["uuid"]
+        conn.execute(
+            "INSERT OR REPLACE INTO games (uuid, name, image_url, price, data) VALUES (?, ?, ?, ?, ?)",
+            (game_uuid, data.get("game", ""), data.get("image_url", ""), data.get("price", ""),
+             json.dumps(data, ensure_ascii=False))
+        )
+        conn.execute("DELETE FROM requirement_sets WHERE game_uuid = ?", (game_uuid,))
+        rows = []
+        for tier in REQUIREMENT_TIERS:
+            for field, value in data.get(tier, {}).items():
+                # Les champs à alternatives sont stockés sous forme {"1": ..., "2": ...}
+                options = list(value.values()) if isinstance(value, dict) else [value]
+                rows.extend((game_uuid, tier, field, i, str(option)) for i, option in enumerate(options, 1))
+        conn.executemany(
+            "INSERT INTO requirement_sets (game_uuid, tier, field, option_index, value) VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+        return game_uuid
+
+    def _insert_configuration(self, conn, config_id, data):
+        conn.execute("DELETE FROM components WHERE configuration_id = ?", (config_id,))
+        conn.execute(
+            """INSERT OR REPLACE INTO configurations
+               (id, game_uuid, name, game_name, is_recommended, created_at, total_price, data)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            (config_id, data.get("game_uuid"), data.get("name", ""), data.get("game_name"),
+             None if data.get("is_recommended") is None else int(data["is_recommended"]),
+             data.get("created_at"), parse_price(data.get("total_price")),
+             json.dumps(data, ensure_ascii=False))
+        )
+        rows = []
+        for category, component in data.get("components", {}).items():
+            rows.append((config_id, category, 0, 0, component))
+        for category, alternatives in data.get("alternative_components", {}).items():
+            rows.extend((config_id, category, 1, i, component) for i, component in enumerate(alternatives))
+        conn.executemany(
+            """INSERT INTO components (configuration_id, category, is_alternative, position, name, price, merchant, link)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            [(cid, category, alt, position, c.get("name", ""), parse_price(c.get("price")), c.get("merchant"), c.get("link"))
+             for cid, category, alt, position, c in rows]
+        )
+        return config_id
+
+    def save_game(self, data):
+        conn = self._conn()
+        with conn:
+            return self._insert_game(conn, data)
+
+    def save_games(self, records):
+        # Une seule transaction pour tout le lot
+        conn = self._conn()
+        with conn:
+            return [self._insert_game(conn, data) for data in records]
+
+    def get_game(self, game_uuid):
+        row = self._conn().execute("SELECT data FROM games WHERE uuid = ?", (game_uuid,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list_games(self):
+        rows = self._conn().execute("SELECT uuid, name FROM games ORDER BY name").fetchall()
+        return [{"uuid": game_uuid, "game": name} for game_uuid, name in rows]
+
+    def save_configuration(self, config_id, data):
+        conn = self._conn()
+        with conn:
+            return self._insert_configuration(conn, config_id, data)
+
+    def save_configurations(self, records):
+        conn = self._conn()
+        with conn:
+            return [self._insert_configuration(conn, config_id, data) for config_id, data in records]
+
+    def get_configuration(self, config_id):
+        row = self._conn().execute("SELECT data FROM configurations WHERE id = ?", (config_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list_configurations(self, game_uuid=None):
+        sql = "SELECT id, data FROM configurations"
+        params = ()
+        if game_uuid is not None:
+            sql += " WHERE game_uuid = ?"
+            params = (game_uuid,)
+        rows = self._conn().execute(sql + " ORDER BY created_at DESC", params).fetchall()
+        return [(config_id, json.loads(data)) for config_id, data in rows]
+
+    def find_configurations_with_component(self, name_fragment, category=None):
+        """Identifiants des configurations utilisant un composant dont le nom contient le texte donné"""
+        sql = "SELECT DISTINCT configuration_id FROM components WHERE name LIKE ?"
+        params = [f"%{name_fragment}%"]
+        if category:
+            sql += " AND category = ?"
+            params.append(category)
+        return [row[0] for row in self._conn().execute(sql, params).fetchall()]
+
+_storage = None
+_storage_lock = threading.Lock()
+
+def get_storage():
+    """Retourne le backend configuré par GAMECONFIG_STORAGE (instance partagée par le processus)"""
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            _storage = SQLiteStorage() if STORAGE_BACKEND == "sqlite" else JsonFileStorage()
+        return _storage
+
+def mirror_game(data):
+    """Reporte un jeu tout juste écrit en JSON dans le backend configuré, s'il n'est pas le backend fichier"""
+    storage = get_storage()
+    if isinstance(storage, JsonFileStorage):
+        return
+    try:
+        storage.save_game(data)
+    except Exception as e:
+        debug_print(f"Impossible d'enregistrer le jeu dans le stockage {STORAGE_BACKEND}: {e}", level="warning")
+
+def mirror_configuration(path, data):
+    """Reporte une configuration tout juste écrite en JSON dans le backend configuré"""
+    storage = get_storage()
+    if isinstance(storage, JsonFileStorage):
+        return
+    try:
+        storage.save_configuration(configuration_id(path), data)
+    except Exception as e:
+        debug_print(f"Impossible d'enregistrer la configuration dans le stockage {STORAGE_BACKEND}: {e}", level="warning")
+
+def import_json_files(storage, data_dir=DATA_DIR, batch_size=500):
+    """
+    Importe en une passe les fichiers JSON existants dans un backend
+
+    Args:
+        storage (StorageBackend): Backend de destination (ex: SQLiteStorage)
+        data_dir (str): Dossier data/ contenant instantgaming/ et pcpartpicker/
+        batch_size (int): Nombre d'enregistrements par transaction
+
+    Returns:
+        dict: Nombre de jeux et de configurations importés
+    """
+    source = JsonFileStorage(data_dir)
+    counts = {"games": 0, "configurations": 0}
+
+    batch = []
+    for path in sorted(glob.glob(os.path.join(source.games_dir, "*.json"))):
+        try:
+            data = source._read(path)
+        except Exception as e:
+            debug_print(f"Fichier ignoré {path}: {e}", level="warning")
+            continue
+        if "uuid" not in data or "game" not in data:
+            continue
+        batch.append(data)
+        if len(batch) >= batch_size:
+            storage.save_games(batch)
+            counts["games"] += len(batch)
+            batch = []
+    if batch:
+        storage.save_games(batch)
+        counts["games"] += len(batch)
+
+    batch = []
+    for config_id, data in source.list_configurations():
+        batch.append((config_id, data))
+        if len(batch) >= batch_size:
+            storage.save_configurations(batch)
+            counts["configurations"] += len(batch)
+            batch = []
+    if batch:
+        storage.save_configurations(batch)
+        counts["configurations"] += len(batch)
+
+    debug_print(f"Import terminé: {counts['games']} jeux, {counts['configurations']} configurations", level="success")
+    return counts
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Importe les fichiers JSON de data/ dans la base SQLite")
+    parser.add_argument("--db", default=SQLITE_PATH, help="Chemin de la base SQLite de destination")
+    args = parser.parse_args()
+
+    import_json_files(SQLiteStorage(args.db))
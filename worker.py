@@ -0,0 +1,119 @@
+import argparse
+import os
+import socket
+import threading
+import time
+import uuid
+
+from utils.job_queue import JobQueue
+from utils.debug_color import debug_print
+
+# Délai entre deux interrogations de la file lorsqu'elle est vide
+POLL_INTERVAL = 5
+
+# Identifiant unique du worker : machine, processus et suffixe aléatoire
+def make_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# Exécute une tâche de génération de configuration
+def run_job(payload):
+    # Import différé : selenium n'est chargé que par les processus qui scrapent réellement
+    from scrapers.pipeline import run_pipeline
+
+    return run_pipeline(
+        payload["game_name"],
+        use_recommended=payload.get("config_type", "rec") == "rec",
+        both_profiles=payload.get("config_type") == "both",
+        include_alternatives=payload.get("include_alternatives", False),
+        headless=payload.get("headless", True),
+        profile=payload.get("profile"),
+    )
+
+# Renouvelle périodiquement le bail d'une tâche tant qu'elle s'exécute
+def _keep_lease_alive(queue, job_id, worker_id, stop_event):
+    interval = max(1, queue.lease_seconds / 3)
+    while not stop_event.wait(interval):
+        if not queue.heartbeat(job_id, worker_id):
+            debug_print(f"Bail perdu pour la tâche {job_id}", level="warning")
+            return
+
+# Boucle principale du worker
+def run_worker(queue, worker_id, poll_interval=POLL_INTERVAL, max_jobs=None):
+    debug_print(f"Worker {worker_id} démarré (file: {queue.db_path})", level="info")
+    processed = 0
+
+    while max_jobs is None or processed < max_jobs:
+        job = queue.lease(worker_id)
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+
+        payload = job["payload"]
+        debug_print(f"Tâche {job['id']} (tentative {job['attempts']}): {payload}", level="fetch")
+
+        stop_event = threading.Event()
+        heartbeat = threading.Thread(
+            target=_keep_lease_alive, args=(queue, job["id"], worker_id, stop_event), daemon=True
+        )
+        heartbeat.start()
+
+        try:
+            result = run_job(payload)
+            queue.complete(job["id"], worker_id, result)
+            debug_print(f"Tâche {job['id']} terminée: {result['config_json']}", level="success")
+        except Exception as e:
+            queue.fail(job["id"], worker_id, e)
+            debug_print(f"Tâche {job['id']} en échec: {e}", level="error")
+        finally:
+            stop_event.set()
+            heartbeat.join()
+
+        processed += 1
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker de génération de configurations GameConfig")
+    parser.add_argument("--db", default=None, help="Chemin de la file SQLite partagée")
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="Traite les tâches de la file (par défaut)")
+    run_parser.add_argument("--poll-interval", type=float, default=POLL_INTERVAL)
+    run_parser.add_argument("--max-jobs", type=int, default=None)
+
+    enqueue_parser = subparsers.add_parser("enqueue", help="Ajoute une tâche à la file")
+    enqueue_parser.add_argument("game_name")
+    enqueue_parser.add_argument("--type", choices=["min", "rec", "both"], default="rec")
+    enqueue_parser.add_argument("--alternatives", action="store_true")
+    enqueue_parser.add_argument("--show-browser", action="store_true")
+    enqueue_parser.add_argument("--profile", action="store_true", help="Enregistre un profil cProfile de la génération")
+
+    subparsers.add_parser("status", help="Affiche le nombre de tâches par statut")
+
+    args = parser.parse_args()
+    queue = JobQueue(args.db) if args.db else JobQueue()
+
+    if args.command == "enqueue":
+        job_id = queue.enqueue({
+            "game_name": args.game_name,
+            "config_type": args.type,
+            "include_alternatives": args.alternatives,
+            "headless": not args.show_browser,
+            "profile": args.profile or None,
+        })
+        print(f"Tâche ajoutée: {job_id}")
+    elif args.command == "status":
+        for status, count in sorted(queue.stats().items()):
+            print(f"{status}: {count}")
+    else:
+        try:
+            run_worker(
+                queue,
+                make_worker_id(),
+                poll_interval=getattr(args, "poll_interval", POLL_INTERVAL),
+                max_jobs=getattr(args, "max_jobs", None),
+            )
+        except KeyboardInterrupt:
+            # La tâche en cours sera reprise par un autre worker à l'expiration du bail
+            debug_print("Arrêt du worker.", level="info")
+
+if __name__ == "__main__":
+    main()